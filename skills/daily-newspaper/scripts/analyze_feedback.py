@@ -4,6 +4,12 @@
 Reads memory/feedback.jsonl, computes per-section averages and overall rating,
 then writes adjustments to memory/learned-preferences.yaml so the next newspaper
 render reflects user preferences.
+
+Rating sums and counts are kept per day in memory/feedback-aggregates.json
+together with a byte offset into feedback.jsonl, so each run only parses the
+feedback appended since the previous one (see FeedbackAggregates). The file
+is a local, gitignored cache: its checkpoint is tied to feedback.jsonl's
+inode, so a fresh checkout simply rebuilds it in one pass.
 """
 
 import concurrent.futures
@@ -11,8 +17,7 @@ import hashlib
 import json
 import os
 import sys
-from collections import defaultdict
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 
 try:
     import yaml
@@ -24,6 +29,7 @@ SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 PROJECT_ROOT = os.path.abspath(os.path.join(SCRIPT_DIR, "..", "..", ".."))
 FEEDBACK_FILE = os.path.join(PROJECT_ROOT, "memory", "feedback.jsonl")
 PREFS_FILE = os.path.join(PROJECT_ROOT, "memory", "learned-preferences.yaml")
+AGGREGATES_FILE = os.path.join(PROJECT_ROOT, "memory", "feedback-aggregates.json")
 
 # Items shown per section: 2-7, scaled by ratings (see determine_item_counts)
 DEFAULT_ITEM_COUNT = 3
@@ -42,39 +48,168 @@ ALL_SECTIONS = ["news", "jobs", "events"]
 
 
 FEEDBACK_WINDOW_DAYS = 30
+RECENT_COMMENTS = 10
 
 
-def load_feedback():
-    """Load feedback entries from the last FEEDBACK_WINDOW_DAYS days."""
-    entries = []
-    if not os.path.exists(FEEDBACK_FILE):
-        return entries
-    cutoff = datetime.now(timezone.utc).replace(
-        hour=0, minute=0, second=0, microsecond=0
-    )
-    from datetime import timedelta
-    cutoff = cutoff - timedelta(days=FEEDBACK_WINDOW_DAYS)
-    with open(FEEDBACK_FILE, "r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
+def _entry_day(entry):
+    """UTC day ("YYYY-MM-DD") of an entry's timestamp; "" when it has none."""
+    ts = entry.get("timestamp", "")
+    if not ts or not isinstance(ts, str):
+        return ""
+    try:
+        entry_dt = datetime.fromisoformat(ts)
+    except ValueError:
+        return ""
+    if entry_dt.tzinfo is None:
+        entry_dt = entry_dt.replace(tzinfo=timezone.utc)
+    return entry_dt.astimezone(timezone.utc).date().isoformat()
+
+
+def _empty_stats():
+    return {"entries": 0, "rating": [0, 0], "sections": {}}
+
+
+def _merge(stats, other, sign):
+    """Add (sign=1) or subtract (sign=-1) the sums and counts of `other` into `stats`."""
+    stats["entries"] += sign * other["entries"]
+    stats["rating"][0] += sign * other["rating"][0]
+    stats["rating"][1] += sign * other["rating"][1]
+    for section, (total, count) in other["sections"].items():
+        acc = stats["sections"].setdefault(section, [0, 0])
+        acc[0] += sign * total
+        acc[1] += sign * count
+        if acc[1] <= 0:
+            del stats["sections"][section]
+
+
+class FeedbackAggregates:
+    """Running rating sums for the feedback window, checkpointed into feedback.jsonl.
+
+    Entries are bucketed by UTC day. `totals` holds the sums over every live
+    bucket; buckets that fall out of the window are subtracted from it and
+    dropped, and each run only parses the lines appended after `offset`.
+    Entries without a timestamp go into the "" bucket, which never expires.
+    """
+
+    def __init__(self, feedback_path=FEEDBACK_FILE, path=AGGREGATES_FILE):
+        self.feedback_path = feedback_path
+        self.path = path
+        self._reset()
+        self._load()
+
+    def _reset(self, inode=None):
+        self.inode = inode
+        self.offset = 0
+        self.totals = _empty_stats()
+        self.days = {}  # day -> stats + "comments": [[offset, date, comment], ...]
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (json.JSONDecodeError, OSError):
+            return
+        if not isinstance(data, dict) or data.get("window") != FEEDBACK_WINDOW_DAYS:
+            return  # a different window needs buckets we already dropped
+        try:
+            self.inode = data["inode"]
+            self.offset = int(data["offset"])
+            self.totals = data["totals"]
+            self.days = data["days"]
+        except (KeyError, TypeError, ValueError):
+            self._reset()
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp = self.path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"window": FEEDBACK_WINDOW_DAYS, "inode": self.inode, "offset": self.offset,
+                       "totals": self.totals, "days": self.days}, f, separators=(",", ":"))
+        os.replace(tmp, self.path)
+
+    def _add(self, entry, offset, day):
+        bucket = self.days.get(day)
+        if bucket is None:
+            bucket = self.days[day] = dict(_empty_stats(), comments=[])
+        stats = _empty_stats()
+        stats["entries"] = 1
+        rating = entry.get("rating")
+        if rating is not None:
             try:
-                entry = json.loads(line)
-                ts = entry.get("timestamp", "")
-                if ts:
-                    try:
-                        entry_dt = datetime.fromisoformat(ts)
-                        if entry_dt.tzinfo is None:
-                            entry_dt = entry_dt.replace(tzinfo=timezone.utc)
-                        if entry_dt < cutoff:
-                            continue
-                    except ValueError:
-                        pass
-                entries.append(entry)
-            except json.JSONDecodeError:
-                continue
-    return entries
+                stats["rating"] = [float(rating), 1]
+            except (TypeError, ValueError):
+                pass
+        section_ratings = entry.get("section_ratings")
+        if isinstance(section_ratings, dict):
+            for section, value in section_ratings.items():
+                if value is None:
+                    continue
+                try:
+                    stats["sections"][section] = [float(value), 1]
+                except (TypeError, ValueError):
+                    continue
+        _merge(bucket, stats, 1)
+        _merge(self.totals, stats, 1)
+        comment = entry.get("comment", "")
+        if isinstance(comment, str) and comment.strip():
+            bucket["comments"].append([offset, entry.get("date", ""), comment.strip()])
+
+    def expire(self, now=None):
+        """Subtract and drop the day buckets older than the feedback window."""
+        now = now or datetime.now(timezone.utc)
+        cutoff = (now.astimezone(timezone.utc).date() - timedelta(days=FEEDBACK_WINDOW_DAYS)).isoformat()
+        for day in [d for d in self.days if d and d < cutoff]:
+            _merge(self.totals, self.days.pop(day), -1)
+        return cutoff
+
+    def update(self, now=None):
+        """Fold in the lines appended since the checkpoint; returns how many were new."""
+        cutoff = self.expire(now)
+        if not os.path.exists(self.feedback_path):
+            self._reset()
+            return 0
+        st = os.stat(self.feedback_path)
+        if st.st_ino != self.inode or st.st_size < self.offset:
+            self._reset(st.st_ino)  # replaced or truncated: rebuild from the start
+        added = 0
+        with open(self.feedback_path, "rb") as f:
+            f.seek(self.offset)
+            for raw in f:
+                offset = self.offset
+                try:
+                    entry = json.loads(raw) if raw.strip() else None
+                except ValueError:
+                    entry = None
+                    if not raw.endswith(b"\n"):
+                        break  # a write still in progress; re-read it next run
+                self.offset += len(raw)
+                if not isinstance(entry, dict):
+                    continue
+                day = _entry_day(entry)
+                if day and day < cutoff:
+                    continue
+                self._add(entry, offset, day)
+                added += 1
+        return added
+
+    @property
+    def count(self):
+        return self.totals["entries"]
+
+    def averages(self):
+        """(overall average, {section: average}) over the window."""
+        total, count = self.totals["rating"]
+        overall_avg = round(total / count, 2) if count else None
+        section_avgs = {section: round(total / count, 2)
+                        for section, (total, count) in self.totals["sections"].items() if count}
+        return overall_avg, section_avgs
+
+    def recent_comments(self, limit=RECENT_COMMENTS):
+        """The newest `limit` written comments in the window, oldest first."""
+        comments = sorted(c for bucket in self.days.values() for c in bucket["comments"])
+        return [{"date": date, "comment": comment} for _, date, comment in comments[-limit:]]
 
 
 def load_prefs():
@@ -170,30 +305,6 @@ Rules:
     return None
 
 
-def compute_averages(entries):
-    """Compute per-section and overall averages from feedback entries."""
-    section_totals = defaultdict(list)
-    overall_ratings = []
-
-    for entry in entries:
-        rating = entry.get("rating")
-        if rating is not None:
-            overall_ratings.append(float(rating))
-
-        section_ratings = entry.get("section_ratings", {})
-        for section, value in section_ratings.items():
-            if value is not None:
-                section_totals[section].append(float(value))
-
-    section_avgs = {}
-    for section, values in section_totals.items():
-        section_avgs[section] = round(sum(values) / len(values), 2)
-
-    overall_avg = round(sum(overall_ratings) / len(overall_ratings), 2) if overall_ratings else None
-
-    return overall_avg, section_avgs
-
-
 def determine_item_counts(section_avgs, overall_avg=None):
     """Determine per-section item counts based on average ratings.
 
@@ -233,7 +344,7 @@ def determine_section_preferences(section_avgs):
     return sorted(preferred), sorted(skipped)
 
 
-def update_preferences(entries, overall_avg, section_avgs):
+def update_preferences(recent_comments, feedback_count, overall_avg, section_avgs):
     """Update learned-preferences.yaml with computed values."""
     prefs = load_prefs()
 
@@ -249,13 +360,8 @@ def update_preferences(entries, overall_avg, section_avgs):
     cp.setdefault("preferred_sources", [])
     cp.setdefault("ignored_sources", [])
 
-    # Collect recent written feedback so it is considered going forward
-    recent_comments = [
-        {"date": e.get("date", ""), "comment": e.get("comment", "").strip()}
-        for e in entries
-        if e.get("comment", "").strip()
-    ]
-    cp["recent_comments"] = recent_comments[-10:]
+    # Keep recent written feedback so it is considered going forward
+    cp["recent_comments"] = recent_comments[-RECENT_COMMENTS:]
 
     # Distill comments into topic/source preferences via Gemini. The hash
     # skips the API call when the comment window hasn't changed since the
@@ -290,7 +396,7 @@ def update_preferences(entries, overall_avg, section_avgs):
     # Update feedback stats
     if overall_avg is not None:
         prefs["overall_avg_rating"] = overall_avg
-    prefs["total_feedback_count"] = len(entries)
+    prefs["total_feedback_count"] = feedback_count
     prefs["last_updated"] = datetime.now(timezone.utc).isoformat()
 
     # Write back
@@ -302,21 +408,26 @@ def update_preferences(entries, overall_avg, section_avgs):
 
 
 def main():
-    entries = load_feedback()
+    aggregates = FeedbackAggregates()
+    new_entries = aggregates.update()
+    try:
+        aggregates.save()
+    except OSError as e:
+        print(f"WARNING: could not save feedback checkpoint {aggregates.path}: {e}", file=sys.stderr)
 
-    if not entries:
+    if not aggregates.count:
         print("No feedback entries found. Nothing to analyze.")
         return
 
-    overall_avg, section_avgs = compute_averages(entries)
+    overall_avg, section_avgs = aggregates.averages()
 
-    print(f"Analyzing {len(entries)} feedback entries...")
+    print(f"Analyzing {aggregates.count} feedback entries ({new_entries} new since last run)...")
     if overall_avg is not None:
         print(f"  Overall average rating: {overall_avg}/5")
     for section, avg in sorted(section_avgs.items()):
         print(f"  {section}: {avg}/5")
 
-    prefs = update_preferences(entries, overall_avg, section_avgs)
+    prefs = update_preferences(aggregates.recent_comments(), aggregates.count, overall_avg, section_avgs)
 
     item_counts = prefs.get("reading_patterns", {}).get("section_item_counts", {})
     print(f"\nUpdated {PREFS_FILE}")
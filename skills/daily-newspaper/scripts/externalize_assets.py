@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""Move inline CSS, JS and base64 images out of editions into shared assets.
+
+Each edition in output/daily/ used to be fully self-contained, so the same
+stylesheet and feedback script were stored once per day, and embedded images
+were stored base64-inflated. This rewrites an edition so that:
+
+- every inline <style> / <script> block of at least MIN_ASSET_BYTES becomes a
+  <link rel="stylesheet"> / <script src> pointing into output/assets/;
+- every `data:image/...;base64,` URI becomes a binary image file there.
+
+Asset files are named by a hash of their content, so identical blobs from
+different days are stored once and a file never changes once written (safe to
+cache forever). Rewriting is idempotent: an already-externalized edition is
+left untouched.
+
+Usage:
+    python3 externalize_assets.py                      # every output/daily/*.html
+    python3 externalize_assets.py output/daily/2026-04-18.html
+"""
+
+import argparse
+import base64
+import binascii
+import glob
+import hashlib
+import os
+import re
+import sys
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.abspath(os.path.join(SCRIPT_DIR, "..", "..", ".."))
+
+ASSETS_DIR = os.path.join(PROJECT_ROOT, "output", "assets")
+DAILY_DIR = os.path.join(PROJECT_ROOT, "output", "daily")
+
+MIN_ASSET_BYTES = 1024  # smaller blocks stay inline; a request costs more
+HASH_CHARS = 16
+
+IMAGE_EXTENSIONS = {
+    "png": "png", "jpeg": "jpg", "jpg": "jpg", "gif": "gif",
+    "webp": "webp", "svg+xml": "svg", "avif": "avif",
+}
+
+STYLE_RE = re.compile(r"<style(?P<attrs>[^>]*)>(?P<body>.*?)</style>", re.S | re.I)
+SCRIPT_RE = re.compile(r"<script(?P<attrs>[^>]*)>(?P<body>.*?)</script>", re.S | re.I)
+DATA_URI_RE = re.compile(r"data:image/(?P<type>[a-z0-9.+-]+);base64,(?P<data>[A-Za-z0-9+/=]+)", re.I)
+TYPE_ATTR_RE = re.compile(r"""\s+type\s*=\s*["']?[^"'\s>]*["']?""", re.I)
+JS_TYPE_RE = re.compile(r"""type\s*=\s*["']?(?:text/javascript|application/javascript|module)["']?""", re.I)
+
+# Older editions baked their date into the feedback script as a string
+# literal, which made that script unique per day. The literal is replaced by
+# a read of <html data-date>, so the script body is identical across editions
+# and deduplicates like the rest.
+DATE_EXPR = "document.documentElement.getAttribute('data-date')"
+EDITION_DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+HTML_TAG_RE = re.compile(r"<html(?P<attrs>[^>]*)>", re.I)
+
+
+def content_name(data, ext):
+    """Content-addressed file name for `data` (bytes)."""
+    return f"{hashlib.sha256(data).hexdigest()[:HASH_CHARS]}.{ext}"
+
+
+class AssetWriter:
+    """Writes content-addressed assets into `assets_dir`, once per distinct blob."""
+
+    def __init__(self, assets_dir=ASSETS_DIR):
+        self.assets_dir = assets_dir
+        self.written = []   # paths created by this writer
+        self.reused = 0     # blobs that already existed
+
+    def put(self, data, ext):
+        """Store `data` and return its file name."""
+        name = content_name(data, ext)
+        path = os.path.join(self.assets_dir, name)
+        if os.path.exists(path):
+            self.reused += 1
+            return name
+        os.makedirs(self.assets_dir, exist_ok=True)
+        tmp = path + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+        self.written.append(path)
+        return name
+
+
+def _externalize_images(text, writer, prefix):
+    """Replace base64 image data URIs with `prefix` + asset file name."""
+    def repl(m):
+        ext = IMAGE_EXTENSIONS.get(m.group("type").lower())
+        if ext is None:
+            return m.group(0)
+        try:
+            data = base64.b64decode(m.group("data"), validate=True)
+        except (binascii.Error, ValueError):
+            return m.group(0)
+        return prefix + writer.put(data, ext)
+    return DATA_URI_RE.sub(repl, text)
+
+
+def _set_edition_date(html, edition_date):
+    """Add data-date="<edition_date>" to the <html> tag if it is missing."""
+    tag = HTML_TAG_RE.search(html)
+    if tag is None or "data-date" in tag.group("attrs"):
+        return html
+    return (html[:tag.start()] + f'<html{tag.group("attrs")} data-date="{edition_date}">'
+            + html[tag.end():])
+
+
+def externalize_html(html, html_dir, writer, edition_date=None):
+    """Return `html` with large inline blocks and data-URI images moved to assets.
+
+    With `edition_date` (YYYY-MM-DD), that date's string literals in scripts
+    are replaced by a read of <html data-date>.
+    """
+    href_prefix = os.path.relpath(writer.assets_dir, html_dir).replace(os.sep, "/") + "/"
+    lifted = False
+
+    def style_repl(m):
+        body = m.group("body")
+        if len(body.encode("utf-8")) < MIN_ASSET_BYTES:
+            return m.group(0)
+        # Images referenced from the stylesheet resolve relative to the asset itself.
+        css = _externalize_images(body, writer, "").strip() + "\n"
+        attrs = TYPE_ATTR_RE.sub("", m.group("attrs"))
+        return f'<link rel="stylesheet" href="{href_prefix}{writer.put(css.encode("utf-8"), "css")}"{attrs}>'
+
+    def script_repl(m):
+        attrs, body = m.group("attrs"), m.group("body")
+        if "src" in attrs.lower() or len(body.encode("utf-8")) < MIN_ASSET_BYTES:
+            return m.group(0)
+        if "type" in attrs.lower() and not JS_TYPE_RE.search(attrs):
+            return m.group(0)  # JSON-LD, templates and other non-JS payloads stay inline
+        if edition_date:
+            for quote in ("'", '"'):
+                literal = f"{quote}{edition_date}{quote}"
+                if literal in body:
+                    body = body.replace(literal, DATE_EXPR)
+                    nonlocal lifted
+                    lifted = True
+        js = body.strip() + "\n"
+        return f'<script src="{href_prefix}{writer.put(js.encode("utf-8"), "js")}"{attrs}></script>'
+
+    html = STYLE_RE.sub(style_repl, html)
+    html = SCRIPT_RE.sub(script_repl, html)
+    if lifted:
+        html = _set_edition_date(html, edition_date)
+    return _externalize_images(html, writer, href_prefix)
+
+
+def externalize_file(path, writer=None):
+    """Rewrite one edition in place; returns (bytes before, bytes after)."""
+    writer = writer or AssetWriter()
+    with open(path, "r", encoding="utf-8") as f:
+        html = f.read()
+    stem = os.path.splitext(os.path.basename(path))[0]
+    edition_date = stem if EDITION_DATE_RE.match(stem) else None
+    new_html = externalize_html(html, os.path.dirname(os.path.abspath(path)), writer, edition_date)
+    before, after = len(html.encode("utf-8")), len(new_html.encode("utf-8"))
+    if new_html != html:
+        tmp = path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(new_html)
+        os.replace(tmp, path)
+    return before, after
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Move inline CSS/JS/images out of editions into output/assets/")
+    parser.add_argument("files", nargs="*", help="Edition HTML files (default: every output/daily/*.html)")
+    parser.add_argument("--assets-dir", default=ASSETS_DIR, help="Shared asset directory")
+    args = parser.parse_args()
+
+    files = args.files or sorted(glob.glob(os.path.join(DAILY_DIR, "*.html")))
+    writer = AssetWriter(args.assets_dir)
+    total_before = total_after = 0
+    for path in files:
+        try:
+            before, after = externalize_file(path, writer)
+        except (OSError, UnicodeDecodeError) as e:
+            print(f"WARNING: could not externalize {path}: {e}", file=sys.stderr)
+            continue
+        total_before += before
+        total_after += after
+    print(f"Externalized {len(files)} editions: {total_before / 1e6:.1f} MB → {total_after / 1e6:.1f} MB "
+          f"({len(writer.written)} new assets, {writer.reused} reused) → {args.assets_dir}")
+
+
+if __name__ == "__main__":
+    main()
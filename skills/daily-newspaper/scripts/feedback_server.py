@@ -2,8 +2,10 @@
 """Minimal HTTP server for receiving daily newspaper feedback.
 
 Listens on localhost:9847. Accepts POST /api/feedback with JSON body.
-Appends entries to memory/feedback.jsonl and logs via log_action.py.
-Auto-shuts down after 2 hours of inactivity.
+Appends entries to memory/feedback.jsonl and logs them to the session log.
+Requests are served on separate threads, so /health stays responsive while
+a newspaper generation (POST /api/generate, polled via GET /api/jobs/<id>)
+runs in the background. Auto-shuts down after 2 hours of inactivity.
 """
 
 import atexit
@@ -11,13 +13,13 @@ import json
 import os
 import platform
 import signal
-import subprocess
 import sys
 import tempfile
 import threading
 import time
 from datetime import datetime, timezone
-from http.server import HTTPServer, BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import parse_qs, urlsplit
 
 PORT = 9847
 PID_FILE = os.path.join(tempfile.gettempdir(), "pm_feedback_server.pid")
@@ -26,13 +28,15 @@ INACTIVITY_TIMEOUT = 2 * 60 * 60  # 2 hours in seconds
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 PROJECT_ROOT = os.path.abspath(os.path.join(SCRIPT_DIR, "..", "..", ".."))
 FEEDBACK_FILE = os.path.join(PROJECT_ROOT, "memory", "feedback.jsonl")
-LOG_ACTION = os.path.join(PROJECT_ROOT, "skills", "memory-manager", "scripts", "log_action.py")
-
-from onboard_handler import handle_onboard, handle_scrape_website, handle_generate, serve_welcome_page
+from onboard_handler import (handle_onboard, handle_scrape_website, handle_generate,
+                             handle_job_status, serve_welcome_page)
+import log_action as session_log  # on sys.path via onboard_handler
 
 # Global timer for auto-shutdown
 _shutdown_timer = None
 _timer_lock = threading.Lock()
+# Requests run on separate threads; serialize appends to feedback.jsonl.
+_feedback_lock = threading.Lock()
 
 
 def reset_inactivity_timer():
@@ -52,6 +56,7 @@ def auto_shutdown():
     # os._exit bypasses atexit handlers; use it here since we're in a daemon
     # thread and sys.exit() would only raise SystemExit in this thread.
     cleanup_pid()
+    session_log.flush()
     os._exit(0)
 
 
@@ -157,6 +162,13 @@ class FeedbackHandler(BaseHTTPRequestHandler):
             self._send_json(200, {"status": "ok", "pid": os.getpid()})
         elif self.path == "/api/profile-status":
             self._handle_profile_status()
+        elif self.path.startswith("/api/jobs/"):
+            url = urlsplit(self.path)
+            try:
+                since = int(parse_qs(url.query).get("since", ["0"])[0])
+            except ValueError:
+                since = 0
+            handle_job_status(self, url.path[len("/api/jobs/"):], since)
         else:
             self._send_json(404, {"error": "not found"})
 
@@ -202,20 +214,12 @@ class FeedbackHandler(BaseHTTPRequestHandler):
 
         # Append to feedback.jsonl
         os.makedirs(os.path.dirname(FEEDBACK_FILE), exist_ok=True)
-        with open(FEEDBACK_FILE, "a") as f:
+        with _feedback_lock, open(FEEDBACK_FILE, "a") as f:
             f.write(json.dumps(entry) + "\n")
 
-        # Log via log_action.py
+        # Session log (buffered; written by a background flusher thread)
         try:
-            subprocess.run(
-                [
-                    sys.executable, LOG_ACTION,
-                    "--action", "feedback_received",
-                    "--detail", f"Rating {rating}/5 for {entry['date']}",
-                ],
-                capture_output=True,
-                timeout=5,
-            )
+            session_log.log_action("feedback_received", f"Rating {rating}/5 for {entry['date']}")
         except Exception:
             pass  # Don't fail the request if logging fails
 
@@ -235,7 +239,8 @@ def main():
 
     reset_inactivity_timer()
 
-    server = HTTPServer(("127.0.0.1", PORT), FeedbackHandler)
+    server = ThreadingHTTPServer(("127.0.0.1", PORT), FeedbackHandler)
+    server.daemon_threads = True
     print(f"Feedback server listening on http://localhost:{PORT}")
     print(f"PID: {os.getpid()} (file: {PID_FILE})")
     print(f"Auto-shutdown after {INACTIVITY_TIMEOUT // 3600}h of inactivity")
@@ -16,9 +16,14 @@ import sys
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 PROJECT_ROOT = os.path.abspath(os.path.join(SCRIPT_DIR, "..", "..", ".."))
 FEEDBACK_FILE = os.path.join(PROJECT_ROOT, "memory", "feedback.jsonl")
-LOG_ACTION = os.path.join(PROJECT_ROOT, "skills", "memory-manager", "scripts", "log_action.py")
 REPO = "SecchiAlessandro/PersonalMentor"
 
+MEMORY_MANAGER_DIR = os.path.join(PROJECT_ROOT, "skills", "memory-manager", "scripts")
+if MEMORY_MANAGER_DIR not in sys.path:
+    sys.path.insert(0, MEMORY_MANAGER_DIR)
+
+import log_action as session_log
+
 
 def gh_available():
     """Check if the gh CLI is installed and authenticated."""
@@ -136,12 +141,9 @@ def close_issue(number):
 
 
 def log_action(detail):
-    """Log via log_action.py (best-effort)."""
+    """Log to the session log (best-effort, buffered)."""
     try:
-        subprocess.run(
-            [sys.executable, LOG_ACTION, "--action", "feedback_received", "--detail", detail],
-            capture_output=True, timeout=5,
-        )
+        session_log.log_action("feedback_received", detail)
     except Exception:
         pass
 
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""Shown-history index for day-over-day novelty.
+
+Maps each item key (URL or normalized title) to the last edition day it was
+shown, as an integer day number (`date.toordinal()`), so novelty checks are a
+dict lookup and an integer subtraction. Keys are also bucketed by that day,
+which makes retention pruning a drop of whole expired buckets rather than a
+scan of every entry.
+
+On disk the index is an append-only log, one `<day>\\t<key>` line per sighting
+(the last line for a key wins). Saving appends only the new sightings; the
+log is rewritten compactly once superseded or pruned lines outnumber the live
+ones. A legacy `seen-items.json` map ({key: "YYYY-MM-DD"}) is imported on
+first use.
+"""
+
+import json
+import os
+import re
+import sys
+from datetime import date
+
+COMPACT_MIN_LINES = 1000  # never compact logs smaller than this
+
+_LINE_BREAK_RE = re.compile(r"[\r\n]+")
+
+
+def day_number(iso_day):
+    """Integer day number for an ISO date string; None if unparseable."""
+    try:
+        return date.fromisoformat(str(iso_day)[:10]).toordinal()
+    except (ValueError, TypeError):
+        return None
+
+
+def _clean_key(key):
+    # One sighting per log line, so keys never contain line breaks.
+    return _LINE_BREAK_RE.sub(" ", key) if "\n" in key or "\r" in key else key
+
+
+class NoveltyIndex:
+    """Item key -> last day shown, backed by an append-only log at `path`."""
+
+    def __init__(self, path, legacy_path=None):
+        self.path = path
+        self._last = {}      # key -> day number
+        self._buckets = {}   # day number -> set of keys last shown that day
+        self._pending = []   # (day, key) sightings not yet written
+        self._log_lines = 0  # lines currently in the log file
+        self._rewrite = False
+        if os.path.exists(path):
+            self._load_log()
+        elif legacy_path and os.path.exists(legacy_path):
+            self._load_legacy(legacy_path)
+
+    def __len__(self):
+        return len(self._last)
+
+    def __contains__(self, key):
+        return _clean_key(key) in self._last
+
+    def _set(self, key, day):
+        old = self._last.get(key)
+        if old is not None:
+            if old >= day:
+                return False
+            bucket = self._buckets.get(old)
+            if bucket is not None:
+                bucket.discard(key)
+                if not bucket:
+                    del self._buckets[old]
+        self._last[key] = day
+        self._buckets.setdefault(day, set()).add(key)
+        return True
+
+    def _load_log(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                for line in f:
+                    self._log_lines += 1
+                    day, sep, key = line.rstrip("\n").partition("\t")
+                    if sep and day.isdigit() and key:
+                        self._set(key, int(day))
+        except OSError as e:
+            print(f"WARNING: could not read shown-history {self.path}: {e}", file=sys.stderr)
+
+    def _load_legacy(self, legacy_path):
+        try:
+            with open(legacy_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (json.JSONDecodeError, OSError):
+            return
+        if not isinstance(data, dict):
+            return
+        for key, iso_day in data.items():
+            day = day_number(iso_day)
+            if day is not None and key:
+                self._set(_clean_key(str(key)), day)
+        self._rewrite = True
+
+    def last_shown(self, key):
+        """Day number the item was last shown, or None."""
+        return self._last.get(_clean_key(key))
+
+    def days_since(self, key, today):
+        """Whole days between the item's last showing and day number `today`, or None."""
+        last = self._last.get(_clean_key(key))
+        return None if last is None else today - last
+
+    def record(self, keys, today):
+        """Mark `keys` as shown on day number `today`."""
+        for key in keys:
+            if not key:
+                continue
+            key = _clean_key(key)
+            if self._set(key, today):
+                self._pending.append((today, key))
+
+    def prune(self, today, retention):
+        """Forget items last shown more than `retention` days before `today`."""
+        cutoff = today - retention
+        for day in [d for d in self._buckets if d < cutoff]:
+            for key in self._buckets.pop(day):
+                del self._last[key]
+
+    def save(self):
+        """Append new sightings, or rewrite the log when it is mostly dead lines."""
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        total = self._log_lines + len(self._pending)
+        if self._rewrite or (total > COMPACT_MIN_LINES and total > 2 * len(self._last)):
+            tmp = self.path + ".tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                for day in sorted(self._buckets):
+                    f.writelines(f"{day}\t{key}\n" for key in sorted(self._buckets[day]))
+            os.replace(tmp, self.path)
+            self._log_lines = len(self._last)
+            self._rewrite = False
+        elif self._pending:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.writelines(f"{day}\t{key}\n" for day, key in self._pending)
+            self._log_lines = total
+        self._pending = []
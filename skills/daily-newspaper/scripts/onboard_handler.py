@@ -8,9 +8,14 @@ YAML files. Plugs into feedback_server.py as route handlers.
 import base64
 import json
 import os
+import signal
 import subprocess
 import sys
 import tempfile
+import threading
+import time
+import uuid
+from datetime import date
 
 try:
     import yaml
@@ -27,11 +32,13 @@ WELCOME_PAGE = os.path.join(PROJECT_ROOT, "output", "welcome.html")
 EXTRACT_CV = os.path.join(PROJECT_ROOT, "skills", "profile-manager", "scripts", "extract_cv.py")
 PARSE_PAGE = os.path.join(PROJECT_ROOT, "skills", "web-scraper", "scripts", "parse_page.py")
 VALIDATE_PROFILE = os.path.join(PROJECT_ROOT, "skills", "profile-manager", "scripts", "validate_profile.py")
-LOG_ACTION = os.path.join(PROJECT_ROOT, "skills", "memory-manager", "scripts", "log_action.py")
 
 # Add skill script dirs to path for direct import
 sys.path.insert(0, os.path.join(PROJECT_ROOT, "skills", "profile-manager", "scripts"))
 sys.path.insert(0, os.path.join(PROJECT_ROOT, "skills", "web-scraper", "scripts"))
+sys.path.insert(0, os.path.join(PROJECT_ROOT, "skills", "memory-manager", "scripts"))
+
+import log_action as session_log
 
 
 def _deep_merge(base, override):
@@ -235,13 +242,9 @@ def _write_yaml(filepath, data, comment=""):
 
 
 def _log_action(action, detail):
-    """Log via log_action.py (best-effort)."""
+    """Log to the session log (best-effort, buffered)."""
     try:
-        subprocess.run(
-            [sys.executable, LOG_ACTION, "--action", action, "--detail", detail],
-            capture_output=True,
-            timeout=5,
-        )
+        session_log.log_action(action, detail)
     except Exception:
         pass
 
@@ -345,44 +348,168 @@ def handle_scrape_website(handler):
         handler._send_json(200, {"status": "ok", "data": result})
 
 
-RUN_DAILY = os.path.join(PROJECT_ROOT, "skills", "daily-newspaper", "scripts", "run_daily.sh")
-
-
-def handle_generate(handler):
-    """Process POST /api/generate — trigger newspaper generation in background."""
+RUN_DAILY = os.path.join(PROJECT_ROOT, "skills", "daily-newspaper", "scripts", "run_daily.py")
+GENERATE_TIMEOUT = 480     # seconds before a generation is killed
+MAX_OUTPUT_LINES = 2000    # progress lines kept per job
+MAX_FINISHED_JOBS = 20     # finished jobs kept for polling
+
+
+class GenerationJob:
+    """One background run of the daily pipeline, polled via /api/jobs/<id>."""
+
+    def __init__(self):
+        self.id = uuid.uuid4().hex[:12]
+        self.state = "running"  # running | succeeded | failed | timed_out
+        self.started_at = time.time()
+        self.finished_at = None
+        self.returncode = None
+        self.error = None
+        self.lines = []
+        self.dropped = 0  # lines trimmed from the front of `lines`
+        self.lock = threading.Lock()
+
+    def append(self, line):
+        with self.lock:
+            self.lines.append(line.rstrip("\n"))
+            if len(self.lines) > MAX_OUTPUT_LINES:
+                del self.lines[0]
+                self.dropped += 1
+
+    def finish(self, state, returncode=None, error=None):
+        with self.lock:
+            self.state = state
+            self.returncode = returncode
+            self.error = error
+            self.finished_at = time.time()
+
+    def snapshot(self, since=0):
+        """JSON-ready status with the progress lines from offset `since` on."""
+        with self.lock:
+            start = max(since - self.dropped, 0)
+            data = {
+                "job_id": self.id,
+                "state": self.state,
+                "started_at": self.started_at,
+                "finished_at": self.finished_at,
+                "output": self.lines[start:],
+                "next": self.dropped + len(self.lines),
+            }
+            if self.state == "succeeded":
+                today = date.today().isoformat()
+                data["message"] = f"Newspaper generated for {today}"
+                data["path"] = f"output/daily/{today}.html"
+            elif self.state != "running":
+                data["error"] = self.error or "Generation failed"
+            return data
+
+
+_jobs = {}            # job id -> GenerationJob (running and recently finished)
+_jobs_lock = threading.Lock()
+_active_job = None    # the running job, if any
+
+
+def _run_generation(job):
+    global _active_job
     try:
         proc = subprocess.Popen(
-            ["bash", RUN_DAILY],
+            # -u: unbuffered, so progress lines reach the job as they are printed.
+            [sys.executable, "-u", RUN_DAILY],
             stdout=subprocess.PIPE,
             stderr=subprocess.STDOUT,
             text=True,
+            bufsize=1,
             cwd=PROJECT_ROOT,
+            # Own process group, so a timeout also kills the pipeline's children
+            # (which would otherwise keep the output pipe open).
+            start_new_session=(os.name == "posix"),
         )
-        # Wait up to 300s for it to finish
+        timed_out = threading.Event()
+
+        def kill():
+            timed_out.set()
+            try:
+                if os.name == "posix":
+                    os.killpg(proc.pid, signal.SIGKILL)
+                else:
+                    proc.kill()
+            except OSError:
+                pass
+
+        watchdog = threading.Timer(GENERATE_TIMEOUT, kill)
+        watchdog.daemon = True
+        watchdog.start()
         try:
-            output, _ = proc.communicate(timeout=480)
-        except subprocess.TimeoutExpired:
-            proc.kill()
-            handler._send_json(504, {"error": "Generation timed out after 480s"})
-            return
-
-        if proc.returncode == 0:
-            # Find today's newspaper file
-            from datetime import date
-            today = date.today().isoformat()
-            newspaper_path = f"output/daily/{today}.html"
-            handler._send_json(200, {
-                "status": "ok",
-                "message": f"Newspaper generated for {today}",
-                "path": newspaper_path,
-            })
+            for line in proc.stdout:
+                job.append(line)
+            proc.wait()
+        finally:
+            watchdog.cancel()
+        if timed_out.is_set():
+            job.finish("timed_out", proc.returncode,
+                       f"Generation timed out after {GENERATE_TIMEOUT}s")
+        elif proc.returncode == 0:
+            job.finish("succeeded", 0)
         else:
-            handler._send_json(500, {
-                "error": "Generation failed",
-                "output": output[-2000:] if output else "",
-            })
+            job.finish("failed", proc.returncode, "Generation failed")
+    except Exception as e:
+        job.finish("failed", error=str(e))
+    finally:
+        with _jobs_lock:
+            if _active_job is job:
+                _active_job = None
+            finished = [j for j in _jobs.values() if j.state != "running"]
+            for old in sorted(finished, key=lambda j: j.started_at)[:-MAX_FINISHED_JOBS]:
+                del _jobs[old.id]
+
+
+def start_generation():
+    """Start a generation job unless one is already running.
+
+    Returns (job, created): concurrent requests share the running job instead
+    of launching a duplicate pipeline.
+    """
+    global _active_job
+    with _jobs_lock:
+        if _active_job is not None:
+            return _active_job, False
+        job = GenerationJob()
+        _jobs[job.id] = job
+        _active_job = job
+    threading.Thread(target=_run_generation, args=(job,), name=f"generate-{job.id}",
+                     daemon=True).start()
+    return job, True
+
+
+def get_job(job_id):
+    with _jobs_lock:
+        return _jobs.get(job_id)
+
+
+def handle_generate(handler):
+    """Process POST /api/generate — start (or join) a background generation job.
+
+    Responds immediately with the job id; progress is polled from
+    GET /api/jobs/<id>.
+    """
+    try:
+        job, created = start_generation()
     except Exception as e:
         handler._send_json(500, {"error": str(e)})
+        return
+    handler._send_json(202 if created else 200, {
+        "status": "accepted" if created else "already_running",
+        "job_id": job.id,
+        "poll": f"/api/jobs/{job.id}",
+    })
+
+
+def handle_job_status(handler, job_id, since=0):
+    """Process GET /api/jobs/<id>?since=N — job state plus progress lines from offset N."""
+    job = get_job(job_id)
+    if job is None:
+        handler._send_json(404, {"error": "unknown job"})
+        return
+    handler._send_json(200, job.snapshot(since))
 
 
 def serve_welcome_page(handler):
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""Tiny DAG runner for the in-process daily pipeline.
+
+Each step is a plain callable that receives a snapshot of the context dict
+and returns a dict of new context entries (or None), so steps exchange the
+loaded profile and fetched content in memory instead of through fresh
+interpreters. Steps never modify the context they are given; the runner merges
+each step's result into the context once the step has finished. A step starts
+as soon as every step it depends on has finished; independent steps (the three
+fetchers) run concurrently.
+
+A step may have a deadline. Python threads cannot be killed, so a step that
+overruns it is abandoned: it keeps running in a daemon thread (which does not
+hold up interpreter exit), the pipeline treats it as failed, and whatever it
+returns later is discarded, so it cannot change what later steps see.
+"""
+
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+
+
+class StepTimeout(Exception):
+    pass
+
+
+def _start(fn, ctx, name):
+    """Run `fn` on a shallow copy of `ctx` in a daemon thread; returns a Future for its result."""
+    future = Future()
+    snapshot = dict(ctx)
+
+    def target():
+        try:
+            future.set_result(fn(snapshot))
+        except BaseException as exc:
+            future.set_exception(exc)
+
+    threading.Thread(target=target, name=f"step-{name}", daemon=True).start()
+    return future
+
+
+class Pipeline:
+    """Named steps with dependencies, executed in topological order."""
+
+    def __init__(self, max_workers=4):
+        self.max_workers = max_workers
+        self._steps = {}  # name -> (fn, deps, timeout, optional), in insertion order
+
+    def add(self, name, fn, after=(), timeout=None, optional=False):
+        """Register step `name` to run `fn(ctx)` once all `after` steps are done.
+
+        `fn` returns a dict merged into the context for later steps, or None.
+        `timeout` is the step's deadline in seconds. When an `optional` step
+        fails or times out, a warning is printed and its dependents run anyway.
+        """
+        if name in self._steps:
+            raise ValueError(f"duplicate step: {name}")
+        for dep in after:
+            if dep not in self._steps:
+                raise ValueError(f"step {name!r} depends on unknown step {dep!r}")
+        self._steps[name] = (fn, tuple(after), timeout, optional)
+        return self
+
+    def run(self, ctx):
+        """Run every step against `ctx`, merging each step's result into it.
+
+        A (required) step that raises or times out stops its dependents from
+        starting; steps already running are allowed to finish, then the first
+        error is re-raised. Steps that must not abort the run should catch
+        their own errors or be added as optional.
+        """
+        done, failed = set(), {}
+        pending = dict(self._steps)
+        running = {}  # future -> (name, deadline or None)
+        while pending or running:
+            if not failed:
+                for name, (fn, deps, timeout, _) in list(pending.items()):
+                    if len(running) >= self.max_workers:
+                        break
+                    if all(d in done for d in deps):
+                        del pending[name]
+                        deadline = time.monotonic() + timeout if timeout else None
+                        running[_start(fn, ctx, name)] = (name, deadline)
+            if not running:
+                break
+            deadlines = [d for _, d in running.values() if d is not None]
+            wait_for = max(0, min(deadlines) - time.monotonic()) if deadlines else None
+            wait(running, timeout=wait_for, return_when=FIRST_COMPLETED)
+            now = time.monotonic()
+            for fut in list(running):
+                name, deadline = running[fut]
+                if fut.done():
+                    exc = fut.exception()
+                elif deadline is not None and now >= deadline:
+                    exc = StepTimeout(f"{name} timed out after {self._steps[name][2]}s")
+                else:
+                    continue
+                del running[fut]
+                if exc is None:
+                    ctx.update(fut.result() or {})
+                    done.add(name)
+                elif self._steps[name][3]:
+                    reason = exc if isinstance(exc, StepTimeout) else f"{name} failed ({exc})"
+                    print(f"  WARNING: {reason}, continuing without it")
+                    done.add(name)
+                else:
+                    failed[name] = exc
+        if failed:
+            raise next(iter(failed.values()))
+        return ctx
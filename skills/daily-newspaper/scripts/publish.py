@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""Publish editions to the git remote with as few git round-trips as possible.
+
+One run normally costs four git processes: `ls-remote`, `add`, `commit` and
+`push`. The pull/rebase step only runs when `ls-remote` shows that the remote
+branch has moved past our remote-tracking ref (the locally cached copy of the
+remote's head); it runs after the commit, so it replays our commit on top of
+the remote instead of tripping over untracked output the remote already has.
+Pushing the branch ref alone sends only the objects the remote
+is missing.
+
+When the remote cannot be reached, the paths are kept in a queue file
+(memory/publish-queue.json) and nothing is committed. The next successful run
+publishes every queued edition in a single commit.
+
+Usage:
+    python3 publish.py output/daily/2026-04-18.html [--repo-dir DIR] [--remote origin] [--branch main]
+"""
+
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.abspath(os.path.join(SCRIPT_DIR, "..", "..", ".."))
+
+QUEUE_PATH = os.path.join(PROJECT_ROOT, "memory", "publish-queue.json")
+ASSETS_PATH = os.path.join("output", "assets")
+LS_REMOTE_TIMEOUT = 30
+
+EDITION_DATE_RE = re.compile(r"(\d{4}-\d{2}-\d{2})\.html$")
+
+
+def _git(repo_dir, *args, timeout=None):
+    """Run one git command in `repo_dir`; returns CompletedProcess (never raises on exit code)."""
+    return subprocess.run(["git", *args], cwd=repo_dir, capture_output=True, text=True,
+                          timeout=timeout)
+
+
+def load_queue(path=QUEUE_PATH):
+    if not os.path.exists(path):
+        return []
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        return [p for p in data if isinstance(p, str)] if isinstance(data, list) else []
+    except (json.JSONDecodeError, OSError):
+        return []
+
+
+def save_queue(paths, path=QUEUE_PATH):
+    if not paths:
+        if os.path.exists(path):
+            os.remove(path)
+        return
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(paths, f, indent=2)
+    os.replace(tmp, path)
+
+
+def remote_head(repo_dir, remote, branch):
+    """Commit id of `branch` on `remote` (one ls-remote); "" if the branch is absent, None if unreachable."""
+    try:
+        result = _git(repo_dir, "ls-remote", remote, f"refs/heads/{branch}", timeout=LS_REMOTE_TIMEOUT)
+    except subprocess.TimeoutExpired:
+        return None
+    if result.returncode != 0:
+        return None
+    line = result.stdout.strip()
+    return line.split()[0] if line else ""
+
+
+def tracking_head(repo_dir, remote, branch):
+    """Our cached copy of the remote branch head (refs/remotes/<remote>/<branch>), or ""."""
+    result = _git(repo_dir, "rev-parse", "--verify", "-q", f"refs/remotes/{remote}/{branch}")
+    return result.stdout.strip() if result.returncode == 0 else ""
+
+
+def commit_message(paths):
+    dates = sorted({m.group(1) for p in paths for m in [EDITION_DATE_RE.search(p)] if m})
+    if not dates:
+        return "Publish newspaper output"
+    if len(dates) == 1:
+        return f"Daily newspaper {dates[0]}"
+    return f"Daily newspapers {dates[0]} – {dates[-1]} ({len(dates)} editions)"
+
+
+def _rebase(repo_dir, remote, branch):
+    result = _git(repo_dir, "pull", "--rebase", "--autostash", remote, branch)
+    if result.returncode != 0:
+        print(f"  WARNING: git pull --rebase failed: {result.stderr.strip()}", file=sys.stderr)
+        _git(repo_dir, "rebase", "--abort")  # leave the commit in place for the next run
+        return False
+    return True
+
+
+def publish(paths, repo_dir=PROJECT_ROOT, remote="origin", branch="main", queue_path=QUEUE_PATH):
+    """Commit and push `paths` (relative to `repo_dir`) plus any queued ones.
+
+    Returns True once everything queued is on the remote; False if it was
+    queued for a later run (remote unreachable) or the push failed.
+    """
+    if not os.path.exists(os.path.join(repo_dir, ".git")):
+        print("  Not a git repo — skipping.")
+        return False
+
+    queue = list(dict.fromkeys(load_queue(queue_path) + list(paths)))
+    queue = [p for p in queue if os.path.exists(os.path.join(repo_dir, p))]
+    if os.path.isdir(os.path.join(repo_dir, ASSETS_PATH)) and ASSETS_PATH not in queue:
+        queue.append(ASSETS_PATH)
+
+    # The asset directory is re-added on every run, so it never needs queueing.
+    pending = [p for p in queue if p != ASSETS_PATH]
+
+    remote_sha = remote_head(repo_dir, remote, branch)
+    if remote_sha is None:
+        save_queue(pending, queue_path)
+        print(f"  Remote unreachable — queued {len(pending)} path(s) for the next run.")
+        return False
+
+    if queue:
+        _git(repo_dir, "add", "--", *queue)
+    committed = _git(repo_dir, "commit", "-q", "-m", commit_message(queue))
+    if committed.returncode != 0:
+        ahead = _git(repo_dir, "rev-list", "--count", f"refs/remotes/{remote}/{branch}..HEAD")
+        if remote_sha and ahead.returncode == 0 and ahead.stdout.strip() == "0":
+            save_queue([], queue_path)
+            print("  No new changes to push.")
+            return True
+
+    # Only rebase when the remote moved since we last fetched or pushed.
+    if remote_sha and remote_sha != tracking_head(repo_dir, remote, branch):
+        print("  Remote has new commits — rebasing.")
+        if not _rebase(repo_dir, remote, branch):
+            save_queue(pending, queue_path)
+            return False
+
+    push = _git(repo_dir, "push", remote, f"HEAD:refs/heads/{branch}")
+    if push.returncode != 0:
+        # Lost a race with another writer between ls-remote and push.
+        if _rebase(repo_dir, remote, branch):
+            push = _git(repo_dir, "push", remote, f"HEAD:refs/heads/{branch}")
+    if push.returncode != 0:
+        print(f"  WARNING: git push failed: {push.stderr.strip()}", file=sys.stderr)
+        return False
+
+    # The push also advanced refs/remotes/<remote>/<branch>, so the next run
+    # sees an unchanged remote and skips the rebase.
+    save_queue([], queue_path)
+    print("  Pushed to GitHub.")
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Commit and push newspaper output")
+    parser.add_argument("paths", nargs="*", help="Paths to publish, relative to the repo")
+    parser.add_argument("--repo-dir", default=PROJECT_ROOT, help="Git working tree")
+    parser.add_argument("--remote", default="origin")
+    parser.add_argument("--branch", default="main")
+    parser.add_argument("--queue", default=QUEUE_PATH, help="Offline publish queue file")
+    args = parser.parse_args()
+    ok = publish(args.paths, args.repo_dir, args.remote, args.branch, args.queue)
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -6,6 +6,7 @@ import json
 import os
 import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timezone
 
 try:
@@ -18,10 +19,23 @@ SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 PROJECT_ROOT = os.path.abspath(os.path.join(SCRIPT_DIR, "..", "..", ".."))
 TEMPLATE_PATH = os.path.join(SCRIPT_DIR, "..", "assets", "template.html")
 LEARNED_PREFS_PATH = os.path.join(PROJECT_ROOT, "memory", "learned-preferences.yaml")
+ARCHIVE_DIR = os.path.join(PROJECT_ROOT, "output", "daily")
+
+# Shared helpers (term matching, content store) live with the web-scraper scripts.
+WEB_SCRAPER_DIR = os.path.join(PROJECT_ROOT, "skills", "web-scraper", "scripts")
+if WEB_SCRAPER_DIR not in sys.path:
+    sys.path.insert(0, WEB_SCRAPER_DIR)
+
+import content_store
+import externalize_assets
+from novelty_index import NoveltyIndex, day_number
+from template_engine import compile_template, load_template
+from term_matcher import TermMatcher
 
 # Day-over-day novelty: news/event items shown on a previous day within this
 # window are pushed to the back, so each edition differs from recent ones.
-SEEN_PATH = os.path.join(PROJECT_ROOT, "memory", "seen-items.json")
+SEEN_PATH = os.path.join(PROJECT_ROOT, "memory", "seen-items.log")
+LEGACY_SEEN_PATH = os.path.join(PROJECT_ROOT, "memory", "seen-items.json")  # imported once
 NOVELTY_WINDOW_DAYS = 7   # suppress repeats shown in the last N days
 SEEN_RETENTION_DAYS = 45  # forget shown-history older than this
 
@@ -124,6 +138,9 @@ AI_TECH_TERMS = [
     "openai", "anthropic", "deepmind", "nvidia", "developer", "app", "saas",
 ]
 
+ENERGY_MATCHER = TermMatcher(ENERGY_TERMS)
+AI_TECH_MATCHER = TermMatcher(AI_TECH_TERMS)
+
 # Minimum distinct ENERGY_TERMS an event must hit to earn a spot in the energy
 # events track. The word "energy" (or "power") alone appears incidentally in
 # wellness and networking blurbs ("Energizing yoga flow", "CEO Energy Break"),
@@ -133,11 +150,25 @@ AI_TECH_TERMS = [
 MIN_ENERGY_TERMS_FOR_EVENT = 2
 
 
-def energy_term_count(item):
-    """Count distinct ENERGY_TERMS whole-word-matched across an item's text."""
+_topic_hits_cache = {}  # item text -> (energy, ai); items themselves stay untouched
+TOPIC_HITS_CACHE_SIZE = 10000
+
+
+def _topic_hits(item):
+    """(energy, ai) term counts over an item's text, memoized by that text."""
     text = " ".join(str(item.get(k, "")) for k in
                     ("title", "summary", "description", "location", "source")).lower()
-    return sum(1 for t in ENERGY_TERMS if _word_match(t, text))
+    hits = _topic_hits_cache.get(text)
+    if hits is None:
+        if len(_topic_hits_cache) >= TOPIC_HITS_CACHE_SIZE:
+            _topic_hits_cache.clear()
+        hits = _topic_hits_cache[text] = (ENERGY_MATCHER.count(text), AI_TECH_MATCHER.count(text))
+    return hits
+
+
+def energy_term_count(item):
+    """Count distinct ENERGY_TERMS whole-word-matched across an item's text."""
+    return _topic_hits(item)[0]
 
 
 # Localities that are clearly NOT the Zürich area, per the "events should be in
@@ -154,12 +185,13 @@ NON_ZURICH_LOCALITIES = [
     "brussels", "bruxelles", "santiago", "paris", "london", "berlin",
     "vienna", "wien", "amsterdam", "milan", "milano", "munich", "münchen",
 ]
+NON_ZURICH_MATCHER = TermMatcher(NON_ZURICH_LOCALITIES)
 
 
 def in_zurich_area(event):
     """True unless the event's title/location names a clearly non-Zürich place."""
     text = f"{event.get('title', '')} {event.get('location', '')}".lower()
-    return not any(_word_match(loc, text) for loc in NON_ZURICH_LOCALITIES)
+    return not NON_ZURICH_MATCHER.search(text)
 
 
 def first_sentence(text, max_len=160):
@@ -228,18 +260,6 @@ def _source_host(item):
     return host.replace("www.", "")
 
 
-def _word_match(term, text):
-    """True if term appears as a whole word in text (case-insensitive).
-
-    Word-boundary matching avoids false positives like 'ai' inside
-    'available'/'training' that naive substring matching would count.
-    """
-    term = str(term).strip().lower()
-    if not term:
-        return False
-    return re.search(r"\b" + re.escape(term) + r"\b", text) is not None
-
-
 def classify_topic(item):
     """Classify a news article or event into the "energy" or "ai" track.
 
@@ -254,10 +274,7 @@ def classify_topic(item):
     if category in ("ai", "tech"):
         return "ai"
 
-    text = " ".join(str(item.get(k, "")) for k in
-                    ("title", "summary", "description", "location", "source")).lower()
-    energy_hits = sum(1 for t in ENERGY_TERMS if _word_match(t, text))
-    ai_hits = sum(1 for t in AI_TECH_TERMS if _word_match(t, text))
+    energy_hits, ai_hits = _topic_hits(item)
     return "energy" if energy_hits > ai_hits else "ai"
 
 
@@ -269,45 +286,68 @@ def split_by_topic(items):
     return energy_items, ai_items
 
 
-def relevance_score(text, interests, learned=None):
-    """Score how relevant a piece of text is to the user's profile.
+_relevance_matchers = {}  # (id(interests), id(learned)) -> (interests, learned, matcher)
 
-    Whole-word, case-insensitive matching against the profile's weighted
-    topics, industries, target roles, and relevance keywords. A score of 0
-    means the text matched no profile signal and is treated as off-profile.
 
-    `learned` (content_preferences from learned-preferences.yaml, distilled
-    from written feedback) additionally boosts liked topics and penalises
-    disliked ones — a penalty can push an item to 0 and out of the edition.
-    """
-    text_l = text.lower()
-    score = 0
+def _relevance_matcher(interests, learned=None):
+    """Weighted matcher over every profile signal, compiled once per profile."""
+    key = (id(interests), id(learned))
+    cached = _relevance_matchers.get(key)
+    if cached is not None and cached[0] is interests and cached[1] is learned:
+        return cached[2]
+    terms, weights = [], []
+
+    def add(term, weight):
+        terms.append(term)
+        weights.append(weight)
+
     if learned:
         for topic in learned.get("liked_topics", []) or []:
-            if _word_match(topic, text_l):
-                score += 2
+            add(topic, 2)
         for topic in learned.get("disliked_topics", []) or []:
-            if _word_match(topic, text_l):
-                score -= 3
+            add(topic, -3)
     for t in interests.get("professional", []) or []:
-        if _word_match(t.get("topic", ""), text_l):
-            score += int(t.get("weight", 1))
+        add(t.get("topic", ""), int(t.get("weight", 1)))
     for ind in interests.get("industries", []) or []:
-        if _word_match(ind, text_l):
-            score += 2
+        add(ind, 2)
     job_search = interests.get("job_search", {}) or {}
     for role in job_search.get("target_roles", []) or []:
-        if _word_match(role, text_l):
-            score += 3
+        add(role, 3)
     for kw in interests.get("relevance_keywords", []) or []:
         # Support either bare strings or {term, weight} mappings.
         if isinstance(kw, dict):
-            term, weight = kw.get("term", ""), int(kw.get("weight", 2))
+            add(kw.get("term", ""), int(kw.get("weight", 2)))
         else:
-            term, weight = kw, 2
-        if _word_match(term, text_l):
-            score += weight
-    return score
+            add(kw, 2)
+    matcher = TermMatcher(terms, weights)
+    _relevance_matchers[key] = (interests, learned, matcher)
+    return matcher
+
+
+def relevance_score(text, interests, learned=None):
+    """Score how relevant a piece of text is to the user's profile.
+
+    Whole-word, case-insensitive matching against the profile's weighted
+    topics, industries, target roles, and relevance keywords. A score of 0
+    means the text matched no profile signal and is treated as off-profile.
+
+    `learned` (content_preferences from learned-preferences.yaml, distilled
+    from written feedback) additionally boosts liked topics and penalises
+    disliked ones — a penalty can push an item to 0 and out of the edition.
+    """
+    return _relevance_matcher(interests, learned).score(text.lower())
+
+
+def relevance_scores(texts, interests, learned=None):
+    """relevance_score() for a batch of texts, scored together.
+
+    Each text is scanned once for its matched term columns, giving a sparse
+    text × term match matrix; the scores are that matrix times the profile's
+    term-weight vector, summed over each row's non-zeros.
+    """
+    matcher = _relevance_matcher(interests, learned)
+    weights = matcher.term_weights()
+    return [sum(weights[i] for i in matcher.term_ids(text.lower())) for text in texts]
 
 
 def _source_pref_adjust(source_text, learned):
@@ -336,14 +376,14 @@ def rank_by_relevance(items, text_fn, interests, learned=None, source_fn=None):
     Falls back to the relevance-ranked full list when nothing matches the
     profile, so a section is never left blank on a quiet news day.
     """
-    def score(it):
-        s = relevance_score(text_fn(it), interests, learned)
-        if source_fn is not None:
-            s += _source_pref_adjust(source_fn(it), learned)
-        return s
-
-    scored = sorted(items, key=score, reverse=True)
-    relevant = [it for it in scored if score(it) > 0]
+    scores = relevance_scores([text_fn(it) for it in items], interests, learned)
+    if source_fn is not None:
+        scores = [s + _source_pref_adjust(source_fn(it), learned)
+                  for it, s in zip(items, scores)]
+
+    ranked = sorted(zip(scores, items), key=lambda pair: pair[0], reverse=True)
+    scored = [it for _, it in ranked]
+    relevant = [it for s, it in ranked if s > 0]
     return relevant if relevant else scored
 
 
@@ -380,32 +420,16 @@ def _item_key(item):
 
 
 def load_seen(path=SEEN_PATH):
-    """Load the shown-history map {item_key: 'YYYY-MM-DD' last shown}."""
-    if not os.path.exists(path):
-        return {}
-    try:
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        return data if isinstance(data, dict) else {}
-    except (json.JSONDecodeError, OSError):
-        return {}
-
-
-def save_seen(seen, path=SEEN_PATH):
-    """Persist the shown-history map."""
-    os.makedirs(os.path.dirname(path), exist_ok=True)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(seen, f, sort_keys=True)
+    """Load the shown-history index (item key -> day last shown)."""
+    return NoveltyIndex(path, legacy_path=LEGACY_SEEN_PATH)
 
 
-def _days_between(d_from, d_to):
-    """Whole days from ISO date d_from to d_to; None if unparseable."""
+def save_seen(seen):
+    """Persist the shown-history index (appends new sightings)."""
     try:
-        a = datetime.strptime(d_from, "%Y-%m-%d").date()
-        b = datetime.strptime(d_to, "%Y-%m-%d").date()
-        return (b - a).days
-    except (ValueError, TypeError):
-        return None
+        seen.save()
+    except OSError as e:
+        print(f"WARNING: could not write shown-history {seen.path}: {e}", file=sys.stderr)
 
 
 def prioritize_unseen(items, seen, today, days=NOVELTY_WINDOW_DAYS):
@@ -416,10 +440,12 @@ def prioritize_unseen(items, seen, today, days=NOVELTY_WINDOW_DAYS):
     re-running the pipeline reproduces the same edition rather than churning it.
     A track is therefore never blanked: fresh items lead, repeats only fill in.
     """
+    today_n = day_number(today)
+    if today_n is None:
+        return list(items)
     fresh, repeats = [], []
     for it in items:
-        last = seen.get(_item_key(it))
-        gap = _days_between(last, today) if last else None
+        gap = seen.days_since(_item_key(it), today_n)
         if gap is not None and 1 <= gap <= days:
             repeats.append(it)
         else:
@@ -428,15 +454,18 @@ def prioritize_unseen(items, seen, today, days=NOVELTY_WINDOW_DAYS):
 
 
 def record_shown(seen, items, today):
-    """Mark items as shown today in the history map."""
-    for it in items:
-        seen[_item_key(it)] = today
+    """Mark items as shown today in the history index."""
+    today_n = day_number(today)
+    if today_n is not None:
+        seen.record((_item_key(it) for it in items), today_n)
 
 
 def prune_seen(seen, today, retention=SEEN_RETENTION_DAYS):
     """Drop history entries older than the retention window."""
-    return {k: v for k, v in seen.items()
-            if (_days_between(v, today) if _days_between(v, today) is not None else 0) <= retention}
+    today_n = day_number(today)
+    if today_n is not None:
+        seen.prune(today_n, retention)
+    return seen
 
 
 def load_yaml(filepath):
@@ -594,14 +623,19 @@ def render_feedback_html():
   </section>'''
 
 
-def build_html(template, profile, content, theme):
-    """Build the final HTML by replacing template placeholders."""
+def build_values(profile, content, theme, now=None, learned=None, seen=None, update_seen=True):
+    """Compute the value of every template placeholder for one edition.
+
+    `now` dates the edition (default: the current time). `learned` and `seen`
+    let batch renders pass preloaded learned preferences and shown-history;
+    with `update_seen=False` the shown-history is only read, never written.
+    """
     identity = profile.get("identity", {})
     preferences = profile.get("preferences", {})
 
     user_name = identity.get("name", "there")
     language = preferences.get("writing", {}).get("language", "en")
-    now = datetime.now(timezone.utc)
+    now = now or datetime.now(timezone.utc)
     date_str = now.strftime("%Y-%m-%d")
     date_formatted = now.strftime("%A, %B %d, %Y")
 
@@ -616,7 +650,7 @@ def build_html(template, profile, content, theme):
 
     # Learned preferences: rating-driven item counts plus topic/source
     # preferences distilled from written feedback by analyze_feedback.py.
-    section_item_counts, learned_prefs = load_learned_preferences()
+    section_item_counts, learned_prefs = learned if learned is not None else load_learned_preferences()
 
     # Rank news and events by relevance, dropping off-profile items
     # (jobs arrive pre-scored and pre-filtered from fetch_jobs.py; learned
@@ -660,7 +694,8 @@ def build_html(template, profile, content, theme):
     # Day-over-day novelty: prefer news/events not shown on a recent previous
     # day, so each edition differs from the last. Repeats only fill a track when
     # there aren't enough fresh items, so a section is never left blank.
-    seen = load_seen()
+    if seen is None:
+        seen = load_seen()
     news_energy = prioritize_unseen(news_energy, seen, date_str)
     news_ai = prioritize_unseen(news_ai, seen, date_str)
     events_energy = prioritize_unseen(events_energy, seen, date_str)
@@ -676,83 +711,81 @@ def build_html(template, profile, content, theme):
     events_html = render_section_split(events_energy, events_ai, render_events_html, max_events)
 
     # Record what was actually displayed so future editions avoid repeating it.
-    record_shown(seen, news_energy[:max_news] + news_ai[:max_news], date_str)
-    record_shown(seen, events_energy[:max_events] + events_ai[:max_events], date_str)
-    save_seen(prune_seen(seen, date_str))
+    if update_seen:
+        record_shown(seen, news_energy[:max_news] + news_ai[:max_news], date_str)
+        record_shown(seen, events_energy[:max_events] + events_ai[:max_events], date_str)
+        save_seen(prune_seen(seen, date_str))
 
     feedback_html = render_feedback_html()
 
-    # Replace all placeholders
-    html = template
-    html = html.replace("{{language}}", language)
-    html = html.replace("{{date}}", date_str)
-    html = html.replace("{{theme_bg}}", theme["bg"])
-    html = html.replace("{{theme_surface}}", theme["surface"])
-    html = html.replace("{{theme_primary}}", theme["primary"])
-    html = html.replace("{{theme_secondary}}", theme["secondary"])
-    html = html.replace("{{theme_accent}}", theme["accent"])
-    html = html.replace("{{theme_text}}", theme["text"])
-    html = html.replace("{{theme_text_muted}}", theme["text_muted"])
-    html = html.replace("{{theme_border}}", theme["border"])
-    html = html.replace("{{theme_font_heading}}", theme["font_heading"])
-    html = html.replace("{{theme_font_body}}", theme["font_body"])
-    html = html.replace("{{user_name}}", user_name)
-    html = html.replace("{{date_formatted}}", date_formatted)
-    html = html.replace("{{generated_at}}", now.strftime("%Y-%m-%d %H:%M UTC"))
-    html = html.replace("{{archive_url}}", "../daily/")
-    # Personal Coach sub-app (built separately into output/web/coach/). Relative
-    # path from output/daily/DATE.html → output/web/coach/index.html.
-    html = html.replace("{{coach_url}}", "../web/coach/index.html")
-
-    # Replace section content placeholders
-    html = html.replace("{{news_content}}", news_html)
-    html = html.replace("{{jobs_content}}", jobs_html)
-    html = html.replace("{{events_content}}", events_html)
-    html = html.replace("{{feedback_content}}", feedback_html)
-
-    return html
-
+    return {
+        "language": language,
+        "date": date_str,
+        "theme_bg": theme["bg"],
+        "theme_surface": theme["surface"],
+        "theme_primary": theme["primary"],
+        "theme_secondary": theme["secondary"],
+        "theme_accent": theme["accent"],
+        "theme_text": theme["text"],
+        "theme_text_muted": theme["text_muted"],
+        "theme_border": theme["border"],
+        "theme_font_heading": theme["font_heading"],
+        "theme_font_body": theme["font_body"],
+        "user_name": user_name,
+        "date_formatted": date_formatted,
+        "generated_at": now.strftime("%Y-%m-%d %H:%M UTC"),
+        "archive_url": "../daily/",
+        # Personal Coach sub-app (built separately into output/web/coach/). Relative
+        # path from output/daily/DATE.html → output/web/coach/index.html.
+        "coach_url": "../web/coach/index.html",
+        # Section content
+        "news_content": news_html,
+        "jobs_content": jobs_html,
+        "events_content": events_html,
+        "feedback_content": feedback_html,
+    }
 
-def main():
-    parser = argparse.ArgumentParser(description="Render PersonalMentor daily newspaper HTML")
-    parser.add_argument("--profile-dir", required=True, help="Path to profile/ directory")
-    parser.add_argument("--content-dir", required=True, help="Path to content JSON files directory")
-    parser.add_argument("--output", required=True, help="Output HTML file path")
-    args = parser.parse_args()
 
-    # Load profile
-    profile = {
-        "identity": load_yaml(os.path.join(args.profile_dir, "identity.yaml")),
-        "experience": load_yaml(os.path.join(args.profile_dir, "experience.yaml")),
-        "interests": load_yaml(os.path.join(args.profile_dir, "interests.yaml")),
-        "preferences": load_yaml(os.path.join(args.profile_dir, "preferences.yaml")),
-        "sources": load_yaml(os.path.join(args.profile_dir, "sources.yaml")),
+def build_html(template, profile, content, theme):
+    """Build the final HTML by filling the template placeholders in one pass."""
+    if isinstance(template, str):
+        template = compile_template(template)
+    return template.render(build_values(profile, content, theme))
+
+
+def load_profile(profile_dir):
+    """Load every profile YAML file into one dict keyed by file stem."""
+    return {
+        "identity": load_yaml(os.path.join(profile_dir, "identity.yaml")),
+        "experience": load_yaml(os.path.join(profile_dir, "experience.yaml")),
+        "interests": load_yaml(os.path.join(profile_dir, "interests.yaml")),
+        "preferences": load_yaml(os.path.join(profile_dir, "preferences.yaml")),
+        "sources": load_yaml(os.path.join(profile_dir, "sources.yaml")),
     }
 
-    # Load content
-    content = {
-        "articles": load_json(os.path.join(args.content_dir, "rss.json")),
-        "jobs": load_json(os.path.join(args.content_dir, "jobs.json")),
-        "events": load_json(os.path.join(args.content_dir, "events.json")),
+
+def load_content(content_dir):
+    """Load the fetcher JSON outputs from a content directory."""
+    return {
+        "articles": load_json(os.path.join(content_dir, "rss.json")),
+        "jobs": load_json(os.path.join(content_dir, "jobs.json")),
+        "events": load_json(os.path.join(content_dir, "events.json")),
     }
 
+
+def render(profile, content, output):
+    """Render an edition from an already-loaded profile and content and write it."""
     # Get theme
     theme = get_theme(profile.get("preferences", {}))
 
-    # Load template
-    with open(TEMPLATE_PATH, "r", encoding="utf-8") as f:
-        template = f.read()
-
-    # Build HTML
-    html = build_html(template, profile, content, theme)
+    # Compiled template (cached until assets/template.html changes)
+    template = load_template(TEMPLATE_PATH)
 
-    # Write output
-    os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
-    with open(args.output, "w", encoding="utf-8") as f:
-        f.write(html)
+    # Fill placeholders and stream the page to disk
+    template.render_to_file(output, build_values(profile, content, theme))
 
     total_items = len(content["articles"]) + len(content["jobs"]) + len(content["events"])
-    print(f"Generated daily newspaper: {args.output}")
+    print(f"Generated daily newspaper: {output}")
     print(f"  Theme: {profile['preferences'].get('design', {}).get('theme', 'modern-minimalist')}")
     print(f"  Total content items: {total_items}")
     print(f"  Articles: {len(content['articles'])} (showing max {MAX_ITEMS})")
@@ -760,5 +793,151 @@ def main():
     print(f"  Events: {len(content['events'])} (showing max {MAX_ITEMS})")
 
 
+# ---------------------------------------------------------------------------
+# Batch rendering: many dates and/or themes in one process pool
+# ---------------------------------------------------------------------------
+
+_batch = {}  # per-worker shared state, filled once by _init_batch()
+
+
+def _init_batch(profile_dir, store_path):
+    """Load everything editions share, once per worker process."""
+    _batch["profile"] = load_profile(profile_dir)
+    _batch["learned"] = load_learned_preferences()
+    _batch["template"] = load_template(TEMPLATE_PATH)
+    _batch["seen"] = load_seen()
+    _batch["store"] = content_store.ContentStore(store_path)
+
+
+def edition_time(day):
+    """Timestamp for re-rendering edition `day`: that date at the current UTC time."""
+    return datetime.combine(datetime.fromisoformat(day).date(), datetime.now(timezone.utc).timetz())
+
+
+def _render_edition(task):
+    day, theme_name, output = task
+    profile = _batch["profile"]
+    content = _batch["store"].load_content(day)
+    if theme_name:
+        theme = THEMES[theme_name]
+    else:
+        theme = get_theme(profile.get("preferences", {}))
+    values = build_values(profile, content, theme, now=edition_time(day),
+                          learned=_batch["learned"], seen=_batch["seen"], update_seen=False)
+    _batch["template"].render_to_file(output, values)
+    return output
+
+
+def batch_tasks(days, themes, output_dir):
+    """(day, theme, output path) per edition; themed copies get a `-<theme>` suffix."""
+    tasks = []
+    for day in days:
+        for theme_name in themes or [None]:
+            name = f"{day}-{theme_name}.html" if theme_name else f"{day}.html"
+            tasks.append((day, theme_name, os.path.join(output_dir, name)))
+    return tasks
+
+
+def render_batch(profile_dir, days, themes=None, output_dir=ARCHIVE_DIR,
+                 store_path=content_store.STORE_PATH, workers=None):
+    """Re-render stored editions for `days` (x `themes`) over a process pool.
+
+    Shared state (profile, learned preferences, compiled template, shown
+    history) is loaded once per worker; each edition reads its content from
+    the content store snapshot for its day. Days without a snapshot are
+    skipped with a warning rather than rendered empty over an existing
+    edition. The shown-history is read-only here, so backfills never disturb
+    day-over-day novelty. Finished pages are externalized into output/assets/
+    like the daily run's, sequentially, since workers would race on shared
+    asset files.
+    """
+    with content_store.ContentStore(store_path) as store:
+        stored = {d for kind in content_store.KINDS for d in store.days(kind)}
+    for day in days:
+        if day not in stored:
+            print(f"WARNING: no stored edition for {day}, skipping", file=sys.stderr)
+    days = [d for d in days if d in stored]
+    if not days:
+        print("No stored editions to render", file=sys.stderr)
+        return []
+    tasks = batch_tasks(days, themes, output_dir)
+    workers = max(1, min(workers or os.cpu_count() or 1, len(tasks)))
+    if workers == 1:
+        _init_batch(profile_dir, store_path)
+        outputs = [_render_edition(t) for t in tasks]
+    else:
+        chunksize = max(1, len(tasks) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_batch,
+                                 initargs=(profile_dir, store_path)) as pool:
+            outputs = list(pool.map(_render_edition, tasks, chunksize=chunksize))
+    writer = externalize_assets.AssetWriter()
+    for path in outputs:
+        try:
+            externalize_assets.externalize_file(path, writer)
+        except (OSError, UnicodeDecodeError) as e:
+            print(f"WARNING: could not externalize {path}: {e}", file=sys.stderr)
+    print(f"Rendered {len(outputs)} editions ({len(days)} dates x "
+          f"{len(themes or [None])} themes, {workers} workers) → {output_dir}")
+    return outputs
+
+
+def _split_list(value):
+    return [v.strip() for v in value.split(",") if v.strip()]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render PersonalMentor daily newspaper HTML")
+    parser.add_argument("--profile-dir", required=True, help="Path to profile/ directory")
+    parser.add_argument("--content-dir", help="Path to content JSON files directory")
+    parser.add_argument("--store", nargs="?", const=content_store.STORE_PATH, default=None,
+                        help="Read content from the SQLite content store instead "
+                             "(default path: memory/content.db)")
+    parser.add_argument("--date", default=None,
+                        help="Edition day (YYYY-MM-DD) to load from --store (default: today)")
+    parser.add_argument("--output", help="Output HTML file path")
+    batch = parser.add_argument_group("batch mode (reads editions from the content store)")
+    batch.add_argument("--dates",
+                       help="Comma-separated edition days to re-render, or 'all' for every stored day")
+    batch.add_argument("--themes",
+                       help=f"Comma-separated themes to render, or 'all' ({', '.join(THEMES)})")
+    batch.add_argument("--output-dir", default=ARCHIVE_DIR,
+                       help="Directory for batch output (default: output/daily)")
+    batch.add_argument("--jobs", type=int, default=None,
+                       help="Worker processes for batch mode (default: CPU count)")
+    args = parser.parse_args()
+
+    if args.dates or args.themes:
+        store_path = args.store or content_store.STORE_PATH
+        if args.dates == "all":
+            with content_store.ContentStore(store_path) as store:
+                days = sorted({d for kind in content_store.KINDS for d in store.days(kind)})
+        elif args.dates:
+            days = _split_list(args.dates)
+        else:
+            days = [args.date or content_store.today()]
+        themes = list(THEMES) if args.themes == "all" else _split_list(args.themes or "")
+        unknown = [t for t in themes if t not in THEMES]
+        if unknown:
+            parser.error(f"unknown theme(s): {', '.join(unknown)}")
+        bad_days = [d for d in days if day_number(d) is None]
+        if bad_days:
+            parser.error(f"invalid date(s): {', '.join(bad_days)}")
+        if not days:
+            parser.error("no edition days to render")
+        render_batch(args.profile_dir, days, themes, args.output_dir, store_path, args.jobs)
+        return
+
+    if not args.output:
+        parser.error("--output is required (or use --dates / --themes for batch mode)")
+    if bool(args.content_dir) == bool(args.store):
+        parser.error("exactly one of --content-dir or --store is required")
+
+    if args.store:
+        content = content_store.load_content(args.store, args.date)
+    else:
+        content = load_content(args.content_dir)
+    render(load_profile(args.profile_dir), content, args.output)
+
+
 if __name__ == "__main__":
     main()
@@ -1,13 +1,27 @@
 #!/usr/bin/env python3
 """PersonalMentor — Daily Newspaper Pipeline (cross-platform).
 
-Drop-in replacement for run_daily.sh that works on macOS, Linux, and Windows.
+The one daily pipeline, on macOS, Linux, and Windows; run_daily.sh and the
+onboarding UI's "generate" button both launch this script.
+
+Steps run in-process by default: the fetchers, feedback analysis, renderer and
+memory-manager scripts are imported as libraries and scheduled as a small DAG
+(see pipeline.py), sharing the loaded profile and fetched content in memory.
+Pass --subprocess to run every step in its own interpreter as before, or
+--async to fetch all sources on one asyncio event loop (requires aiohttp).
+Fetched content is saved to the SQLite content store (memory/content.db) as
+today's edition; the renderer reads it back from there in --subprocess mode.
+Only --subprocess also dumps each fetcher's output to a temp dir
+(pm_daily_<date>) for debugging.
 
 Usage:
-    python skills/daily-newspaper/scripts/run_daily.py
+    python skills/daily-newspaper/scripts/run_daily.py [--subprocess | --async]
 """
 
+import argparse
 import glob
+import importlib
+import importlib.util
 import os
 import platform
 import shutil
@@ -26,6 +40,13 @@ from urllib.request import urlopen
 # ---------------------------------------------------------------------------
 SCRIPT_DIR = Path(__file__).resolve().parent
 PROJECT_ROOT = SCRIPT_DIR.parent.parent.parent
+CONTENT_STORE = PROJECT_ROOT / "memory" / "content.db"
+
+# Per-step deadlines (seconds) for the in-process DAG, matching the timeouts
+# of the --subprocess calls. A fetch or feedback step that overruns is
+# abandoned and the edition is rendered without it.
+FETCH_TIMEOUT = 120
+FEEDBACK_TIMEOUT = 30
 
 
 def _activate_venv():
@@ -73,6 +94,14 @@ def _run(args, **kwargs):
     return subprocess.run(args, **kwargs)
 
 
+def _import_script(skill: str, name: str):
+    """Import a sibling skill's script as a module (adds its dir to sys.path)."""
+    scripts_dir = str(PROJECT_ROOT / "skills" / skill / "scripts")
+    if scripts_dir not in sys.path:
+        sys.path.insert(0, scripts_dir)
+    return importlib.import_module(name)
+
+
 def _health_check(port=9847) -> bool:
     """Return True if a service responds on localhost:<port>/health."""
     try:
@@ -126,25 +155,26 @@ def fetch_content(content_dir: Path, script: str, extra_args: list[str] | None =
         return name, False
 
 
-def fetch_all_parallel(content_dir: Path):
+def fetch_all_parallel(content_dir: Path, today: str):
     """Fetch RSS, jobs, and events in parallel."""
     print("[1-3/10] Fetching RSS feeds, job listings, and events in parallel...")
+    store_args = ["--store", str(CONTENT_STORE), "--date", today]
     tasks = [
         (
             str(PROJECT_ROOT / "skills" / "web-scraper" / "scripts" / "fetch_rss.py"),
             ["--config", str(PROJECT_ROOT / "profile" / "sources.yaml"),
-             "--output", str(content_dir / "rss.json")],
+             "--output", str(content_dir / "rss.json")] + store_args,
         ),
         (
             str(PROJECT_ROOT / "skills" / "web-scraper" / "scripts" / "fetch_jobs.py"),
             ["--config", str(PROJECT_ROOT / "profile" / "sources.yaml"),
              "--interests", str(PROJECT_ROOT / "profile" / "interests.yaml"),
-             "--output", str(content_dir / "jobs.json")],
+             "--output", str(content_dir / "jobs.json")] + store_args,
         ),
         (
             str(PROJECT_ROOT / "skills" / "web-scraper" / "scripts" / "fetch_events.py"),
             ["--config", str(PROJECT_ROOT / "profile" / "sources.yaml"),
-             "--output", str(content_dir / "events.json")],
+             "--output", str(content_dir / "events.json")] + store_args,
         ),
     ]
     with ThreadPoolExecutor(max_workers=3) as pool:
@@ -176,15 +206,19 @@ def analyze_feedback():
         print("  No feedback yet — skipping.")
 
 
-def render_newspaper(content_dir: Path, output_file: Path):
+def render_newspaper(today: str, output_file: Path):
     print("[6/8] Rendering newspaper...")
     _run([
         _python(),
         str(PROJECT_ROOT / "skills" / "daily-newspaper" / "scripts" / "render_newspaper.py"),
         "--profile-dir", str(PROJECT_ROOT / "profile"),
-        "--content-dir", str(content_dir),
+        "--store", str(CONTENT_STORE),
+        "--date", today,
         "--output", str(output_file),
     ], check=True)
+    result = _run([_python(), str(SCRIPT_DIR / "externalize_assets.py"), str(output_file)])
+    if result.returncode != 0:
+        print("  WARNING: asset externalization failed, page stays self-contained")
 
 
 def start_feedback_server():
@@ -210,12 +244,11 @@ def register_artifact(today: str):
         "--item-count", "0",
         "--sources", "rss,jobs,events",
     ])
-    _run([
-        _python(),
-        str(PROJECT_ROOT / "skills" / "memory-manager" / "scripts" / "log_action.py"),
-        "--action", "artifact_generated",
-        "--detail", f"Daily newspaper for {today}",
-    ])
+    try:
+        _import_script("memory-manager", "log_action").log_action(
+            "artifact_generated", f"Daily newspaper for {today}")
+    except Exception as exc:
+        print(f"  WARNING: could not log artifact ({exc})")
 
 
 def cleanup_old_temp(today: str):
@@ -235,33 +268,181 @@ def cleanup_old_temp(today: str):
 
 
 def git_push(today: str):
-    """Commit and push today's newspaper (if inside a git repo)."""
+    """Commit and push today's newspaper (if inside a git repo).
+
+    publish.py skips the rebase when the remote hasn't moved and, when the
+    remote is unreachable, queues the edition for the next run's commit.
+    """
     print("[10] Pushing to GitHub...")
     try:
-        _run(["git", "rev-parse", "--is-inside-work-tree"],
-             check=True, capture_output=True)
-    except Exception:
-        print("  Not a git repo — skipping.")
+        publish = _import_script("daily-newspaper", "publish")
+        publish.publish([f"output/daily/{today}.html"], repo_dir=str(PROJECT_ROOT))
+    except Exception as exc:
+        print(f"  WARNING: git push failed ({exc})")
+
+
+# ---------------------------------------------------------------------------
+# In-process pipeline steps (each gets a context snapshot, returns new entries)
+# ---------------------------------------------------------------------------
+
+SECTIONS = ("articles", "jobs", "events")
+
+
+def step_load_profile(ctx):
+    render = _import_script("daily-newspaper", "render_newspaper")
+    return {"profile": render.load_profile(str(PROJECT_ROOT / "profile"))}
+
+
+def _fetch_step(name, module, section, fetch):
+    """Build a fetch step that degrades to empty content on any failure."""
+    def step(ctx):
+        items = []
+        try:
+            mod = _import_script("web-scraper", module)
+            items = fetch(mod, ctx["profile"])
+        except (Exception, SystemExit) as exc:
+            print(f"  WARNING: {name} failed ({exc}), continuing with empty data")
+        return {section: items}
+    return step
+
+
+step_fetch_rss = _fetch_step(
+    "fetch_rss", "fetch_rss", "articles",
+    lambda mod, profile: mod.fetch_all(profile["sources"].get("rss_feeds") or []),
+)
+step_fetch_jobs = _fetch_step(
+    "fetch_jobs", "fetch_jobs", "jobs",
+    lambda mod, profile: mod.fetch_all(
+        profile["sources"].get("job_boards") or [], profile["interests"]),
+)
+step_fetch_events = _fetch_step(
+    "fetch_events", "fetch_events", "events",
+    lambda mod, profile: mod.fetch_all(profile["sources"].get("event_sources") or []),
+)
+
+
+def step_fetch_async(ctx):
+    """Fetch RSS, jobs and events together on one event loop (async_fetch.py)."""
+    content = {section: [] for section in SECTIONS}
+    try:
+        engine = _import_script("web-scraper", "async_fetch")
+        content = engine.fetch_all(ctx["profile"]["sources"], ctx["profile"]["interests"])
+    except (Exception, SystemExit) as exc:
+        print(f"  WARNING: async fetch failed ({exc}), continuing with empty data")
+    return {section: content[section] for section in SECTIONS}
+
+
+def step_save_content(ctx):
+    """Save the fetched sections as today's edition in the content store."""
+    try:
+        store = _import_script("web-scraper", "content_store")
+    except Exception as exc:
+        print(f"  WARNING: could not open content store ({exc})")
         return
+    for section in SECTIONS:
+        try:
+            store.save_items(section, ctx[section], str(CONTENT_STORE), ctx["today"])
+        except Exception as exc:
+            print(f"  WARNING: could not save {section} to content store ({exc})")
+
 
-    _run(["git", "add", f"output/daily/{today}.html"])
-    result = _run(["git", "diff", "--cached", "--quiet"])
-    if result.returncode == 0:
-        print("  No new changes to push.")
+def step_ingest_github_feedback(ctx):
+    print("[5/8] Ingesting GitHub feedback issues...")
+    try:
+        _import_script("daily-newspaper", "ingest_github_feedback").main()
+    except Exception:
+        print("  WARNING: GitHub feedback ingestion failed, continuing")
+
+
+def step_analyze_feedback(ctx):
+    print("[6/8] Analyzing feedback...")
+    if not (PROJECT_ROOT / "memory" / "feedback.jsonl").is_file():
+        print("  No feedback yet — skipping.")
         return
+    try:
+        _import_script("daily-newspaper", "analyze_feedback").main()
+    except Exception:
+        print("  WARNING: Feedback analysis failed, using defaults")
+
+
+def step_render(ctx):
+    print("[6/8] Rendering newspaper...")
+    render = _import_script("daily-newspaper", "render_newspaper")
+    content = {section: ctx[section] for section in SECTIONS}
+    render.render(ctx["profile"], content, str(ctx["output_file"]))
+    try:
+        _import_script("daily-newspaper", "externalize_assets").externalize_file(
+            str(ctx["output_file"]))
+    except Exception as exc:
+        print(f"  WARNING: asset externalization failed ({exc}), page stays self-contained")
+
+
+def step_register_artifact(ctx):
+    print("[8/8] Registering artifact...")
+    today = ctx["today"]
+    try:
+        registry = _import_script("memory-manager", "register_artifact")
+        registry.register_artifact(
+            "daily-newspaper", f"output/daily/{today}.html",
+            sections=["news", "jobs", "events"], item_count=0,
+            sources=["rss", "jobs", "events"],
+        )
+        _import_script("memory-manager", "log_action").log_action(
+            "artifact_generated", f"Daily newspaper for {today}")
+    except Exception as exc:
+        print(f"  WARNING: artifact registration failed ({exc})")
+
+
+def run_in_process(today: str, output_file: Path, use_async=False):
+    """Run fetch → analyze → render → register as one in-process DAG."""
+    from pipeline import Pipeline
 
-    _run(["git", "commit", "-m", f"Daily newspaper {today}"])
-    # Rebase on the remote first so a remote that is ahead (e.g. a push from
-    # another machine) doesn't reject the push with "fetch first". --autostash
-    # protects any unrelated uncommitted changes in the working tree.
-    pull = _run(["git", "pull", "--rebase", "--autostash", "origin", "main"])
-    if pull.returncode != 0:
-        print("  WARNING: git pull --rebase failed")
-    result = _run(["git", "push", "origin", "main"])
-    if result.returncode == 0:
-        print("  Pushed to GitHub.")
+    if use_async and importlib.util.find_spec("aiohttp") is None:
+        print("  WARNING: aiohttp not installed, falling back to threaded fetchers")
+        use_async = False
+
+    ctx = {"today": today, "output_file": output_file}
+    ctx.update({section: [] for section in SECTIONS})
+    print("[1-3/10] Fetching RSS feeds, job listings, and events in parallel...")
+    pipeline = Pipeline(max_workers=4).add("profile", step_load_profile)
+    if use_async:
+        pipeline.add("fetch", step_fetch_async, after=["profile"],
+                     timeout=FETCH_TIMEOUT, optional=True)
+        fetch_steps = ["fetch"]
     else:
-        print("  WARNING: git push failed.")
+        (pipeline
+            .add("fetch_rss", step_fetch_rss, after=["profile"],
+                 timeout=FETCH_TIMEOUT, optional=True)
+            .add("fetch_jobs", step_fetch_jobs, after=["profile"],
+                 timeout=FETCH_TIMEOUT, optional=True)
+            .add("fetch_events", step_fetch_events, after=["profile"],
+                 timeout=FETCH_TIMEOUT, optional=True))
+        fetch_steps = ["fetch_rss", "fetch_jobs", "fetch_events"]
+    (pipeline
+        .add("ingest_feedback", step_ingest_github_feedback,
+             timeout=FEEDBACK_TIMEOUT, optional=True)
+        .add("analyze_feedback", step_analyze_feedback, after=["ingest_feedback"],
+             timeout=FEEDBACK_TIMEOUT, optional=True)
+        .add("save_content", step_save_content, after=fetch_steps)
+        .add("render", step_render, after=fetch_steps + ["analyze_feedback"])
+        .add("register", step_register_artifact, after=["render"])
+        .run(ctx))
+    return ctx
+
+
+def run_subprocesses(today: str, content_dir: Path, output_file: Path):
+    """Run every step in its own Python interpreter (the --subprocess mode)."""
+    # Steps 2-4: Parallel fetchers
+    fetch_all_parallel(content_dir, today)
+
+    # Step 5: GitHub feedback
+    ingest_github_feedback()
+
+    # Step 6: Analyze feedback
+    analyze_feedback()
+
+    # Step 7: Render
+    render_newspaper(today, output_file)
 
 
 # ---------------------------------------------------------------------------
@@ -269,6 +450,13 @@ def git_push(today: str):
 # ---------------------------------------------------------------------------
 
 def main():
+    parser = argparse.ArgumentParser(description="Run the PersonalMentor daily newspaper pipeline")
+    parser.add_argument("--subprocess", action="store_true",
+                        help="Run each step in a separate Python process instead of in-process")
+    parser.add_argument("--async", dest="use_async", action="store_true",
+                        help="Fetch all sources concurrently with asyncio (requires aiohttp)")
+    args = parser.parse_args()
+
     _activate_venv()
     _load_dotenv()
 
@@ -285,30 +473,27 @@ def main():
     print()
 
     # Step 1: Create working directories
-    content_dir.mkdir(parents=True, exist_ok=True)
+    if args.subprocess:
+        content_dir.mkdir(parents=True, exist_ok=True)
     (PROJECT_ROOT / "output" / "daily").mkdir(parents=True, exist_ok=True)
 
-    # Steps 2-4: Parallel fetchers
-    fetch_all_parallel(content_dir)
-
-    # Step 5: GitHub feedback
-    ingest_github_feedback()
-
-    # Step 6: Analyze feedback
-    analyze_feedback()
-
-    # Step 7: Render
-    render_newspaper(content_dir, output_file)
+    # Steps 2-7: fetch, feedback, render (in-process DAG unless --subprocess)
+    if args.subprocess:
+        run_subprocesses(today, content_dir, output_file)
+    else:
+        run_in_process(today, output_file, use_async=args.use_async)
 
     # Step 8: Feedback server
     start_feedback_server()
 
-    # Step 9: Register artifact
-    register_artifact(today)
+    # Step 9: Register artifact (the in-process DAG already did this)
+    if args.subprocess:
+        register_artifact(today)
 
     # Cleanup old temp dirs
     cleanup_old_temp(today)
-    print(f"DEBUG: Content dir preserved at {content_dir}")
+    if args.subprocess:
+        print(f"DEBUG: Content dir preserved at {content_dir}")
 
     # Push to GitHub
     git_push(today)
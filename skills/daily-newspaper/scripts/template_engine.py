@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""Single-pass `{{placeholder}}` templates.
+
+A template is parsed once into alternating literal and placeholder segments;
+rendering fills every placeholder in one pass (one `"".join`, or a direct
+stream of segments to a file) instead of one full-string copy per
+`str.replace`. Compiled templates are cached per file and reused until the
+file's mtime or size changes.
+
+Placeholders without a value are left in the output verbatim, and values are
+inserted as-is, so text that happens to contain `{{...}}` is never expanded.
+"""
+
+import os
+import re
+import threading
+
+PLACEHOLDER_RE = re.compile(r"\{\{(\w+)\}\}")
+
+_cache = {}  # abspath -> ((mtime_ns, size), Template)
+_cache_lock = threading.Lock()
+
+
+class Template:
+    """A compiled template: literals[i] precedes placeholder names[i]."""
+
+    __slots__ = ("literals", "names")
+
+    def __init__(self, text):
+        parts = PLACEHOLDER_RE.split(text)
+        self.literals = parts[0::2]
+        self.names = parts[1::2]
+
+    def placeholders(self):
+        """Distinct placeholder names, in order of first use."""
+        return list(dict.fromkeys(self.names))
+
+    def segments(self, values):
+        """Yield the rendered output piece by piece."""
+        literals = self.literals
+        for i, name in enumerate(self.names):
+            yield literals[i]
+            value = values.get(name)
+            yield "{{" + name + "}}" if value is None else str(value)
+        yield literals[-1]
+
+    def render(self, values):
+        return "".join(self.segments(values))
+
+    def render_to_file(self, path, values):
+        """Stream the rendered output straight to `path`."""
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            f.writelines(self.segments(values))
+
+
+def compile_template(text):
+    return Template(text)
+
+
+def load_template(path):
+    """Compiled template for `path`, recompiled only when the file changes."""
+    path = os.path.abspath(path)
+    st = os.stat(path)
+    stamp = (st.st_mtime_ns, st.st_size)
+    with _cache_lock:
+        cached = _cache.get(path)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    with open(path, "r", encoding="utf-8") as f:
+        template = Template(f.read())
+    with _cache_lock:
+        _cache[path] = (stamp, template)
+    return template
@@ -0,0 +1,51 @@
+"""Tests for the in-process DAG runner (run with: python -m pytest skills/daily-newspaper/tests)."""
+
+import os
+import sys
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "scripts"))
+
+from pipeline import Pipeline, StepTimeout  # noqa: E402
+
+
+def test_results_are_merged_for_dependents():
+    seen = {}
+
+    def render(ctx):
+        seen.update(ctx)
+
+    ctx = (Pipeline()
+           .add("fetch", lambda ctx: {"articles": [1, 2]})
+           .add("render", render, after=["fetch"])
+           .run({"today": "2026-04-20"}))
+    assert seen["articles"] == [1, 2]
+    assert ctx["articles"] == [1, 2]
+
+
+def test_late_result_of_a_timed_out_step_is_discarded():
+    seen = {}
+
+    def slow_fetch(ctx):
+        time.sleep(0.3)
+        ctx["late"] = True  # writes to its own snapshot only
+        return {"articles": ["late"]}
+
+    def render(ctx):
+        seen.update(ctx)
+
+    ctx = (Pipeline()
+           .add("fetch", slow_fetch, timeout=0.05, optional=True)
+           .add("render", render, after=["fetch"])
+           .run({"articles": []}))
+    time.sleep(0.4)  # let the abandoned step finish
+    assert seen["articles"] == []
+    assert ctx == {"articles": []}
+
+
+def test_required_step_timeout_is_raised():
+    pipeline = Pipeline().add("fetch", lambda ctx: time.sleep(0.3), timeout=0.05)
+    with pytest.raises(StepTimeout):
+        pipeline.run({})
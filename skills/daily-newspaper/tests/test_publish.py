@@ -0,0 +1,94 @@
+"""publish.py against a temporary bare remote."""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "scripts"))
+
+import publish  # noqa: E402
+
+
+def git(cwd, *args):
+    return subprocess.run(["git", *args], cwd=cwd, check=True, capture_output=True,
+                          text=True).stdout.strip()
+
+
+def clone(remote, path):
+    subprocess.run(["git", "clone", "-q", str(remote), str(path)], check=True,
+                   capture_output=True)
+    git(path, "config", "user.email", "test@example.com")
+    git(path, "config", "user.name", "Test")
+    git(path, "checkout", "-q", "-B", "main")
+    return path
+
+
+def write(repo, rel, text):
+    path = os.path.join(repo, rel)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text)
+    return rel
+
+
+def remote_files(remote):
+    return git(remote, "ls-tree", "-r", "--name-only", "main").splitlines()
+
+
+@pytest.fixture
+def setup(tmp_path):
+    remote = tmp_path / "remote.git"
+    subprocess.run(["git", "init", "-q", "--bare", "-b", "main", str(remote)], check=True)
+    local = clone(remote, tmp_path / "local")
+    write(local, "README.md", "newspaper\n")
+    git(local, "add", "README.md")
+    git(local, "commit", "-q", "-m", "init")
+    git(local, "push", "-q", "origin", "main")
+    return remote, local, str(tmp_path / "publish-queue.json")
+
+
+def test_unchanged_remote_pushes_without_rebase(setup, capsys):
+    remote, local, queue = setup
+    rel = write(local, "output/daily/2026-04-20.html", "<html>20</html>")
+
+    assert publish.publish([rel], str(local), queue_path=queue)
+    assert "rebasing" not in capsys.readouterr().out
+    assert rel in remote_files(remote)
+    assert git(remote, "log", "-1", "--format=%s", "main") == "Daily newspaper 2026-04-20"
+
+
+def test_moved_remote_commits_then_rebases(setup, tmp_path, capsys):
+    remote, local, queue = setup
+    other = clone(remote, tmp_path / "other")
+    # The other writer already published a file we also have untracked.
+    write(other, "output/daily/2026-04-19.html", "<html>19</html>")
+    git(other, "add", "output")
+    git(other, "commit", "-q", "-m", "other")
+    git(other, "push", "-q", "origin", "main")
+
+    paths = [write(local, "output/daily/2026-04-19.html", "<html>19</html>"),
+             write(local, "output/daily/2026-04-20.html", "<html>20</html>")]
+    assert publish.publish(paths, str(local), queue_path=queue)
+    assert "rebasing" in capsys.readouterr().out
+    assert set(paths) <= set(remote_files(remote))
+    assert git(remote, "log", "--format=%s", "main").splitlines()[1] == "other"
+    assert git(local, "status", "--porcelain") == ""
+
+
+def test_unreachable_remote_queues_and_next_run_pushes(setup, tmp_path):
+    remote, local, queue = setup
+    first = write(local, "output/daily/2026-04-20.html", "<html>20</html>")
+    git(local, "remote", "set-url", "origin", str(tmp_path / "missing.git"))
+
+    assert not publish.publish([first], str(local), queue_path=queue)
+    assert publish.load_queue(queue) == [first]
+    assert git(local, "rev-list", "--count", "HEAD") == "1"  # nothing committed
+
+    git(local, "remote", "set-url", "origin", str(remote))
+    second = write(local, "output/daily/2026-04-21.html", "<html>21</html>")
+    assert publish.publish([second], str(local), queue_path=queue)
+    assert {first, second} <= set(remote_files(remote))
+    assert not os.path.exists(queue)
+    assert git(remote, "log", "-1", "--format=%s", "main").startswith("Daily newspapers 2026-04-20")
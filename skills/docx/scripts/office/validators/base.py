@@ -2,12 +2,189 @@
 Base validator with common validation logic for document files.
 """
 
+import os
 import re
+import threading
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
-import defusedxml.minidom
 import lxml.etree
 
+from .model import DocumentModel, PartVisitor, RepairVisitor, walk_part
+
+
+_schema_cache = {}
+_schema_cache_lock = threading.Lock()
+
+
+def load_schema(schema_path):
+    """Compiled XMLSchema for `schema_path`, compiled once per process.
+
+    The OOXML schemas import dozens of other XSDs, so compiling one takes far
+    longer than validating a part against it. Every validator in the process
+    shares the compiled schema.
+    """
+    key = str(Path(schema_path).resolve())
+    with _schema_cache_lock:
+        schema = _schema_cache.get(key)
+        if schema is None:
+            with open(key, "rb") as xsd_file:
+                parser = lxml.etree.XMLParser()
+                xsd_doc = lxml.etree.parse(xsd_file, parser=parser, base_url=key)
+            schema = _schema_cache[key] = lxml.etree.XMLSchema(xsd_doc)
+    return schema
+
+
+_worker_validator = None
+
+
+def _init_worker(validator):
+    global _worker_validator
+    _worker_validator = validator
+
+
+def _check_part_in_worker(xml_file):
+    return _worker_validator._check_part(xml_file)
+
+
+class UniqueIdsCheck(PartVisitor):
+    """Per-part ID check: a list of ("error", message) and
+    ("global", id, line, tag) events in document order."""
+
+    def start(self, root):
+        self.alternate_content = f"{{{self.validator.MC_NAMESPACE}}}AlternateContent"
+        self.file_ids = {}
+
+    def visit(self, elem, walk):
+        # mc:AlternateContent fallbacks may repeat IDs legitimately.
+        if elem.tag == self.alternate_content or walk.inside(self.alternate_content):
+            return
+        validator = self.validator
+        tag = (
+            elem.tag.split("}")[-1].lower()
+            if "}" in elem.tag
+            else elem.tag.lower()
+        )
+
+        if tag not in validator.UNIQUE_ID_REQUIREMENTS:
+            return
+        if any(
+            ancestor.tag.split("}")[-1].lower() in validator.EXCLUDED_ID_CONTAINERS
+            for ancestor in elem.iterancestors()
+        ):
+            return
+
+        attr_name, scope = validator.UNIQUE_ID_REQUIREMENTS[tag]
+
+        id_value = None
+        for attr, value in elem.attrib.items():
+            attr_local = (
+                attr.split("}")[-1].lower()
+                if "}" in attr
+                else attr.lower()
+            )
+            if attr_local == attr_name:
+                id_value = value
+                break
+
+        if id_value is None:
+            return
+        if scope == "global":
+            self.errors.append(("global", id_value, elem.sourceline, tag))
+        elif scope == "file":
+            seen = self.file_ids.setdefault((tag, attr_name), {})
+            if id_value in seen:
+                self.errors.append((
+                    "error",
+                    f"Line {elem.sourceline}: Duplicate {attr_name}='{id_value}' in <{tag}> "
+                    f"(first occurrence at line {seen[id_value]})",
+                ))
+            else:
+                seen[id_value] = elem.sourceline
+
+    def fail(self, exc):
+        self.errors.append(("error", f"Error: {exc}"))
+
+
+class RelationshipIdsCheck(PartVisitor):
+    """r:id / r:embed / r:link attributes must name a relationship of the right type."""
+
+    RID_ATTRS = ("id", "embed", "link")
+
+    def applies(self):
+        self.rels_file = self.xml_file.parent / "_rels" / f"{self.xml_file.name}.rels"
+        return self.xml_file.suffix != ".rels" and self.rels_file.exists()
+
+    def start(self, root):
+        validator = self.validator
+        rels_root = validator.model.tree(self.rels_file).getroot()
+        self.rid_to_type = {}
+
+        for rel in rels_root.findall(
+            f".//{{{validator.PACKAGE_RELATIONSHIPS_NAMESPACE}}}Relationship"
+        ):
+            rid = rel.get("Id")
+            rel_type = rel.get("Type", "")
+            if rid:
+                if rid in self.rid_to_type:
+                    rels_rel_path = self.rels_file.relative_to(validator.unpacked_dir)
+                    self.errors.append(
+                        f"  {rels_rel_path}: Line {rel.sourceline}: "
+                        f"Duplicate relationship ID '{rid}' (IDs must be unique)"
+                    )
+                type_name = rel_type.split("/")[-1] if "/" in rel_type else rel_type
+                self.rid_to_type[rid] = type_name
+
+        self.rid_attrs = [
+            (f"{{{validator.OFFICE_RELATIONSHIPS_NAMESPACE}}}{name}", name)
+            for name in self.RID_ATTRS
+        ]
+
+    def visit(self, elem, walk):
+        validator = self.validator
+        rid_to_type = self.rid_to_type
+        for attr, attr_name in self.rid_attrs:
+            rid_attr = elem.get(attr)
+            if not rid_attr:
+                continue
+            elem_name = elem.tag.split("}")[-1] if "}" in elem.tag else elem.tag
+
+            if rid_attr not in rid_to_type:
+                self.errors.append(
+                    f"  {self.rel_path}: Line {elem.sourceline}: "
+                    f"<{elem_name}> r:{attr_name} references non-existent relationship '{rid_attr}' "
+                    f"(valid IDs: {', '.join(sorted(rid_to_type.keys())[:5])}{'...' if len(rid_to_type) > 5 else ''})"
+                )
+            elif attr_name == "id" and validator.ELEMENT_RELATIONSHIP_TYPES:
+                expected_type = validator._get_expected_relationship_type(elem_name)
+                if expected_type:
+                    actual_type = rid_to_type[rid_attr]
+                    if expected_type not in actual_type.lower():
+                        self.errors.append(
+                            f"  {self.rel_path}: Line {elem.sourceline}: "
+                            f"<{elem_name}> references '{rid_attr}' which points to '{actual_type}' "
+                            f"but should point to a '{expected_type}' relationship"
+                        )
+
+    def fail(self, exc):
+        self.errors.append(f"  Error processing {self.rel_path}: {exc}")
+
+
+class WhitespaceRepair(RepairVisitor):
+    """Add xml:space="preserve" to prefixed text elements with edge whitespace."""
+
+    def visit(self, elem, walk):
+        if not isinstance(elem.tag, str) or not elem.prefix or not elem.tag.endswith("}t"):
+            return
+        text = elem.text
+        if text and (text.startswith((' ', '\t')) or text.endswith((' ', '\t'))):
+            space_attr = f"{{{self.validator.XML_NAMESPACE}}}space"
+            if elem.get(space_attr) != "preserve":
+                elem.set(space_attr, "preserve")
+                text_preview = repr(text[:30]) + "..." if len(text) > 30 else repr(text)
+                print(f"  Repaired: {self.xml_file.name}: Added xml:space='preserve' to {elem.prefix}:t: {text_preview}")
+                self.repairs += 1
+
 
 class BaseSchemaValidator:
 
@@ -91,10 +268,34 @@ class BaseSchemaValidator:
         "http://www.w3.org/XML/1998/namespace",
     }
 
-    def __init__(self, unpacked_dir, original_file=None, verbose=False):
+    # Checks that look at a part as a whole: _check_<name>(xml_file).
+    PART_CHECKS = (
+        "xml",
+        "namespaces",
+        "file_references",
+        "content_type",
+        "xsd",
+    )
+
+    # Checks that look at every node; they share one walk per part.
+    PART_VISITORS = {
+        "unique_ids": UniqueIdsCheck,
+        "relationship_ids": RelationshipIdsCheck,
+    }
+
+    # Repairs, applied in one walk per part to the shared tree.
+    REPAIR_VISITORS = (WhitespaceRepair,)
+
+    def __init__(
+        self, unpacked_dir, original_file=None, verbose=False, jobs=1, model=None
+    ):
         self.unpacked_dir = Path(unpacked_dir).resolve()
         self.original_file = Path(original_file) if original_file else None
         self.verbose = verbose
+        self.jobs = jobs if jobs and jobs > 0 else (os.cpu_count() or 1)
+        self.model = model or DocumentModel(self.unpacked_dir, self.original_file)
+        self._part_results = None  # xml_file -> {check name: result}
+        self._original_errors = {}  # part name -> XSD errors in the original
 
         self.schemas_dir = Path(__file__).parent.parent / "schemas"
 
@@ -106,56 +307,105 @@ class BaseSchemaValidator:
         if not self.xml_files:
             print(f"Warning: No XML files found in {self.unpacked_dir}")
 
+    def __getstate__(self):
+        # Worker processes get the settings only; results are per process.
+        state = self.__dict__.copy()
+        state["_part_results"] = None
+        state["_original_errors"] = {}
+        return state
+
     def validate(self):
         raise NotImplementedError("Subclasses must implement the validate method")
 
+    def _walk(self, xml_file, visitor_classes):
+        """Run `visitor_classes` over one shared walk of the part; returns the visitors."""
+        visitors = [cls(self, xml_file) for cls in visitor_classes]
+        active = [v for v in visitors if v.applies()]
+        if active:
+            try:
+                root = self.model.tree(xml_file).getroot()
+            except Exception as e:
+                for visitor in active:
+                    visitor.fail(e)
+            else:
+                walk_part(root, active)
+        return visitors
+
+    def _check_part(self, xml_file):
+        """Run every per-part check on one part; returns {check name: result}."""
+        results = {
+            name: getattr(self, f"_check_{name}")(xml_file)
+            for name in self.PART_CHECKS
+        }
+        names = list(self.PART_VISITORS)
+        visitors = self._walk(xml_file, self.PART_VISITORS.values())
+        results.update(
+            (name, visitor.result()) for name, visitor in zip(names, visitors)
+        )
+        return results
+
+    def _results(self, check):
+        """{xml_file: result} of one per-part check, in self.xml_files order.
+
+        The first call runs all per-part checks over all parts, fanned out
+        across `self.jobs` processes; results come back in file order, so
+        the merged report does not depend on scheduling.
+        """
+        if self._part_results is None:
+            files = self.xml_files
+            if self.jobs > 1 and len(files) > 1:
+                workers = min(self.jobs, len(files))
+                with ProcessPoolExecutor(
+                    max_workers=workers, initializer=_init_worker, initargs=(self,)
+                ) as executor:
+                    results = list(
+                        executor.map(
+                            _check_part_in_worker,
+                            files,
+                            chunksize=max(1, len(files) // (workers * 4)),
+                        )
+                    )
+            else:
+                results = [self._check_part(f) for f in files]
+            self._part_results = dict(zip(files, results))
+        return {f: r[check] for f, r in self._part_results.items()}
+
     def repair(self) -> int:
-        return self.repair_whitespace_preservation()
+        return self._repair(self.REPAIR_VISITORS)
 
     def repair_whitespace_preservation(self) -> int:
-        repairs = 0
+        return self._repair([WhitespaceRepair])
 
+    def _repair(self, visitor_classes):
+        """Apply repair visitors to each part's shared tree; save the parts they changed."""
+        self._part_results = None
+        repairs = 0
         for xml_file in self.xml_files:
-            try:
-                content = xml_file.read_text(encoding="utf-8")
-                dom = defusedxml.minidom.parseString(content)
-                modified = False
-
-                for elem in dom.getElementsByTagName("*"):
-                    if elem.tagName.endswith(":t") and elem.firstChild:
-                        text = elem.firstChild.nodeValue
-                        if text and (text.startswith((' ', '\t')) or text.endswith((' ', '\t'))):
-                            if elem.getAttribute("xml:space") != "preserve":
-                                elem.setAttribute("xml:space", "preserve")
-                                text_preview = repr(text[:30]) + "..." if len(text) > 30 else repr(text)
-                                print(f"  Repaired: {xml_file.name}: Added xml:space='preserve' to {elem.tagName}: {text_preview}")
-                                repairs += 1
-                                modified = True
-
-                if modified:
-                    xml_file.write_bytes(dom.toxml(encoding="UTF-8"))
-
-            except Exception:
-                pass
-
+            visitors = self._walk(xml_file, visitor_classes)
+            if any(v.failed for v in visitors):
+                self.model.forget(xml_file)  # drop half-applied repairs
+                continue
+            count = sum(v.repairs for v in visitors)
+            if count:
+                self.model.save(xml_file)
+                repairs += count
         return repairs
 
-    def validate_xml(self):
-        errors = []
+    def _check_xml(self, xml_file):
+        try:
+            self.model.tree(xml_file)
+        except lxml.etree.XMLSyntaxError as e:
+            return f"Line {e.lineno}: {e.msg}"
+        except Exception as e:
+            return f"Unexpected error: {str(e)}"
+        return None
 
-        for xml_file in self.xml_files:
-            try:
-                lxml.etree.parse(str(xml_file))
-            except lxml.etree.XMLSyntaxError as e:
-                errors.append(
-                    f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                    f"Line {e.lineno}: {e.msg}"
-                )
-            except Exception as e:
-                errors.append(
-                    f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                    f"Unexpected error: {str(e)}"
-                )
+    def validate_xml(self):
+        errors = [
+            f"  {xml_file.relative_to(self.unpacked_dir)}: {error}"
+            for xml_file, error in self._results("xml").items()
+            if error
+        ]
 
         if errors:
             print(f"FAILED - Found {len(errors)} XML violations:")
@@ -167,25 +417,30 @@ class BaseSchemaValidator:
                 print("PASSED - All XML files are well-formed")
             return True
 
-    def validate_namespaces(self):
+    def _check_namespaces(self, xml_file):
         errors = []
+        try:
+            root = self.model.tree(xml_file).getroot()
+        except lxml.etree.XMLSyntaxError:
+            return errors
+        declared = set(root.nsmap.keys()) - {None}  
+
+        for attr_val in [
+            v for k, v in root.attrib.items() if k.endswith("Ignorable")
+        ]:
+            undeclared = set(attr_val.split()) - declared
+            errors.extend(
+                f"Namespace '{ns}' in Ignorable but not declared"
+                for ns in sorted(undeclared)
+            )
+        return errors
 
-        for xml_file in self.xml_files:
-            try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
-                declared = set(root.nsmap.keys()) - {None}  
-
-                for attr_val in [
-                    v for k, v in root.attrib.items() if k.endswith("Ignorable")
-                ]:
-                    undeclared = set(attr_val.split()) - declared
-                    errors.extend(
-                        f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                        f"Namespace '{ns}' in Ignorable but not declared"
-                        for ns in undeclared
-                    )
-            except lxml.etree.XMLSyntaxError:
-                continue
+    def validate_namespaces(self):
+        errors = [
+            f"  {xml_file.relative_to(self.unpacked_dir)}: {error}"
+            for xml_file, file_errors in self._results("namespaces").items()
+            for error in file_errors
+        ]
 
         if errors:
             print(f"FAILED - {len(errors)} namespace issues:")
@@ -200,81 +455,22 @@ class BaseSchemaValidator:
         errors = []
         global_ids = {}  
 
-        for xml_file in self.xml_files:
-            try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
-                file_ids = {}  
-
-                mc_elements = root.xpath(
-                    ".//mc:AlternateContent", namespaces={"mc": self.MC_NAMESPACE}
-                )
-                for elem in mc_elements:
-                    elem.getparent().remove(elem)
-
-                for elem in root.iter():
-                    tag = (
-                        elem.tag.split("}")[-1].lower()
-                        if "}" in elem.tag
-                        else elem.tag.lower()
+        for xml_file, events in self._results("unique_ids").items():
+            rel_path = xml_file.relative_to(self.unpacked_dir)
+            for event in events:
+                if event[0] == "error":
+                    errors.append(f"  {rel_path}: {event[1]}")
+                    continue
+                _, id_value, line, tag = event
+                if id_value in global_ids:
+                    prev_file, prev_line, prev_tag = global_ids[id_value]
+                    errors.append(
+                        f"  {rel_path}: "
+                        f"Line {line}: Global ID '{id_value}' in <{tag}> "
+                        f"already used in {prev_file} at line {prev_line} in <{prev_tag}>"
                     )
-
-                    if tag in self.UNIQUE_ID_REQUIREMENTS:
-                        in_excluded_container = any(
-                            ancestor.tag.split("}")[-1].lower() in self.EXCLUDED_ID_CONTAINERS
-                            for ancestor in elem.iterancestors()
-                        )
-                        if in_excluded_container:
-                            continue
-
-                        attr_name, scope = self.UNIQUE_ID_REQUIREMENTS[tag]
-
-                        id_value = None
-                        for attr, value in elem.attrib.items():
-                            attr_local = (
-                                attr.split("}")[-1].lower()
-                                if "}" in attr
-                                else attr.lower()
-                            )
-                            if attr_local == attr_name:
-                                id_value = value
-                                break
-
-                        if id_value is not None:
-                            if scope == "global":
-                                if id_value in global_ids:
-                                    prev_file, prev_line, prev_tag = global_ids[
-                                        id_value
-                                    ]
-                                    errors.append(
-                                        f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                                        f"Line {elem.sourceline}: Global ID '{id_value}' in <{tag}> "
-                                        f"already used in {prev_file} at line {prev_line} in <{prev_tag}>"
-                                    )
-                                else:
-                                    global_ids[id_value] = (
-                                        xml_file.relative_to(self.unpacked_dir),
-                                        elem.sourceline,
-                                        tag,
-                                    )
-                            elif scope == "file":
-                                key = (tag, attr_name)
-                                if key not in file_ids:
-                                    file_ids[key] = {}
-
-                                if id_value in file_ids[key]:
-                                    prev_line = file_ids[key][id_value]
-                                    errors.append(
-                                        f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                                        f"Line {elem.sourceline}: Duplicate {attr_name}='{id_value}' in <{tag}> "
-                                        f"(first occurrence at line {prev_line})"
-                                    )
-                                else:
-                                    file_ids[key][id_value] = elem.sourceline
-
-            except (lxml.etree.XMLSyntaxError, Exception) as e:
-                errors.append(
-                    f"  {xml_file.relative_to(self.unpacked_dir)}: Error: {e}"
-                )
+                else:
+                    global_ids[id_value] = (rel_path, line, tag)
 
         if errors:
             print(f"FAILED - Found {len(errors)} ID uniqueness violations:")
@@ -286,10 +482,57 @@ class BaseSchemaValidator:
                 print("PASSED - All required IDs are unique")
             return True
 
+    def _check_file_references(self, rels_file):
+        """(referenced targets, [(broken target, line)]) of a .rels part, or an error string."""
+        if not rels_file.name.endswith(".rels"):
+            return None
+        try:
+            rels_root = self.model.tree(rels_file).getroot()
+
+            rels_dir = rels_file.parent
+
+            referenced_files = []
+            broken_refs = []
+
+            for rel in rels_root.findall(
+                ".//ns:Relationship",
+                namespaces={"ns": self.PACKAGE_RELATIONSHIPS_NAMESPACE},
+            ):
+                target = rel.get("Target")
+                if target and not target.startswith(
+                    ("http", "mailto:")
+                ):  
+                    if target.startswith("/"):
+                        target_path = self.unpacked_dir / target.lstrip("/")
+                    elif rels_file.name == ".rels":
+                        target_path = self.unpacked_dir / target
+                    else:
+                        base_dir = rels_dir.parent
+                        target_path = base_dir / target
+
+                    try:
+                        target_path = target_path.resolve()
+                        if target_path.exists() and target_path.is_file():
+                            referenced_files.append(target_path)
+                        else:
+                            broken_refs.append((target, rel.sourceline))
+                    except (OSError, ValueError):
+                        broken_refs.append((target, rel.sourceline))
+
+            return referenced_files, broken_refs
+
+        except Exception as e:
+            return str(e)
+
     def validate_file_references(self):
         errors = []
 
-        rels_files = list(self.unpacked_dir.rglob("*.rels"))
+        rels_results = {
+            rels_file: result
+            for rels_file, result in self._results("file_references").items()
+            if result is not None
+        }
+        rels_files = list(rels_results)
 
         if not rels_files:
             if self.verbose:
@@ -312,51 +555,18 @@ class BaseSchemaValidator:
                 f"Found {len(rels_files)} .rels files and {len(all_files)} target files"
             )
 
-        for rels_file in rels_files:
-            try:
-                rels_root = lxml.etree.parse(str(rels_file)).getroot()
-
-                rels_dir = rels_file.parent
-
-                referenced_files = set()
-                broken_refs = []
-
-                for rel in rels_root.findall(
-                    ".//ns:Relationship",
-                    namespaces={"ns": self.PACKAGE_RELATIONSHIPS_NAMESPACE},
-                ):
-                    target = rel.get("Target")
-                    if target and not target.startswith(
-                        ("http", "mailto:")
-                    ):  
-                        if target.startswith("/"):
-                            target_path = self.unpacked_dir / target.lstrip("/")
-                        elif rels_file.name == ".rels":
-                            target_path = self.unpacked_dir / target
-                        else:
-                            base_dir = rels_dir.parent
-                            target_path = base_dir / target
-
-                        try:
-                            target_path = target_path.resolve()
-                            if target_path.exists() and target_path.is_file():
-                                referenced_files.add(target_path)
-                                all_referenced_files.add(target_path)
-                            else:
-                                broken_refs.append((target, rel.sourceline))
-                        except (OSError, ValueError):
-                            broken_refs.append((target, rel.sourceline))
-
-                if broken_refs:
-                    rel_path = rels_file.relative_to(self.unpacked_dir)
-                    for broken_ref, line_num in broken_refs:
-                        errors.append(
-                            f"  {rel_path}: Line {line_num}: Broken reference to {broken_ref}"
-                        )
+        for rels_file, result in rels_results.items():
+            rel_path = rels_file.relative_to(self.unpacked_dir)
+            if isinstance(result, str):
+                errors.append(f"  Error parsing {rel_path}: {result}")
+                continue
 
-            except Exception as e:
-                rel_path = rels_file.relative_to(self.unpacked_dir)
-                errors.append(f"  Error parsing {rel_path}: {e}")
+            referenced_files, broken_refs = result
+            all_referenced_files.update(referenced_files)
+            for broken_ref, line_num in broken_refs:
+                errors.append(
+                    f"  {rel_path}: Line {line_num}: Broken reference to {broken_ref}"
+                )
 
         unreferenced_files = set(all_files) - all_referenced_files
 
@@ -383,77 +593,11 @@ class BaseSchemaValidator:
             return True
 
     def validate_all_relationship_ids(self):
-        import lxml.etree
-
-        errors = []
-
-        for xml_file in self.xml_files:
-            if xml_file.suffix == ".rels":
-                continue
-
-            rels_dir = xml_file.parent / "_rels"
-            rels_file = rels_dir / f"{xml_file.name}.rels"
-
-            if not rels_file.exists():
-                continue
-
-            try:
-                rels_root = lxml.etree.parse(str(rels_file)).getroot()
-                rid_to_type = {}
-
-                for rel in rels_root.findall(
-                    f".//{{{self.PACKAGE_RELATIONSHIPS_NAMESPACE}}}Relationship"
-                ):
-                    rid = rel.get("Id")
-                    rel_type = rel.get("Type", "")
-                    if rid:
-                        if rid in rid_to_type:
-                            rels_rel_path = rels_file.relative_to(self.unpacked_dir)
-                            errors.append(
-                                f"  {rels_rel_path}: Line {rel.sourceline}: "
-                                f"Duplicate relationship ID '{rid}' (IDs must be unique)"
-                            )
-                        type_name = (
-                            rel_type.split("/")[-1] if "/" in rel_type else rel_type
-                        )
-                        rid_to_type[rid] = type_name
-
-                xml_root = lxml.etree.parse(str(xml_file)).getroot()
-
-                r_ns = self.OFFICE_RELATIONSHIPS_NAMESPACE
-                rid_attrs_to_check = ["id", "embed", "link"]
-                for elem in xml_root.iter():
-                    for attr_name in rid_attrs_to_check:
-                        rid_attr = elem.get(f"{{{r_ns}}}{attr_name}")
-                        if not rid_attr:
-                            continue
-                        xml_rel_path = xml_file.relative_to(self.unpacked_dir)
-                        elem_name = (
-                            elem.tag.split("}")[-1] if "}" in elem.tag else elem.tag
-                        )
-
-                        if rid_attr not in rid_to_type:
-                            errors.append(
-                                f"  {xml_rel_path}: Line {elem.sourceline}: "
-                                f"<{elem_name}> r:{attr_name} references non-existent relationship '{rid_attr}' "
-                                f"(valid IDs: {', '.join(sorted(rid_to_type.keys())[:5])}{'...' if len(rid_to_type) > 5 else ''})"
-                            )
-                        elif attr_name == "id" and self.ELEMENT_RELATIONSHIP_TYPES:
-                            expected_type = self._get_expected_relationship_type(
-                                elem_name
-                            )
-                            if expected_type:
-                                actual_type = rid_to_type[rid_attr]
-                                if expected_type not in actual_type.lower():
-                                    errors.append(
-                                        f"  {xml_rel_path}: Line {elem.sourceline}: "
-                                        f"<{elem_name}> references '{rid_attr}' which points to '{actual_type}' "
-                                        f"but should point to a '{expected_type}' relationship"
-                                    )
-
-            except Exception as e:
-                xml_rel_path = xml_file.relative_to(self.unpacked_dir)
-                errors.append(f"  Error processing {xml_rel_path}: {e}")
+        errors = [
+            error
+            for file_errors in self._results("relationship_ids").values()
+            for error in file_errors
+        ]
 
         if errors:
             print(f"FAILED - Found {len(errors)} relationship ID reference errors:")
@@ -489,6 +633,24 @@ class BaseSchemaValidator:
 
         return None
 
+    def _check_content_type(self, xml_file):
+        """(part name, root element name) of a part; name is None if not applicable."""
+        path_str = str(xml_file.relative_to(self.unpacked_dir)).replace(
+            "\\", "/"
+        )
+
+        if any(
+            skip in path_str
+            for skip in [".rels", "[Content_Types]", "docProps/", "_rels/"]
+        ):
+            return path_str, None
+
+        try:
+            root_tag = self.model.tree(xml_file).getroot().tag
+        except Exception:
+            return path_str, None
+        return path_str, root_tag.split("}")[-1] if "}" in root_tag else root_tag
+
     def validate_content_types(self):
         errors = []
 
@@ -498,7 +660,7 @@ class BaseSchemaValidator:
             return False
 
         try:
-            root = lxml.etree.parse(str(content_types_file)).getroot()
+            root = self.model.tree(content_types_file).getroot()
             declared_parts = set()
             declared_extensions = set()
 
@@ -541,28 +703,13 @@ class BaseSchemaValidator:
             all_files = list(self.unpacked_dir.rglob("*"))
             all_files = [f for f in all_files if f.is_file()]
 
-            for xml_file in self.xml_files:
-                path_str = str(xml_file.relative_to(self.unpacked_dir)).replace(
-                    "\\", "/"
-                )
-
-                if any(
-                    skip in path_str
-                    for skip in [".rels", "[Content_Types]", "docProps/", "_rels/"]
-                ):
+            for path_str, root_name in self._results("content_type").values():
+                if root_name is None:
                     continue
-
-                try:
-                    root_tag = lxml.etree.parse(str(xml_file)).getroot().tag
-                    root_name = root_tag.split("}")[-1] if "}" in root_tag else root_tag
-
-                    if root_name in declarable_roots and path_str not in declared_parts:
-                        errors.append(
-                            f"  {path_str}: File with <{root_name}> root not declared in [Content_Types].xml"
-                        )
-
-                except Exception:
-                    continue  
+                if root_name in declarable_roots and path_str not in declared_parts:
+                    errors.append(
+                        f"  {path_str}: File with <{root_name}> root not declared in [Content_Types].xml"
+                    )
 
             for file_path in all_files:
                 if file_path.suffix.lower() in {".xml", ".rels"}:
@@ -622,7 +769,7 @@ class BaseSchemaValidator:
             if verbose:
                 relative_path = xml_file.relative_to(unpacked_dir)
                 print(f"FAILED - {relative_path}: {len(new_errors)} new error(s)")
-                for error in list(new_errors)[:3]:
+                for error in sorted(new_errors)[:3]:
                     truncated = error[:250] + "..." if len(error) > 250 else error
                     print(f"  - {truncated}")
             return False, new_errors
@@ -633,17 +780,17 @@ class BaseSchemaValidator:
                 )
             return True, set()
 
+    def _check_xsd(self, xml_file):
+        return self.validate_file_against_xsd(xml_file, verbose=False)
+
     def validate_against_xsd(self):
         new_errors = []
         original_error_count = 0
         valid_count = 0
         skipped_count = 0
 
-        for xml_file in self.xml_files:
+        for xml_file, (is_valid, new_file_errors) in self._results("xsd").items():
             relative_path = str(xml_file.relative_to(self.unpacked_dir))
-            is_valid, new_file_errors = self.validate_file_against_xsd(
-                xml_file, verbose=False
-            )
 
             if is_valid is None:
                 skipped_count += 1
@@ -657,7 +804,7 @@ class BaseSchemaValidator:
                 continue
 
             new_errors.append(f"  {relative_path}: {len(new_file_errors)} new error(s)")
-            for error in list(new_file_errors)[:3]:  
+            for error in sorted(new_file_errors)[:3]:  
                 new_errors.append(
                     f"    - {error[:250]}..." if len(error) > 250 else f"    - {error}"
                 )
@@ -753,20 +900,20 @@ class BaseSchemaValidator:
             return None, None  
 
         try:
-            with open(schema_path, "rb") as xsd_file:
-                parser = lxml.etree.XMLParser()
-                xsd_doc = lxml.etree.parse(
-                    xsd_file, parser=parser, base_url=str(schema_path)
-                )
-                schema = lxml.etree.XMLSchema(xsd_doc)
+            xml_doc = self.model.tree(xml_file)
+            return self._validate_doc_xsd(
+                xml_doc, xml_file.relative_to(base_path), schema_path
+            )
+        except Exception as e:
+            return False, {str(e)}
 
-            with open(xml_file, "r") as f:
-                xml_doc = lxml.etree.parse(f)
+    def _validate_doc_xsd(self, xml_doc, relative_path, schema_path):
+        try:
+            schema = load_schema(schema_path)
 
             xml_doc, _ = self._remove_template_tags_from_text_nodes(xml_doc)
             xml_doc = self._preprocess_for_mc_ignorable(xml_doc)
 
-            relative_path = xml_file.relative_to(base_path)
             if (
                 relative_path.parts
                 and relative_path.parts[0] in self.MAIN_CONTENT_FOLDERS
@@ -788,28 +935,30 @@ class BaseSchemaValidator:
         if self.original_file is None:
             return set()
 
-        import tempfile
-        import zipfile
-
         xml_file = Path(xml_file).resolve()
-        unpacked_dir = self.unpacked_dir.resolve()
-        relative_path = xml_file.relative_to(unpacked_dir)
-
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
+        relative_path = xml_file.relative_to(self.unpacked_dir.resolve())
+        part_name = relative_path.as_posix()
 
-            with zipfile.ZipFile(self.original_file, "r") as zip_ref:
-                zip_ref.extractall(temp_path)
+        if part_name not in self._original_errors:
+            self._original_errors[part_name] = self._validate_original_part(
+                part_name, relative_path, xml_file
+            )
+        return self._original_errors[part_name]
 
-            original_xml_file = temp_path / relative_path
+    def _validate_original_part(self, part_name, relative_path, xml_file):
+        if self.model.original_part(part_name) is None:
+            return set()
 
-            if not original_xml_file.exists():
-                return set()
+        schema_path = self._get_schema_path(xml_file)
+        if not schema_path:
+            return set()
 
-            is_valid, errors = self._validate_single_file_xsd(
-                original_xml_file, temp_path
-            )
-            return errors if errors else set()
+        try:
+            xml_doc = self.model.original_tree(part_name)
+        except Exception as e:
+            return {str(e)}
+        is_valid, errors = self._validate_doc_xsd(xml_doc, relative_path, schema_path)
+        return errors if errors else set()
 
     def _remove_template_tags_from_text_nodes(self, xml_doc):
         warnings = []
@@ -0,0 +1,193 @@
+"""
+Shared document model: every XML part is parsed once and every check walks it once.
+"""
+
+import os
+import re
+import zipfile
+from collections import Counter
+from pathlib import Path
+
+import lxml.etree
+
+# Repairs write parsed trees back to disk, so entities are never expanded.
+_PARSER = lxml.etree.XMLParser(resolve_entities=False, no_network=True)
+
+# XML declaration plus the whitespace after it, as written in the source part.
+_DECLARATION = re.compile(rb"(?:\xef\xbb\xbf)?<\?xml[^>]*\?>\s*")
+
+
+class DocumentModel:
+    """Parsed parts of one unpacked document (and its original), shared by all validators.
+
+    Trees are parsed on first use and reused until the file on disk changes.
+    Checks must not modify a tree they get from `tree()`; repairs modify it
+    in place and then call `save()` (or `forget()` to throw the edits away).
+    """
+
+    def __init__(self, unpacked_dir, original_file=None):
+        self.unpacked_dir = Path(unpacked_dir).resolve()
+        self.original_file = Path(original_file) if original_file else None
+        self._trees = {}  # path -> ((mtime_ns, size), tree or parse exception)
+        self._original_parts = None  # part name -> bytes, read on first use
+        self._original_trees = {}
+
+    def __getstate__(self):
+        # Worker processes start with empty caches and parse their own parts.
+        state = self.__dict__.copy()
+        state["_trees"] = {}
+        state["_original_parts"] = None
+        state["_original_trees"] = {}
+        return state
+
+    @staticmethod
+    def _stamp(path):
+        st = os.stat(path)
+        return st.st_mtime_ns, st.st_size
+
+    def tree(self, path):
+        """Parsed lxml tree of the part at `path`; a parse error is re-raised on every call."""
+        stamp = self._stamp(path)
+        cached = self._trees.get(path)
+        if cached is None or cached[0] != stamp:
+            try:
+                result = lxml.etree.parse(str(path), _PARSER)
+            except Exception as e:
+                result = e
+            cached = self._trees[path] = (stamp, result)
+        if isinstance(cached[1], Exception):
+            raise cached[1]
+        return cached[1]
+
+    def save(self, path):
+        """Write the (repaired) cached tree of `path` back to disk."""
+        tree = self._trees.pop(path)[1]
+        # Dropped from the cache: the part is re-parsed on next use, so the
+        # line numbers checks report match the file as written.
+        with open(path, "rb") as f:
+            head = f.read(1024)
+        declaration = _DECLARATION.match(head)
+        # The source's own declaration (or lack of one) is kept byte for byte,
+        # so the root element stays on the line it started on.
+        body = lxml.etree.tostring(tree, encoding=tree.docinfo.encoding or "UTF-8",
+                                   xml_declaration=False)
+        with open(path, "wb") as f:
+            if declaration:
+                f.write(declaration.group(0))
+            f.write(body)
+
+    def forget(self, path):
+        self._trees.pop(path, None)
+
+    def original_part(self, part_name):
+        """Bytes of an XML part of the original document, or None.
+
+        The original archive is opened once and all its XML parts are read
+        into memory; nothing is extracted to disk.
+        """
+        if self.original_file is None:
+            return None
+        if self._original_parts is None:
+            with zipfile.ZipFile(self.original_file, "r") as zip_ref:
+                self._original_parts = {
+                    name: zip_ref.read(name)
+                    for name in zip_ref.namelist()
+                    if name.endswith((".xml", ".rels"))
+                }
+        return self._original_parts.get(part_name)
+
+    def original_tree(self, part_name):
+        """Parsed tree of an original part (cached; do not modify), or None."""
+        if part_name not in self._original_trees:
+            data = self.original_part(part_name)
+            self._original_trees[part_name] = (
+                None
+                if data is None
+                else lxml.etree.ElementTree(lxml.etree.fromstring(data, _PARSER))
+            )
+        return self._original_trees[part_name]
+
+
+class PartWalk:
+    """State of one walk over a part: which element tags are currently open."""
+
+    def __init__(self):
+        self.open = Counter()
+
+    def inside(self, tag):
+        """True if the visited node has an ancestor with Clark name `tag`."""
+        return self.open[tag] > 0
+
+
+class PartVisitor:
+    """One check (or repair) over one part, fed every node of a single shared walk.
+
+    `visit(node, walk)` is called in document order for elements, comments
+    and processing instructions. A visitor that raises is stopped and gets
+    `fail(exc)`; the other visitors of the walk carry on.
+    """
+
+    def __init__(self, validator, xml_file):
+        self.validator = validator
+        self.xml_file = xml_file
+        self.rel_path = xml_file.relative_to(validator.unpacked_dir)
+        self.errors = []
+
+    def applies(self):
+        """Whether this check runs on this part at all (decided before parsing)."""
+        return True
+
+    def start(self, root):
+        pass
+
+    def visit(self, node, walk):
+        pass
+
+    def fail(self, exc):
+        self.errors.append(f"  {self.rel_path}: Error: {exc}")
+
+    def result(self):
+        return self.errors
+
+
+def walk_part(root, visitors):
+    """Feed every node under `root` to each visitor in one pass."""
+    active = []
+    for visitor in visitors:
+        try:
+            visitor.start(root)
+        except Exception as e:
+            visitor.fail(e)
+        else:
+            active.append(visitor)
+    if not active:
+        return
+
+    walk = PartWalk()
+    open_tags = walk.open
+    for event, node in lxml.etree.iterwalk(
+        root, events=("start", "end", "comment", "pi")
+    ):
+        if event == "end":
+            open_tags[node.tag] -= 1
+            continue
+        for visitor in active:
+            try:
+                visitor.visit(node, walk)
+            except Exception as e:
+                visitor.fail(e)
+                active = [v for v in active if v is not visitor]
+        if event == "start":
+            open_tags[node.tag] += 1
+
+
+class RepairVisitor(PartVisitor):
+    """A visitor that edits the tree in place and counts its `repairs`."""
+
+    def __init__(self, validator, xml_file):
+        super().__init__(validator, xml_file)
+        self.repairs = 0
+        self.failed = False
+
+    def fail(self, exc):
+        self.failed = True
@@ -1,15 +1,35 @@
 #!/usr/bin/env python3
-"""Append an action to the PersonalMentor session log."""
+"""Append an action to the PersonalMentor session log.
+
+Importable: `log_action()` validates and timestamps the entry, then hands it
+to an in-memory buffer and returns immediately. A background thread writes
+buffered entries in batches (one write + fsync per batch, under an exclusive
+file lock, so lines from concurrent processes never interleave). Pending
+entries are flushed at interpreter exit, or on demand with `flush()`.
+"""
 
 import argparse
+import atexit
 import json
 import os
+import sys
+import threading
 import uuid
+from contextlib import contextmanager
 from datetime import datetime, timezone
 
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
 MEMORY_DIR = os.path.join(os.path.dirname(__file__), "..", "..", "..", "memory")
 SESSION_LOG = os.path.join(MEMORY_DIR, "session-log.jsonl")
 
+FLUSH_INTERVAL = 0.5  # seconds between background flushes
+FLUSH_BATCH = 64      # flush early once this many entries are waiting
+
 VALID_ACTIONS = [
     "onboarding",
     "profile_update",
@@ -20,6 +40,135 @@ VALID_ACTIONS = [
 ]
 
 
+def _lock(f):
+    if fcntl is not None:
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+    else:
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+
+
+def _unlock(f):
+    if fcntl is not None:
+        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+    else:
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+@contextmanager
+def file_lock(f):
+    """Hold an exclusive lock on the open file `f` (released on exit)."""
+    _lock(f)
+    try:
+        yield f
+    finally:
+        _unlock(f)
+
+
+def append_lines(path, data):
+    """Append `data` to `path` in one locked, fsynced write."""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "ab") as f, file_lock(f):
+        f.write(data.encode("utf-8"))
+        f.flush()
+        os.fsync(f.fileno())
+
+
+class BufferedLog:
+    """JSON-lines appender with an in-memory buffer and a lazy flusher thread."""
+
+    def __init__(self, path, interval=FLUSH_INTERVAL, batch=FLUSH_BATCH):
+        self.path = path
+        self.interval = interval
+        self.batch = batch
+        self._buffer = []
+        self._cond = threading.Condition()
+        self._write_lock = threading.Lock()  # keeps batches in order
+        self._thread = None
+        self._closed = False
+
+    def append(self, entry):
+        line = json.dumps(entry) + "\n"
+        with self._cond:
+            self._buffer.append(line)
+            if self._thread is None and not self._closed:
+                self._thread = threading.Thread(target=self._run, name="session-log-flusher",
+                                                daemon=True)
+                self._thread.start()
+            if len(self._buffer) >= self.batch:
+                self._cond.notify()
+        if self._closed:
+            self.flush()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._closed or len(self._buffer) >= self.batch,
+                                    timeout=self.interval)
+                closed = self._closed
+            self.flush()
+            if closed:
+                return
+
+    def flush(self):
+        """Write every buffered entry now."""
+        with self._write_lock:
+            with self._cond:
+                lines, self._buffer = self._buffer, []
+            if not lines:
+                return
+            try:
+                append_lines(self.path, "".join(lines))
+            except OSError as e:
+                with self._cond:
+                    self._buffer[:0] = lines  # keep them for the next attempt
+                print(f"WARNING: could not write session log {self.path}: {e}", file=sys.stderr)
+
+    def close(self):
+        """Stop the flusher thread and write what is left."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+            thread = self._thread
+        if thread is not None:
+            thread.join()
+        self.flush()
+
+    def _after_fork(self):
+        # The child has no flusher thread and must not re-write the parent's entries.
+        self._buffer = []
+        self._cond = threading.Condition()
+        self._write_lock = threading.Lock()
+        self._thread = None
+
+
+_log = BufferedLog(SESSION_LOG)
+atexit.register(_log.close)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_log._after_fork)
+
+
+def log_action(action, detail, session_id=None):
+    """Queue one action entry for session-log.jsonl and return it."""
+    if action not in VALID_ACTIONS:
+        raise ValueError(f"unknown action: {action}")
+
+    entry = {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "action": action,
+        "detail": detail,
+        "session_id": session_id or str(uuid.uuid4())[:8],
+    }
+    _log.append(entry)
+    return entry
+
+
+def flush():
+    """Write any queued entries to disk now (e.g. before os._exit)."""
+    _log.flush()
+
+
 def main():
     parser = argparse.ArgumentParser(description="Log an action to session-log.jsonl")
     parser.add_argument("--action", required=True, choices=VALID_ACTIONS, help="Action type")
@@ -27,16 +176,8 @@ def main():
     parser.add_argument("--session-id", default=None, help="Session UUID (auto-generated if omitted)")
     args = parser.parse_args()
 
-    entry = {
-        "timestamp": datetime.now(timezone.utc).isoformat(),
-        "action": args.action,
-        "detail": args.detail,
-        "session_id": args.session_id or str(uuid.uuid4())[:8],
-    }
-
-    os.makedirs(os.path.dirname(SESSION_LOG), exist_ok=True)
-    with open(SESSION_LOG, "a") as f:
-        f.write(json.dumps(entry) + "\n")
+    entry = log_action(args.action, args.detail, args.session_id)
+    flush()
 
     print(f"Logged: {entry['action']} — {entry['detail']}")
 
@@ -1,56 +1,251 @@
 #!/usr/bin/env python3
-"""Register a generated artifact in the PersonalMentor artifact registry."""
+"""Register a generated artifact in the PersonalMentor artifact registry.
+
+The registry is an append-only JSON-lines file (memory/artifacts.jsonl):
+registering an artifact appends one line under a file lock and never reads
+or rewrites the history.
+
+A small side index (memory/artifacts.index.json, a rebuildable cache) maps
+each artifact type to the (day, byte offset) of its entries in file order.
+Reads bring the index up to date by scanning only the bytes appended since
+it was last saved, then seek straight to the lines they need — so "latest
+artifact of type X" reads one line, and date-range queries bisect the day
+list.
+
+`--compact` rewrites the registry keeping only the newest entry for each
+(type, path), i.e. drops superseded re-registrations of the same output.
+The old YAML registry (memory/artifacts.yaml) is migrated on first use, or
+explicitly with `--migrate`.
+"""
 
 import argparse
+import bisect
+import json
 import os
+import sys
 import uuid
 from datetime import datetime, timezone
 
-try:
-    import yaml
-except ImportError:
-    print("ERROR: PyYAML not installed. Run: pip install pyyaml")
-    exit(1)
+from log_action import file_lock
 
 MEMORY_DIR = os.path.join(os.path.dirname(__file__), "..", "..", "..", "memory")
-ARTIFACTS_FILE = os.path.join(MEMORY_DIR, "artifacts.yaml")
+REGISTRY_FILE = os.path.join(MEMORY_DIR, "artifacts.jsonl")
+INDEX_FILE = os.path.join(MEMORY_DIR, "artifacts.index.json")
+LEGACY_FILE = os.path.join(MEMORY_DIR, "artifacts.yaml")
 
 
-def main():
-    parser = argparse.ArgumentParser(description="Register a generated artifact")
-    parser.add_argument("--type", required=True, help="Artifact type (daily-newspaper, cv, document, web)")
-    parser.add_argument("--path", required=True, help="Output file path relative to project root")
-    parser.add_argument("--sections", default="", help="Comma-separated list of sections included")
-    parser.add_argument("--item-count", type=int, default=0, help="Number of content items")
-    parser.add_argument("--sources", default="", help="Comma-separated list of sources used")
-    args = parser.parse_args()
+def _day(entry):
+    return str(entry.get("created_at", ""))[:10]
 
-    # Load existing registry
-    if os.path.exists(ARTIFACTS_FILE):
-        with open(ARTIFACTS_FILE, "r") as f:
+
+class ArtifactRegistry:
+    """Append-only artifact registry at `path` with a type/day offset index."""
+
+    def __init__(self, path=REGISTRY_FILE, index_path=INDEX_FILE, legacy_path=LEGACY_FILE):
+        self.path = path
+        self.index_path = index_path
+        self.legacy_path = legacy_path
+        self._index = None  # {"inode", "size", "types": {type: [[day, offset], ...]}}
+
+    def append(self, entry):
+        """Append one entry (a locked, fsynced single write)."""
+        self.migrate()
+        line = (json.dumps(entry) + "\n").encode("utf-8")
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        while True:
+            with open(self.path, "ab") as f, file_lock(f):
+                # A concurrent compaction may have replaced the file while we
+                # waited for the lock; write to the current one instead.
+                if os.fstat(f.fileno()).st_ino != os.stat(self.path).st_ino:
+                    continue
+                f.write(line)
+                f.flush()
+                os.fsync(f.fileno())
+                return
+
+    def migrate(self):
+        """Convert the legacy YAML registry once; returns the number of entries imported."""
+        if os.path.exists(self.path) or not (self.legacy_path and os.path.exists(self.legacy_path)):
+            return 0
+        try:
+            import yaml
+        except ImportError:
+            print(f"WARNING: PyYAML not installed — cannot migrate {self.legacy_path}", file=sys.stderr)
+            return 0
+        with open(self.legacy_path, "r", encoding="utf-8") as f:
             data = yaml.safe_load(f) or {}
-    else:
-        data = {}
+        entries = [a for a in (data.get("artifacts") or []) if isinstance(a, dict)]
+        self._write_all(entries)
+        return len(entries)
+
+    def compact(self):
+        """Keep only the newest entry per (type, path); returns (lines before, lines after)."""
+        self.migrate()
+        if not os.path.exists(self.path):
+            return 0, 0
+        with open(self.path, "ab") as lock, file_lock(lock):
+            entries = [entry for _, _, entry in self._scan(0) if entry is not None]
+            latest = {}
+            for entry in entries:
+                latest[(entry.get("type"), entry.get("path"))] = entry
+            kept = sorted(latest.values(), key=lambda e: str(e.get("created_at", "")))
+            self._write_all(kept)
+        return len(entries), len(kept)
+
+    def _write_all(self, entries):
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp = self.path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.writelines(json.dumps(entry) + "\n" for entry in entries)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.path)
+        self._index = None
+
+    def _scan(self, start):
+        """Yield (offset, length, entry) per complete line from byte `start`; entry is None if unparseable."""
+        with open(self.path, "rb") as f:
+            f.seek(start)
+            offset = start
+            for raw in f:
+                if not raw.endswith(b"\n"):
+                    break  # a write still in progress
+                try:
+                    entry = json.loads(raw)
+                except ValueError:
+                    entry = None
+                yield offset, len(raw), entry if isinstance(entry, dict) else None
+                offset += len(raw)
+
+    def _load_index(self):
+        if self._index is None and os.path.exists(self.index_path):
+            try:
+                with open(self.index_path, "r", encoding="utf-8") as f:
+                    self._index = json.load(f)
+            except (json.JSONDecodeError, OSError):
+                self._index = None
+        return self._index
+
+    def _refresh(self):
+        """Index covering the whole file, catching up on appended lines only."""
+        self.migrate()
+        if not os.path.exists(self.path):
+            return {"types": {}}
+        st = os.stat(self.path)
+        index = self._load_index()
+        if not index or index.get("inode") != st.st_ino or index.get("size", 0) > st.st_size:
+            index = {"inode": st.st_ino, "size": 0, "types": {}}  # new or rewritten file
+        if index["size"] == st.st_size:
+            self._index = index
+            return index
+        types = index["types"]
+        for offset, length, entry in self._scan(index["size"]):
+            if entry is not None:
+                types.setdefault(str(entry.get("type")), []).append([_day(entry), offset])
+            index["size"] = offset + length
+        self._index = index
+        try:
+            tmp = self.index_path + ".tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(index, f, separators=(",", ":"))
+            os.replace(tmp, self.index_path)
+        except OSError as e:
+            print(f"WARNING: could not save artifact index {self.index_path}: {e}", file=sys.stderr)
+        return index
 
-    if "artifacts" not in data or data["artifacts"] is None:
-        data["artifacts"] = []
+    def _read_at(self, f, offset):
+        f.seek(offset)
+        return json.loads(f.readline())
 
-    # Create new artifact entry
+    def types(self):
+        return sorted(self._refresh()["types"])
+
+    def latest(self, artifact_type):
+        """Most recently registered artifact of `artifact_type`, or None."""
+        refs = self._refresh()["types"].get(artifact_type)
+        if not refs:
+            return None
+        with open(self.path, "rb") as f:
+            return self._read_at(f, refs[-1][1])
+
+    def find(self, artifact_type, since=None, until=None, limit=None):
+        """Artifacts of `artifact_type` created on days in [since, until] (ISO dates), newest first."""
+        refs = self._refresh()["types"].get(artifact_type) or []
+        days = [day for day, _ in refs]
+        lo = bisect.bisect_left(days, since) if since else 0
+        hi = bisect.bisect_right(days, until) if until else len(refs)
+        selected = refs[lo:hi][::-1]
+        if limit is not None:
+            selected = selected[:limit]
+        with open(self.path, "rb") as f:
+            return [self._read_at(f, offset) for _, offset in selected]
+
+
+_registry = ArtifactRegistry()
+
+
+def register_artifact(artifact_type, path, sections=(), item_count=0, sources=()):
+    """Append an artifact entry to the registry and return it."""
     artifact = {
         "id": str(uuid.uuid4())[:8],
-        "type": args.type,
-        "path": args.path,
+        "type": artifact_type,
+        "path": path,
         "created_at": datetime.now(timezone.utc).isoformat(),
-        "sections": [s.strip() for s in args.sections.split(",") if s.strip()],
-        "item_count": args.item_count,
-        "sources_used": [s.strip() for s in args.sources.split(",") if s.strip()],
+        "sections": [s.strip() for s in sections if s.strip()],
+        "item_count": item_count,
+        "sources_used": [s.strip() for s in sources if s.strip()],
     }
+    _registry.append(artifact)
+    return artifact
+
+
+def latest_artifact(artifact_type):
+    """Most recently registered artifact of `artifact_type`, or None."""
+    return _registry.latest(artifact_type)
+
+
+def find_artifacts(artifact_type, since=None, until=None, limit=None):
+    return _registry.find(artifact_type, since, until, limit)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Register a generated artifact")
+    parser.add_argument("--type", help="Artifact type (daily-newspaper, cv, document, web)")
+    parser.add_argument("--path", help="Output file path relative to project root")
+    parser.add_argument("--sections", default="", help="Comma-separated list of sections included")
+    parser.add_argument("--item-count", type=int, default=0, help="Number of content items")
+    parser.add_argument("--sources", default="", help="Comma-separated list of sources used")
+    parser.add_argument("--latest", metavar="TYPE", help="Print the latest artifact of TYPE as JSON and exit")
+    parser.add_argument("--compact", action="store_true",
+                        help="Drop superseded entries (same type and path) from the registry")
+    parser.add_argument("--migrate", action="store_true",
+                        help=f"Import {os.path.basename(LEGACY_FILE)} if the registry does not exist yet")
+    args = parser.parse_args()
 
-    data["artifacts"].append(artifact)
+    if args.migrate:
+        print(f"Migrated {_registry.migrate()} artifacts → {os.path.normpath(_registry.path)}")
+        return
+    if args.compact:
+        before, after = _registry.compact()
+        print(f"Compacted artifact registry: {before} → {after} entries")
+        return
+    if args.latest:
+        artifact = latest_artifact(args.latest)
+        if artifact is None:
+            print(f"No artifacts of type {args.latest}", file=sys.stderr)
+            sys.exit(1)
+        print(json.dumps(artifact, indent=2, ensure_ascii=False))
+        return
+    if not args.type or not args.path:
+        parser.error("--type and --path are required to register an artifact")
 
-    # Write back
-    with open(ARTIFACTS_FILE, "w") as f:
-        yaml.dump(data, f, default_flow_style=False, sort_keys=False)
+    artifact = register_artifact(
+        args.type,
+        args.path,
+        sections=args.sections.split(","),
+        item_count=args.item_count,
+        sources=args.sources.split(","),
+    )
 
     print(f"Registered artifact: {artifact['id']} ({artifact['type']}) → {artifact['path']}")
 
@@ -3,7 +3,7 @@
 Validates with auto-repair, condenses XML formatting, and creates the Office file.
 
 Usage:
-    python pack.py <input_directory> <output_file> [--original <file>] [--validate true|false]
+    python pack.py <input_directory> <output_file> [--original <file>] [--validate true|false] [--jobs N]
 
 Examples:
     python pack.py unpacked/ output.docx --original input.docx
@@ -11,15 +11,23 @@ Examples:
 """
 
 import argparse
+import os
 import sys
-import shutil
-import tempfile
 import zipfile
 from pathlib import Path
 
-import defusedxml.minidom
+import lxml.etree
+
+from validators import (
+    DocumentModel,
+    DOCXSchemaValidator,
+    PPTXSchemaValidator,
+    RedliningValidator,
+)
+
+# Entities are never expanded (or fetched): parts are rewritten as they are.
+_PARSER = lxml.etree.XMLParser(resolve_entities=False, no_network=True)
 
-from validators import DOCXSchemaValidator, PPTXSchemaValidator, RedliningValidator
 
 def pack(
     input_directory: str,
@@ -27,6 +35,7 @@ def pack(
     original_file: str | None = None,
     validate: bool = True,
     infer_author_func=None,
+    jobs: int = 1,
 ) -> tuple[None, str]:
     input_dir = Path(input_directory)
     output_path = Path(output_file)
@@ -42,26 +51,32 @@ def pack(
         original_path = Path(original_file)
         if original_path.exists():
             success, output = _run_validation(
-                input_dir, original_path, suffix, infer_author_func
+                input_dir, original_path, suffix, infer_author_func, jobs
             )
             if output:
                 print(output)
             if not success:
                 return None, f"Error: Validation failed for {input_dir}"
 
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_content_dir = Path(temp_dir) / "content"
-        shutil.copytree(input_dir, temp_content_dir)
-
-        for pattern in ["*.xml", "*.rels"]:
-            for xml_file in temp_content_dir.rglob(pattern):
-                _condense_xml(xml_file)
-
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        with zipfile.ZipFile(output_path, "w", zipfile.ZIP_DEFLATED) as zf:
-            for f in temp_content_dir.rglob("*"):
-                if f.is_file():
-                    zf.write(f, f.relative_to(temp_content_dir))
+    # XML parts are condensed in memory and written straight into the
+    # archive; the unpacked directory itself is left as it is.
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    temp_output = output_path.with_name(output_path.name + ".tmp")
+    try:
+        files = [f for f in input_dir.rglob("*") if f.is_file()]
+        with zipfile.ZipFile(temp_output, "w", zipfile.ZIP_DEFLATED) as zf:
+            for f in files:
+                arcname = f.relative_to(input_dir)
+                if f.name.endswith((".xml", ".rels")):
+                    info = zipfile.ZipInfo.from_file(f, arcname)
+                    info.compress_type = zipfile.ZIP_DEFLATED
+                    zf.writestr(info, _condense_xml(f))
+                else:
+                    zf.write(f, arcname)
+        os.replace(temp_output, output_path)
+    finally:
+        if temp_output.exists():
+            temp_output.unlink()
 
     return None, f"Successfully packed {input_dir} to {output_file}"
 
@@ -71,9 +86,11 @@ def _run_validation(
     original_file: Path,
     suffix: str,
     infer_author_func=None,
+    jobs: int = 1,
 ) -> tuple[bool, str | None]:
     output_lines = []
     validators = []
+    model = DocumentModel(unpacked_dir, original_file)
 
     if suffix == ".docx":
         author = "Claude"
@@ -84,11 +101,13 @@ def _run_validation(
                 print(f"Warning: {e} Using default author 'Claude'.", file=sys.stderr)
 
         validators = [
-            DOCXSchemaValidator(unpacked_dir, original_file),
-            RedliningValidator(unpacked_dir, original_file, author=author),
+            DOCXSchemaValidator(unpacked_dir, original_file, jobs=jobs, model=model),
+            RedliningValidator(unpacked_dir, original_file, author=author, model=model),
         ]
     elif suffix == ".pptx":
-        validators = [PPTXSchemaValidator(unpacked_dir, original_file)]
+        validators = [
+            PPTXSchemaValidator(unpacked_dir, original_file, jobs=jobs, model=model)
+        ]
 
     if not validators:
         return True, None
@@ -105,24 +124,36 @@ def _run_validation(
     return success, "\n".join(output_lines) if output_lines else None
 
 
-def _condense_xml(xml_file: Path) -> None:
+def _condense_xml(xml_file: Path) -> bytes:
+    """`xml_file` without comments or whitespace-only text, except inside *:t elements."""
     try:
-        with open(xml_file, encoding="utf-8") as f:
-            dom = defusedxml.minidom.parse(f)
+        tree = lxml.etree.parse(str(xml_file), _PARSER)
+        root = tree.getroot()
 
-        for element in dom.getElementsByTagName("*"):
-            if element.tagName.endswith(":t"):
+        for element in root.iter(lxml.etree.Element):
+            if element.prefix and lxml.etree.QName(element).localname == "t":
                 continue
 
-            for child in list(element.childNodes):
-                if (
-                    child.nodeType == child.TEXT_NODE
-                    and child.nodeValue
-                    and child.nodeValue.strip() == ""
-                ) or child.nodeType == child.COMMENT_NODE:
-                    element.removeChild(child)
-
-        xml_file.write_bytes(dom.toxml(encoding="UTF-8"))
+            if element.text and element.text.strip() == "":
+                element.text = None
+            for child in list(element):
+                if child.tail and child.tail.strip() == "":
+                    child.tail = None
+                if child.tag is lxml.etree.Comment:
+                    if child.tail:  # text after the comment stays where it was
+                        previous = child.getprevious()
+                        if previous is not None:
+                            previous.tail = (previous.tail or "") + child.tail
+                        else:
+                            element.text = (element.text or "") + child.tail
+                    element.remove(child)
+
+        nodes = [*reversed(list(root.itersiblings(preceding=True))), root]
+        nodes += root.itersiblings()
+        return b'<?xml version="1.0" encoding="UTF-8"?>' + b"".join(
+            lxml.etree.tostring(node, encoding="UTF-8", with_tail=False)
+            for node in nodes
+        )
     except Exception as e:
         print(f"ERROR: Failed to parse {xml_file.name}: {e}", file=sys.stderr)
         raise
@@ -145,6 +176,13 @@ if __name__ == "__main__":
         metavar="true|false",
         help="Run validation with auto-repair (default: true)",
     )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Validate parts in N parallel processes (0 = one per CPU; default: 1)",
+    )
     args = parser.parse_args()
 
     _, message = pack(
@@ -152,6 +190,7 @@ if __name__ == "__main__":
         args.output_file,
         original_file=args.original,
         validate=args.validate,
+        jobs=args.jobs,
     )
     print(message)
 
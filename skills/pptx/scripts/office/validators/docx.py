@@ -4,23 +4,178 @@ Validator for Word document XML files against XSD schemas.
 
 import random
 import re
-import tempfile
-import zipfile
 
-import defusedxml.minidom
 import lxml.etree
 
 from .base import BaseSchemaValidator
+from .model import PartVisitor, RepairVisitor
+
+WORD_2006_NAMESPACE = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+W_T = f"{{{WORD_2006_NAMESPACE}}}t"
+W_DEL = f"{{{WORD_2006_NAMESPACE}}}del"
+W_INS = f"{{{WORD_2006_NAMESPACE}}}ins"
+W_DEL_TEXT = f"{{{WORD_2006_NAMESPACE}}}delText"
+W_INSTR_TEXT = f"{{{WORD_2006_NAMESPACE}}}instrText"
+
+
+def _preview(text):
+    return repr(text)[:50] + "..." if len(repr(text)) > 50 else repr(text)
+
+
+class DocumentPartVisitor(PartVisitor):
+    """A check that only looks at word/document.xml."""
+
+    def applies(self):
+        return self.xml_file.name == "document.xml"
+
+
+class WhitespaceCheck(DocumentPartVisitor):
+    """<w:t> with leading or trailing whitespace needs xml:space="preserve"."""
+
+    def visit(self, elem, walk):
+        if elem.tag != W_T or not elem.text:
+            return
+        text = elem.text
+        if re.search(r"^[ \t\n\r]", text) or re.search(r"[ \t\n\r]$", text):
+            if elem.get(f"{{{self.validator.XML_NAMESPACE}}}space") != "preserve":
+                self.errors.append(
+                    f"  {self.rel_path}: "
+                    f"Line {elem.sourceline}: w:t element with whitespace missing xml:space='preserve': {_preview(text)}"
+                )
+
+
+class DeletionsCheck(DocumentPartVisitor):
+    """Deleted runs must use <w:delText> / <w:delInstrText>."""
+
+    def __init__(self, validator, xml_file):
+        super().__init__(validator, xml_file)
+        self.instr_errors = []  # reported after the <w:t> ones
+
+    def visit(self, elem, walk):
+        if not walk.inside(W_DEL):
+            return
+        if elem.tag == W_T and elem.text:
+            self.errors.append(
+                f"  {self.rel_path}: "
+                f"Line {elem.sourceline}: <w:t> found within <w:del>: {_preview(elem.text)}"
+            )
+        elif elem.tag == W_INSTR_TEXT:
+            self.instr_errors.append(
+                f"  {self.rel_path}: "
+                f"Line {elem.sourceline}: <w:instrText> found within <w:del> (use <w:delInstrText>): {_preview(elem.text or '')}"
+            )
+
+    def result(self):
+        return self.errors + self.instr_errors
+
+
+class InsertionsCheck(DocumentPartVisitor):
+    """<w:delText> inside <w:ins> (and not inside <w:del>) is invalid."""
+
+    def visit(self, elem, walk):
+        if elem.tag == W_DEL_TEXT and walk.inside(W_INS) and not walk.inside(W_DEL):
+            self.errors.append(
+                f"  {self.rel_path}: "
+                f"Line {elem.sourceline}: <w:delText> within <w:ins>: {_preview(elem.text or '')}"
+            )
+
+
+class IdConstraintsCheck(PartVisitor):
+    """paraId and durableId values must stay below Word's limits."""
+
+    def start(self, root):
+        validator = self.validator
+        self.para_id_attr = f"{{{validator.W14_NAMESPACE}}}paraId"
+        self.durable_id_attr = f"{{{validator.W16CID_NAMESPACE}}}durableId"
+        self.numbering = self.xml_file.name == "numbering.xml"
+
+    def visit(self, elem, walk):
+        parse_id = self.validator._parse_id_value
+        name = self.xml_file.name
+        if val := elem.get(self.para_id_attr):
+            if parse_id(val, base=16) >= 0x80000000:
+                self.errors.append(
+                    f"  {name}:{elem.sourceline}: paraId={val} >= 0x80000000"
+                )
+
+        if val := elem.get(self.durable_id_attr):
+            if self.numbering:
+                try:
+                    if parse_id(val, base=10) >= 0x7FFFFFFF:
+                        self.errors.append(
+                            f"  {name}:{elem.sourceline}: "
+                            f"durableId={val} >= 0x7FFFFFFF"
+                        )
+                except ValueError:
+                    self.errors.append(
+                        f"  {name}:{elem.sourceline}: "
+                        f"durableId={val} must be decimal in numbering.xml"
+                    )
+            else:
+                if parse_id(val, base=16) >= 0x7FFFFFFF:
+                    self.errors.append(
+                        f"  {name}:{elem.sourceline}: "
+                        f"durableId={val} >= 0x7FFFFFFF"
+                    )
+
+    def fail(self, exc):
+        pass  # unparseable parts and malformed IDs are reported by other checks
+
+
+class DurableIdRepair(RepairVisitor):
+    """Replace out-of-range w16cid:durableId values with fresh random ones."""
+
+    def start(self, root):
+        self.durable_id_attr = f"{{{self.validator.W16CID_NAMESPACE}}}durableId"
+        self.numbering = self.xml_file.name == "numbering.xml"
+
+    def visit(self, elem, walk):
+        durable_id = elem.get(self.durable_id_attr)
+        if durable_id is None:
+            return
+
+        try:
+            needs_repair = (
+                self.validator._parse_id_value(
+                    durable_id, base=10 if self.numbering else 16
+                )
+                >= 0x7FFFFFFF
+            )
+        except ValueError:
+            needs_repair = True
+
+        if needs_repair:
+            value = random.randint(1, 0x7FFFFFFE)
+            if self.numbering:
+                new_id = str(value)
+            else:
+                new_id = f"{value:08X}"
+
+            elem.set(self.durable_id_attr, new_id)
+            print(
+                f"  Repaired: {self.xml_file.name}: durableId {durable_id} → {new_id}"
+            )
+            self.repairs += 1
 
 
 class DOCXSchemaValidator(BaseSchemaValidator):
 
-    WORD_2006_NAMESPACE = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+    WORD_2006_NAMESPACE = WORD_2006_NAMESPACE
     W14_NAMESPACE = "http://schemas.microsoft.com/office/word/2010/wordml"
     W16CID_NAMESPACE = "http://schemas.microsoft.com/office/word/2016/wordml/cid"
 
     ELEMENT_RELATIONSHIP_TYPES = {}
 
+    PART_VISITORS = {
+        **BaseSchemaValidator.PART_VISITORS,
+        "whitespace": WhitespaceCheck,
+        "deletions": DeletionsCheck,
+        "insertions": InsertionsCheck,
+        "id_constraints": IdConstraintsCheck,
+    }
+
+    REPAIR_VISITORS = BaseSchemaValidator.REPAIR_VISITORS + (DurableIdRepair,)
+
     def validate(self):
         if not self.validate_xml():
             return False
@@ -64,40 +219,11 @@ class DOCXSchemaValidator(BaseSchemaValidator):
         return all_valid
 
     def validate_whitespace_preservation(self):
-        errors = []
-
-        for xml_file in self.xml_files:
-            if xml_file.name != "document.xml":
-                continue
-
-            try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
-
-                for elem in root.iter(f"{{{self.WORD_2006_NAMESPACE}}}t"):
-                    if elem.text:
-                        text = elem.text
-                        if re.search(r"^[ \t\n\r]", text) or re.search(
-                            r"[ \t\n\r]$", text
-                        ):
-                            xml_space_attr = f"{{{self.XML_NAMESPACE}}}space"
-                            if (
-                                xml_space_attr not in elem.attrib
-                                or elem.attrib[xml_space_attr] != "preserve"
-                            ):
-                                text_preview = (
-                                    repr(text)[:50] + "..."
-                                    if len(repr(text)) > 50
-                                    else repr(text)
-                                )
-                                errors.append(
-                                    f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                                    f"Line {elem.sourceline}: w:t element with whitespace missing xml:space='preserve': {text_preview}"
-                                )
-
-            except (lxml.etree.XMLSyntaxError, Exception) as e:
-                errors.append(
-                    f"  {xml_file.relative_to(self.unpacked_dir)}: Error: {e}"
-                )
+        errors = [
+            error
+            for file_errors in self._results("whitespace").values()
+            for error in file_errors
+        ]
 
         if errors:
             print(f"FAILED - Found {len(errors)} whitespace preservation violations:")
@@ -110,45 +236,11 @@ class DOCXSchemaValidator(BaseSchemaValidator):
             return True
 
     def validate_deletions(self):
-        errors = []
-
-        for xml_file in self.xml_files:
-            if xml_file.name != "document.xml":
-                continue
-
-            try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
-                namespaces = {"w": self.WORD_2006_NAMESPACE}
-
-                for t_elem in root.xpath(".//w:del//w:t", namespaces=namespaces):
-                    if t_elem.text:
-                        text_preview = (
-                            repr(t_elem.text)[:50] + "..."
-                            if len(repr(t_elem.text)) > 50
-                            else repr(t_elem.text)
-                        )
-                        errors.append(
-                            f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                            f"Line {t_elem.sourceline}: <w:t> found within <w:del>: {text_preview}"
-                        )
-
-                for instr_elem in root.xpath(
-                    ".//w:del//w:instrText", namespaces=namespaces
-                ):
-                    text_preview = (
-                        repr(instr_elem.text or "")[:50] + "..."
-                        if len(repr(instr_elem.text or "")) > 50
-                        else repr(instr_elem.text or "")
-                    )
-                    errors.append(
-                        f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                        f"Line {instr_elem.sourceline}: <w:instrText> found within <w:del> (use <w:delInstrText>): {text_preview}"
-                    )
-
-            except (lxml.etree.XMLSyntaxError, Exception) as e:
-                errors.append(
-                    f"  {xml_file.relative_to(self.unpacked_dir)}: Error: {e}"
-                )
+        errors = [
+            error
+            for file_errors in self._results("deletions").values()
+            for error in file_errors
+        ]
 
         if errors:
             print(f"FAILED - Found {len(errors)} deletion validation violations:")
@@ -168,7 +260,7 @@ class DOCXSchemaValidator(BaseSchemaValidator):
                 continue
 
             try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
+                root = self.model.tree(xml_file).getroot()
                 paragraphs = root.findall(f".//{{{self.WORD_2006_NAMESPACE}}}p")
                 count = len(paragraphs)
             except Exception as e:
@@ -184,15 +276,13 @@ class DOCXSchemaValidator(BaseSchemaValidator):
         count = 0
 
         try:
-            with tempfile.TemporaryDirectory() as temp_dir:
-                with zipfile.ZipFile(original, "r") as zip_ref:
-                    zip_ref.extractall(temp_dir)
+            tree = self.model.original_tree("word/document.xml")
+            if tree is None:
+                raise FileNotFoundError(f"word/document.xml not found in {original}")
+            root = tree.getroot()
 
-                doc_xml_path = temp_dir + "/word/document.xml"
-                root = lxml.etree.parse(doc_xml_path).getroot()
-
-                paragraphs = root.findall(f".//{{{self.WORD_2006_NAMESPACE}}}p")
-                count = len(paragraphs)
+            paragraphs = root.findall(f".//{{{self.WORD_2006_NAMESPACE}}}p")
+            count = len(paragraphs)
 
         except Exception as e:
             print(f"Error counting paragraphs in original document: {e}")
@@ -200,35 +290,11 @@ class DOCXSchemaValidator(BaseSchemaValidator):
         return count
 
     def validate_insertions(self):
-        errors = []
-
-        for xml_file in self.xml_files:
-            if xml_file.name != "document.xml":
-                continue
-
-            try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
-                namespaces = {"w": self.WORD_2006_NAMESPACE}
-
-                invalid_elements = root.xpath(
-                    ".//w:ins//w:delText[not(ancestor::w:del)]", namespaces=namespaces
-                )
-
-                for elem in invalid_elements:
-                    text_preview = (
-                        repr(elem.text or "")[:50] + "..."
-                        if len(repr(elem.text or "")) > 50
-                        else repr(elem.text or "")
-                    )
-                    errors.append(
-                        f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                        f"Line {elem.sourceline}: <w:delText> within <w:ins>: {text_preview}"
-                    )
-
-            except (lxml.etree.XMLSyntaxError, Exception) as e:
-                errors.append(
-                    f"  {xml_file.relative_to(self.unpacked_dir)}: Error: {e}"
-                )
+        errors = [
+            error
+            for file_errors in self._results("insertions").values()
+            for error in file_errors
+        ]
 
         if errors:
             print(f"FAILED - Found {len(errors)} insertion validation violations:")
@@ -252,40 +318,11 @@ class DOCXSchemaValidator(BaseSchemaValidator):
         return int(val, base)
 
     def validate_id_constraints(self):
-        errors = []
-        para_id_attr = f"{{{self.W14_NAMESPACE}}}paraId"
-        durable_id_attr = f"{{{self.W16CID_NAMESPACE}}}durableId"
-
-        for xml_file in self.xml_files:
-            try:
-                for elem in lxml.etree.parse(str(xml_file)).iter():
-                    if val := elem.get(para_id_attr):
-                        if self._parse_id_value(val, base=16) >= 0x80000000:
-                            errors.append(
-                                f"  {xml_file.name}:{elem.sourceline}: paraId={val} >= 0x80000000"
-                            )
-
-                    if val := elem.get(durable_id_attr):
-                        if xml_file.name == "numbering.xml":
-                            try:
-                                if self._parse_id_value(val, base=10) >= 0x7FFFFFFF:
-                                    errors.append(
-                                        f"  {xml_file.name}:{elem.sourceline}: "
-                                        f"durableId={val} >= 0x7FFFFFFF"
-                                    )
-                            except ValueError:
-                                errors.append(
-                                    f"  {xml_file.name}:{elem.sourceline}: "
-                                    f"durableId={val} must be decimal in numbering.xml"
-                                )
-                        else:
-                            if self._parse_id_value(val, base=16) >= 0x7FFFFFFF:
-                                errors.append(
-                                    f"  {xml_file.name}:{elem.sourceline}: "
-                                    f"durableId={val} >= 0x7FFFFFFF"
-                                )
-            except Exception:
-                pass
+        errors = [
+            error
+            for file_errors in self._results("id_constraints").values()
+            for error in file_errors
+        ]
 
         if errors:
             print(f"FAILED - {len(errors)} ID constraint violations:")
@@ -312,7 +349,7 @@ class DOCXSchemaValidator(BaseSchemaValidator):
             return True
 
         try:
-            doc_root = lxml.etree.parse(str(document_xml)).getroot()
+            doc_root = self.model.tree(document_xml).getroot()
             namespaces = {"w": self.WORD_2006_NAMESPACE}
 
             range_starts = {
@@ -352,7 +389,7 @@ class DOCXSchemaValidator(BaseSchemaValidator):
 
             comment_ids = set()
             if comments_xml and comments_xml.exists():
-                comments_root = lxml.etree.parse(str(comments_xml)).getroot()
+                comments_root = self.model.tree(comments_xml).getroot()
                 comment_ids = {
                     elem.get(f"{{{self.WORD_2006_NAMESPACE}}}id")
                     for elem in comments_root.xpath(
@@ -383,63 +420,8 @@ class DOCXSchemaValidator(BaseSchemaValidator):
                 print("PASSED - All comment markers properly paired")
             return True
 
-    def repair(self) -> int:
-        repairs = super().repair()
-        repairs += self.repair_durableId()
-        return repairs
-
     def repair_durableId(self) -> int:
-        repairs = 0
-
-        for xml_file in self.xml_files:
-            try:
-                content = xml_file.read_text(encoding="utf-8")
-                dom = defusedxml.minidom.parseString(content)
-                modified = False
-
-                for elem in dom.getElementsByTagName("*"):
-                    if not elem.hasAttribute("w16cid:durableId"):
-                        continue
-
-                    durable_id = elem.getAttribute("w16cid:durableId")
-                    needs_repair = False
-
-                    if xml_file.name == "numbering.xml":
-                        try:
-                            needs_repair = (
-                                self._parse_id_value(durable_id, base=10) >= 0x7FFFFFFF
-                            )
-                        except ValueError:
-                            needs_repair = True
-                    else:
-                        try:
-                            needs_repair = (
-                                self._parse_id_value(durable_id, base=16) >= 0x7FFFFFFF
-                            )
-                        except ValueError:
-                            needs_repair = True
-
-                    if needs_repair:
-                        value = random.randint(1, 0x7FFFFFFE)
-                        if xml_file.name == "numbering.xml":
-                            new_id = str(value)  
-                        else:
-                            new_id = f"{value:08X}"  
-
-                        elem.setAttribute("w16cid:durableId", new_id)
-                        print(
-                            f"  Repaired: {xml_file.name}: durableId {durable_id} → {new_id}"
-                        )
-                        repairs += 1
-                        modified = True
-
-                if modified:
-                    xml_file.write_bytes(dom.toxml(encoding="UTF-8"))
-
-            except Exception:
-                pass
-
-        return repairs
+        return self._repair([DurableIdRepair])
 
 
 if __name__ == "__main__":
@@ -2,19 +2,26 @@
 Validator for tracked changes in Word documents.
 """
 
+import copy
 import subprocess
 import tempfile
-import zipfile
 from pathlib import Path
 
+import lxml.etree
+
+from .model import DocumentModel
+
 
 class RedliningValidator:
 
-    def __init__(self, unpacked_dir, original_docx, verbose=False, author="Claude"):
+    def __init__(
+        self, unpacked_dir, original_docx, verbose=False, author="Claude", model=None
+    ):
         self.unpacked_dir = Path(unpacked_dir)
         self.original_docx = Path(original_docx)
         self.verbose = verbose
         self.author = author
+        self.model = model or DocumentModel(self.unpacked_dir, self.original_docx)
         self.namespaces = {
             "w": "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
         }
@@ -28,11 +35,12 @@ class RedliningValidator:
             print(f"FAILED - Modified document.xml not found at {modified_file}")
             return False
 
-        try:
-            import xml.etree.ElementTree as ET
+        # Parsed once and shared with the schema validators; the trees are
+        # only read here, and the copies below are what gets rewritten.
+        modified_path = self.model.unpacked_dir / "word" / "document.xml"
 
-            tree = ET.parse(modified_file)
-            root = tree.getroot()
+        try:
+            root = self.model.tree(modified_path).getroot()
 
             del_elements = root.findall(".//w:del", self.namespaces)
             ins_elements = root.findall(".//w:ins", self.namespaces)
@@ -56,50 +64,42 @@ class RedliningValidator:
         except Exception:
             pass
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-
-            try:
-                with zipfile.ZipFile(self.original_docx, "r") as zip_ref:
-                    zip_ref.extractall(temp_path)
-            except Exception as e:
-                print(f"FAILED - Error unpacking original docx: {e}")
-                return False
-
-            original_file = temp_path / "word" / "document.xml"
-            if not original_file.exists():
-                print(
-                    f"FAILED - Original document.xml not found in {self.original_docx}"
-                )
-                return False
+        try:
+            original_tree = self.model.original_tree("word/document.xml")
+        except lxml.etree.XMLSyntaxError as e:
+            print(f"FAILED - Error parsing XML files: {e}")
+            return False
+        except Exception as e:
+            print(f"FAILED - Error unpacking original docx: {e}")
+            return False
 
-            try:
-                import xml.etree.ElementTree as ET
+        if original_tree is None:
+            print(f"FAILED - Original document.xml not found in {self.original_docx}")
+            return False
 
-                modified_tree = ET.parse(modified_file)
-                modified_root = modified_tree.getroot()
-                original_tree = ET.parse(original_file)
-                original_root = original_tree.getroot()
-            except ET.ParseError as e:
-                print(f"FAILED - Error parsing XML files: {e}")
-                return False
+        try:
+            modified_root = copy.deepcopy(self.model.tree(modified_path).getroot())
+            original_root = copy.deepcopy(original_tree.getroot())
+        except lxml.etree.XMLSyntaxError as e:
+            print(f"FAILED - Error parsing XML files: {e}")
+            return False
 
-            self._remove_author_tracked_changes(original_root)
-            self._remove_author_tracked_changes(modified_root)
+        self._remove_author_tracked_changes(original_root)
+        self._remove_author_tracked_changes(modified_root)
 
-            modified_text = self._extract_text_content(modified_root)
-            original_text = self._extract_text_content(original_root)
+        modified_text = self._extract_text_content(modified_root)
+        original_text = self._extract_text_content(original_root)
 
-            if modified_text != original_text:
-                error_message = self._generate_detailed_diff(
-                    original_text, modified_text
-                )
-                print(error_message)
-                return False
+        if modified_text != original_text:
+            error_message = self._generate_detailed_diff(
+                original_text, modified_text
+            )
+            print(error_message)
+            return False
 
-            if self.verbose:
-                print(f"PASSED - All changes by {self.author} are properly tracked")
-            return True
+        if self.verbose:
+            print(f"PASSED - All changes by {self.author} are properly tracked")
+        return True
 
     def _generate_detailed_diff(self, original_text, modified_text):
         error_parts = [
@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+"""Fetch RSS feeds, job boards and event sources concurrently with asyncio.
+
+Optional engine (requires `pip install aiohttp`). Every source across
+`rss_feeds`, `job_boards` and `event_sources` is requested at once, bounded by
+one global connection limit and a per-host limit, so a run takes about as long
+as its slowest source instead of a sum of thread-pool batches. Responses are
+handed to the same parser functions the synchronous fetchers use, so the
+output is identical to running fetch_rss.py, fetch_jobs.py and fetch_events.py.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+try:
+    import yaml
+except ImportError:
+    print("ERROR: PyYAML not installed. Run: pip install pyyaml")
+    sys.exit(1)
+
+import content_store
+import fetch_events
+import fetch_jobs
+import fetch_rss
+from browser_pool import BrowserPool
+from http_client import (ACCEPT_ENCODING, BACKOFF_FACTOR, BACKOFF_MAX, MAX_RETRIES,
+                         REQUEST_TIMEOUT, RETRY_STATUSES)
+
+MAX_CONNECTIONS = 32  # global cap on open connections across all sources
+PER_HOST_LIMIT = 4    # cap per host, so one board can't starve the others
+
+
+class FetchError(Exception):
+    """Non-retryable HTTP failure (4xx, or retries exhausted)."""
+
+
+def _retry_delay(resp, attempt):
+    """Seconds to wait before the next attempt (Retry-After wins, capped at BACKOFF_MAX)."""
+    retry_after = resp.headers.get("Retry-After") if resp is not None else None
+    if retry_after:
+        try:
+            return min(max(0.0, float(retry_after)), BACKOFF_MAX)
+        except ValueError:
+            try:
+                delta = parsedate_to_datetime(retry_after) - datetime.now(timezone.utc)
+                return min(max(0.0, delta.total_seconds()), BACKOFF_MAX)
+            except (TypeError, ValueError):
+                pass
+    return min(BACKOFF_FACTOR * (2 ** attempt), BACKOFF_MAX)
+
+
+async def fetch_bytes(session, url, headers=None, allow_304=False, insecure_fallback=False):
+    """GET `url`, retrying like http_client does; returns (status, headers, body).
+
+    With `insecure_fallback`, an SSL error is retried once without certificate
+    verification (only the HTML news scraper does this, as in fetch_rss.py).
+    """
+    ssl = None
+    for attempt in range(MAX_RETRIES + 1):
+        try:
+            async with session.get(url, headers=headers, ssl=ssl) as resp:
+                if resp.status == 304 and allow_304:
+                    return resp.status, resp.headers, b""
+                if resp.status in RETRY_STATUSES and attempt < MAX_RETRIES:
+                    await asyncio.sleep(_retry_delay(resp, attempt))
+                    continue
+                if resp.status >= 400:
+                    raise FetchError(f"HTTP {resp.status} for {url}")
+                return resp.status, resp.headers, await resp.read()
+        except aiohttp.ClientSSLError:
+            if not insecure_fallback or ssl is False:
+                raise
+            # Retry without SSL verification (corporate proxies, etc.)
+            ssl = False
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            if attempt >= MAX_RETRIES:
+                raise
+            await asyncio.sleep(_retry_delay(None, attempt))
+    raise FetchError(f"retries exhausted for {url}")
+
+
+def _decode(body, headers):
+    """Decode a response body using its declared charset (UTF-8 fallback)."""
+    charset = "utf-8"
+    content_type = headers.get("Content-Type", "")
+    if "charset=" in content_type:
+        charset = content_type.split("charset=", 1)[1].split(";", 1)[0].strip().strip('"')
+    try:
+        return body.decode(charset, errors="replace")
+    except LookupError:
+        return body.decode("utf-8", errors="replace")
+
+
+# ---------------------------------------------------------------------------
+# Per-source tasks — each returns a list and never raises
+# ---------------------------------------------------------------------------
+
+async def _rss_task(session, feed_config, max_per_feed, cache):
+    url = feed_config.get("url", "")
+    category = feed_config.get("category", "general")
+    feed_type = feed_config.get("type", "rss")
+    if not url:
+        return []
+    print(f"Fetching ({feed_type}): {url} ({category})")
+    try:
+        if feed_type == "html":
+            _, headers, body = await fetch_bytes(session, url, fetch_rss.HEADERS,
+                                                 insecure_fallback=True)
+            articles = await asyncio.to_thread(
+                fetch_rss.parse_html_articles, _decode(body, headers), url, category)
+            return articles[:max_per_feed]
+
+        cached = cache.get(url) if cache is not None else None
+        status, headers, body = await fetch_bytes(
+            session, url, {**fetch_rss.HEADERS, **fetch_rss.conditional_headers(cached)},
+            allow_304=cached is not None)
+        if status == 304:
+            cache.touch(url)
+            return fetch_rss.cached_articles(cached, category)[:max_per_feed]
+        articles = await asyncio.to_thread(
+            fetch_rss.parse_feed, body, url, category, dict(headers))
+        if cache is not None:
+            fetch_rss.update_cache(cache, url, headers, articles)
+        return articles[:max_per_feed]
+    except Exception as e:
+        print(f"WARNING: Failed to fetch {url}: {e}", file=sys.stderr)
+        return []
+
+
+async def _job_task(session, board, interests):
+    url = board.get("url", "")
+    if not url:
+        return []
+    print(f"Fetching jobs ({board.get('type', 'html')}): {url}")
+    try:
+        _, headers, body = await fetch_bytes(session, url, fetch_jobs.HEADERS)
+        # RSS boards are parsed from bytes so the XML declaration's encoding applies.
+        payload = body if board.get("type", "html") == "rss" else _decode(body, headers)
+        jobs = await asyncio.to_thread(
+            fetch_jobs.parse_jobs_for_board, board, payload, interests)
+    except Exception as e:
+        print(f"WARNING: Failed to fetch {url}: {e}", file=sys.stderr)
+        return []
+    print(f"  Found {len(jobs)} listings")
+    return fetch_jobs.filter_by_location(jobs, board.get("location_filter", ""))
+
+
+async def _event_task(session, source, browser):
+    url = source.get("url", "")
+    source_type = source.get("type", "html")
+    location_filter = source.get("location_filter", "")
+    if not url:
+        return []
+    print(f"Fetching events ({source_type}): {url}")
+    try:
+        if source_type == "playwright":
+            # Browser-rendered pages don't go through aiohttp; they share
+            # the run's BrowserPool instead.
+            events = await asyncio.to_thread(
+                fetch_events.fetch_playwright_events, url, location_filter, browser)
+        else:
+            _, headers, body = await fetch_bytes(session, url, fetch_events.HEADERS)
+            if source_type == "api":
+                events = fetch_events.parse_api_events(json.loads(body), url)
+            else:
+                events = await asyncio.to_thread(
+                    fetch_events.parse_event_page, _decode(body, headers), url)
+    except Exception as e:
+        print(f"WARNING: Failed to fetch {url}: {e}", file=sys.stderr)
+        return []
+    return fetch_events.filter_by_location(events, location_filter)
+
+
+# ---------------------------------------------------------------------------
+# Engine
+# ---------------------------------------------------------------------------
+
+async def fetch_everything(sources, interests, max_per_feed=10,
+                           feed_cache_path=fetch_rss.FEED_CACHE_PATH):
+    """Fetch every configured source concurrently.
+
+    Returns {"articles": [...], "jobs": [...], "events": [...]}, each list
+    post-processed (sorted, deduplicated, link-checked) exactly as the
+    synchronous fetchers' fetch_all() would.
+    """
+    rss_feeds = sources.get("rss_feeds") or []
+    job_boards = sources.get("job_boards") or []
+    event_sources = sources.get("event_sources") or []
+    cache = fetch_rss.FeedCache(feed_cache_path) if feed_cache_path else None
+    browser = None
+    if fetch_events._PLAYWRIGHT_AVAILABLE and any(
+            s.get("type") == "playwright" for s in event_sources):
+        browser = BrowserPool()
+
+    connector = aiohttp.TCPConnector(limit=MAX_CONNECTIONS, limit_per_host=PER_HOST_LIMIT)
+    # Per-socket limits like requests' timeout=: a `total` would also count
+    # the time a request spends queued for a per-host connection slot.
+    timeout = aiohttp.ClientTimeout(total=None, sock_connect=REQUEST_TIMEOUT,
+                                    sock_read=REQUEST_TIMEOUT)
+    try:
+        async with aiohttp.ClientSession(
+            connector=connector, timeout=timeout,
+            headers={"Accept-Encoding": ACCEPT_ENCODING},
+        ) as session:
+            rss_tasks = [_rss_task(session, fc, max_per_feed, cache) for fc in rss_feeds]
+            job_tasks = [_job_task(session, b, interests) for b in job_boards]
+            event_tasks = [_event_task(session, s, browser) for s in event_sources]
+            results = await asyncio.gather(*rss_tasks, *job_tasks, *event_tasks)
+    finally:
+        if browser is not None:
+            await asyncio.to_thread(browser.close)
+
+    n_rss, n_jobs = len(rss_tasks), len(job_tasks)
+    articles = [a for r in results[:n_rss] for a in r]
+    jobs = [j for r in results[n_rss:n_rss + n_jobs] for j in r]
+    events = [e for r in results[n_rss + n_jobs:] for e in r]
+
+    if cache is not None:
+        try:
+            cache.save()
+        except OSError as e:
+            print(f"WARNING: could not write feed cache {feed_cache_path}: {e}", file=sys.stderr)
+
+    articles.sort(key=lambda x: x.get("published", ""), reverse=True)
+    jobs = await asyncio.to_thread(fetch_jobs.finalize_jobs, jobs)
+    events.sort(key=lambda x: x.get("date", ""))
+    return {"articles": articles, "jobs": jobs, "events": events}
+
+
+def fetch_all(sources, interests, **kwargs):
+    """Synchronous entry point: run fetch_everything() on a fresh event loop."""
+    if aiohttp is None:
+        raise RuntimeError("aiohttp not installed. Run: pip install aiohttp")
+    return asyncio.run(fetch_everything(sources, interests, **kwargs))
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Fetch RSS feeds, job listings and events concurrently (asyncio)")
+    parser.add_argument("--config", required=True, help="Path to sources.yaml")
+    parser.add_argument("--interests", required=True, help="Path to interests.yaml")
+    parser.add_argument("--output-dir",
+                        help="Directory for rss.json, jobs.json and events.json")
+    parser.add_argument("--max-per-feed", type=int, default=10, help="Max articles per feed")
+    content_store.add_cli_args(parser)
+    args = parser.parse_args()
+    if not args.output_dir and not args.store:
+        parser.error("one of --output-dir or --store is required")
+
+    if aiohttp is None:
+        print("ERROR: aiohttp not installed. Run: pip install aiohttp")
+        sys.exit(1)
+
+    with open(args.config, "r", encoding="utf-8") as f:
+        sources = yaml.safe_load(f) or {}
+    with open(args.interests, "r", encoding="utf-8") as f:
+        interests = yaml.safe_load(f) or {}
+
+    content = fetch_all(sources, interests, max_per_feed=args.max_per_feed)
+
+    for name, key in (("rss.json", "articles"), ("jobs.json", "jobs"), ("events.json", "events")):
+        output = os.path.join(args.output_dir, name) if args.output_dir else None
+        content_store.write_results(key, content[key], output, args.store, args.date)
+
+    print(f"Fetched {len(content['articles'])} articles, {len(content['jobs'])} jobs, "
+          f"{len(content['events'])} events → {args.output_dir or args.store}")
+
+
+if __name__ == "__main__":
+    main()
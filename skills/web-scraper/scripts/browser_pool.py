@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""One headless Chromium per run, shared by every Playwright event source.
+
+`BrowserPool` starts Playwright and Chromium once, on a private event-loop
+thread, and serves each request from a fresh browser context (isolated
+cookies/storage) with images, fonts and media blocked so `networkidle` is
+reached sooner. Its methods are plain blocking calls, safe to use from any
+number of fetcher threads; at most MAX_PAGES pages are open at once.
+
+Local files work too (a `file://` URL or a filesystem path), so sources can be
+exercised offline against saved HTML fixtures.
+"""
+
+import asyncio
+import os
+import threading
+from pathlib import Path
+
+try:
+    from playwright.async_api import async_playwright
+    PLAYWRIGHT_AVAILABLE = True
+except ImportError:
+    PLAYWRIGHT_AVAILABLE = False
+
+MAX_PAGES = 4
+NAV_TIMEOUT_MS = 30000
+BLOCKED_RESOURCE_TYPES = {"image", "font", "media"}
+
+JSONLD_SELECTOR = 'script[type="application/ld+json"]'
+
+
+def to_url(target):
+    """Return `target` as a URL, turning local filesystem paths into file:// URIs."""
+    if "://" in target:
+        return target
+    return Path(os.path.expanduser(target)).resolve().as_uri()
+
+
+async def _block_heavy_resources(route):
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+class BrowserPool:
+    """Shared headless Chromium; use as a context manager or call close()."""
+
+    def __init__(self, max_pages=MAX_PAGES):
+        if not PLAYWRIGHT_AVAILABLE:
+            raise RuntimeError(
+                "playwright not installed. Run: pip install playwright && playwright install chromium")
+        self.max_pages = max_pages
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever,
+                                        name="browser-pool", daemon=True)
+        self._thread.start()
+        self._playwright = None
+        self._browser = None
+        self._start_lock = None  # created on the pool's loop
+        self._pages = None
+        self._closed = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _call(self, coro):
+        """Run `coro` on the pool's loop and wait for its result."""
+        if self._closed:
+            coro.close()
+            raise RuntimeError("browser pool is closed")
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
+    async def _ensure_browser(self):
+        if self._start_lock is None:
+            self._start_lock = asyncio.Lock()
+            self._pages = asyncio.Semaphore(self.max_pages)
+        async with self._start_lock:
+            if self._browser is None:
+                self._playwright = await async_playwright().start()
+                self._browser = await self._playwright.chromium.launch(headless=True)
+        return self._browser
+
+    async def _eval_all(self, url, selector, expression, wait_until, timeout_ms):
+        browser = await self._ensure_browser()
+        async with self._pages:
+            context = await browser.new_context()
+            try:
+                await context.route("**/*", _block_heavy_resources)
+                page = await context.new_page()
+                await page.goto(url, wait_until=wait_until, timeout=timeout_ms)
+                return await page.eval_on_selector_all(selector, expression)
+            finally:
+                await context.close()
+
+    def eval_on_selector_all(self, target, selector, expression,
+                             wait_until="networkidle", timeout_ms=NAV_TIMEOUT_MS):
+        """Load `target` in a fresh context and evaluate `expression` over `selector` matches."""
+        return self._call(self._eval_all(to_url(target), selector, expression,
+                                         wait_until, timeout_ms))
+
+    def jsonld_texts(self, target, timeout_ms=NAV_TIMEOUT_MS):
+        """Raw text of every JSON-LD <script> on the rendered page."""
+        return self.eval_on_selector_all(target, JSONLD_SELECTOR,
+                                         "els => els.map(e => e.textContent)",
+                                         timeout_ms=timeout_ms)
+
+    async def _shutdown(self):
+        if self._browser is not None:
+            await self._browser.close()
+        if self._playwright is not None:
+            await self._playwright.stop()
+
+    def close(self):
+        """Close Chromium and stop the pool's loop thread (idempotent)."""
+        if self._closed:
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(self._shutdown(), self._loop).result()
+        finally:
+            self._closed = True
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+            self._loop.close()
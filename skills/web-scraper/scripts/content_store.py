@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""Durable SQLite store for fetched articles, jobs and events.
+
+Fetchers upsert their results here instead of handing JSON files through a
+temp dir, and the renderer reads a day's content back with indexed queries.
+Each item is keyed by its URL (events: URL, title and start date) and
+remembers when it was first and last fetched, so history ("which jobs are new
+this week?") is one query.
+
+Tables:
+    articles / jobs / events  (url_hash PK = hash of item_key, item_key, url,
+                              data JSON, first_seen, last_seen) — the latest
+                              version of every item
+    snapshots                 (kind, day, rank, url_hash, data JSON) — the
+                              ordered item list a fetcher produced for an
+                              edition day, with each item as it was that day;
+                              re-running a day replaces that day's snapshot.
+
+Loading a day reads the snapshot's own payloads, so re-rendering a past
+edition shows that day's content even after the items were re-fetched.
+
+The database runs in WAL mode, so the three fetchers can write concurrently
+while a reader (the renderer) is open.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+from datetime import date
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.abspath(os.path.join(SCRIPT_DIR, "..", "..", ".."))
+
+STORE_PATH = os.path.join(PROJECT_ROOT, "memory", "content.db")
+KINDS = ("articles", "jobs", "events")
+BUSY_TIMEOUT_S = 30
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS {kind} (
+    url_hash   TEXT PRIMARY KEY,
+    item_key   TEXT NOT NULL,
+    url        TEXT NOT NULL,
+    data       TEXT NOT NULL,
+    first_seen TEXT NOT NULL,
+    last_seen  TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_{kind}_first_seen ON {kind}(first_seen);
+CREATE INDEX IF NOT EXISTS idx_{kind}_last_seen ON {kind}(last_seen);
+"""
+_SNAPSHOT_SCHEMA = """
+CREATE TABLE IF NOT EXISTS snapshots (
+    kind     TEXT NOT NULL,
+    day      TEXT NOT NULL,
+    rank     INTEGER NOT NULL,
+    url_hash TEXT NOT NULL,
+    data     TEXT,
+    PRIMARY KEY (kind, day, rank)
+);
+"""
+
+
+def today():
+    return date.today().isoformat()
+
+
+def item_key(item, kind=None):
+    """Stable key for an item: its URL, else its title + source.
+
+    Events also include their title and start date. Listing pages often give
+    every event the page's own URL (fetch_events falls back to the source
+    URL), so the URL alone would merge all of them into one.
+    """
+    url = str(item.get("url", "") or "").strip()
+    if kind == "events":
+        title = str(item.get("title", "") or "").strip().lower()
+        start = str(item.get("date", "") or "").strip()
+        if url:
+            return f"{url}|{title}|{start}"
+        return f"{item.get('title', '')}|{item.get('source', '')}|{start}".strip().lower()
+    if url:
+        return url
+    return f"{item.get('title', '')}|{item.get('source', '')}".strip().lower()
+
+
+def url_hash(key):
+    return hashlib.sha1(key.encode("utf-8")).hexdigest()
+
+
+def _check_kind(kind):
+    if kind not in KINDS:
+        raise ValueError(f"unknown content kind: {kind!r} (expected one of {KINDS})")
+
+
+def _columns(conn, table):
+    return {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+
+
+def _migrate(conn):
+    """Upgrade a database written before item_key and per-day payloads existed.
+
+    The key moves out of `url` into `item_key`; old snapshots get the item's
+    current payload, the only version that was kept.
+    """
+    for kind in KINDS:
+        if "item_key" in _columns(conn, kind):
+            continue
+        conn.execute(f"ALTER TABLE {kind} ADD COLUMN item_key TEXT NOT NULL DEFAULT ''")
+        rows = conn.execute(f"SELECT url_hash, url, data FROM {kind}").fetchall()
+        conn.executemany(
+            f"UPDATE {kind} SET item_key = ?, url = ? WHERE url_hash = ?",
+            [(key, str(json.loads(data).get("url", "") or ""), h) for h, key, data in rows])
+    if "data" not in _columns(conn, "snapshots"):
+        conn.execute("ALTER TABLE snapshots ADD COLUMN data TEXT")
+        for kind in KINDS:
+            conn.execute(
+                f"UPDATE snapshots SET data = (SELECT t.data FROM {kind} t "
+                "WHERE t.url_hash = snapshots.url_hash) WHERE kind = ?", (kind,))
+
+
+def _storable(item):
+    """Drop in-process annotations (keys starting with '_') before storing."""
+    return {k: v for k, v in item.items() if not str(k).startswith("_")}
+
+
+class ContentStore:
+    """One connection to the content database; use as a context manager."""
+
+    def __init__(self, path=STORE_PATH):
+        self.path = path
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.conn = sqlite3.connect(path, timeout=BUSY_TIMEOUT_S)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        with self.conn:
+            for kind in KINDS:
+                self.conn.executescript(_SCHEMA.format(kind=kind))
+            self.conn.executescript(_SNAPSHOT_SCHEMA)
+            _migrate(self.conn)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self.conn.close()
+
+    def save(self, kind, items, day=None):
+        """Upsert `items` and make them (in order) the `kind` snapshot for `day`."""
+        _check_kind(kind)
+        day = day or today()
+        rows, ranks, seen = [], [], set()
+        for item in items:
+            key = item_key(item, kind)
+            h = url_hash(key)
+            if h in seen:
+                continue
+            seen.add(h)
+            data = json.dumps(_storable(item), ensure_ascii=False)
+            url = str(item.get("url", "") or "").strip()
+            rows.append((h, key, url, data, day, day))
+            ranks.append((kind, day, len(ranks), h, data))
+        with self.conn:
+            self.conn.executemany(
+                f"INSERT INTO {kind} (url_hash, item_key, url, data, first_seen, last_seen) "
+                "VALUES (?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT(url_hash) DO UPDATE SET item_key = excluded.item_key, "
+                "url = excluded.url, data = excluded.data, "
+                "first_seen = min(first_seen, excluded.first_seen), "
+                "last_seen = max(last_seen, excluded.last_seen)",
+                rows,
+            )
+            self.conn.execute("DELETE FROM snapshots WHERE kind = ? AND day = ?", (kind, day))
+            self.conn.executemany(
+                "INSERT INTO snapshots (kind, day, rank, url_hash, data) VALUES (?, ?, ?, ?, ?)",
+                ranks)
+        return len(rows)
+
+    def load(self, kind, day=None):
+        """Items of the `kind` snapshot for `day`, as saved that day and in that order."""
+        _check_kind(kind)
+        day = day or today()
+        cur = self.conn.execute(
+            f"SELECT coalesce(s.data, t.data), t.first_seen FROM snapshots s JOIN {kind} t "
+            "ON t.url_hash = s.url_hash WHERE s.kind = ? AND s.day = ? ORDER BY s.rank",
+            (kind, day),
+        )
+        items = []
+        for data, first_seen in cur:
+            item = json.loads(data)
+            item.setdefault("first_seen", first_seen)
+            items.append(item)
+        return items
+
+    def load_content(self, day=None):
+        """{"articles": [...], "jobs": [...], "events": [...]} for one edition day."""
+        return {kind: self.load(kind, day) for kind in KINDS}
+
+    def days(self, kind):
+        """Edition days that have a `kind` snapshot, newest first."""
+        _check_kind(kind)
+        cur = self.conn.execute(
+            "SELECT DISTINCT day FROM snapshots WHERE kind = ? ORDER BY day DESC", (kind,))
+        return [row[0] for row in cur]
+
+    def first_seen_since(self, kind, since):
+        """Items first fetched on or after day `since` (newest first)."""
+        _check_kind(kind)
+        cur = self.conn.execute(
+            f"SELECT data, first_seen FROM {kind} WHERE first_seen >= ? "
+            "ORDER BY first_seen DESC", (since,))
+        return [dict(json.loads(data), first_seen=first_seen) for data, first_seen in cur]
+
+
+def save_items(kind, items, path=STORE_PATH, day=None):
+    """Open the store at `path`, save one snapshot, close it."""
+    with ContentStore(path) as store:
+        return store.save(kind, items, day)
+
+
+def load_content(path=STORE_PATH, day=None):
+    """Open the store at `path` and load one edition day's content."""
+    with ContentStore(path) as store:
+        return store.load_content(day)
+
+
+def add_cli_args(parser):
+    """Add the fetchers' shared --store / --date options to an argparse parser."""
+    parser.add_argument("--store", nargs="?", const=STORE_PATH, default=None,
+                        help="Upsert results into the SQLite content store "
+                             "(default path: memory/content.db)")
+    parser.add_argument("--date", default=None,
+                        help="Edition day (YYYY-MM-DD) for the store snapshot (default: today)")
+
+
+def write_results(kind, items, output=None, store=None, day=None):
+    """Write fetcher results to a JSON file and/or the content store."""
+    if output:
+        os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+        with open(output, "w", encoding="utf-8") as f:
+            json.dump(items, f, indent=2)
+    if store:
+        save_items(kind, items, store, day)
@@ -3,23 +3,19 @@
 
 import argparse
 import json
-import os
 import sys
-import time
 from urllib.parse import urljoin
 
 try:
-    import requests
+    import http_client
     from bs4 import BeautifulSoup
 except ImportError:
     print("ERROR: Missing dependencies. Run: pip install requests beautifulsoup4")
     sys.exit(1)
 
-try:
-    from playwright.sync_api import sync_playwright
-    _PLAYWRIGHT_AVAILABLE = True
-except ImportError:
-    _PLAYWRIGHT_AVAILABLE = False
+import content_store
+from browser_pool import PLAYWRIGHT_AVAILABLE as _PLAYWRIGHT_AVAILABLE
+from browser_pool import BrowserPool
 
 try:
     import yaml
@@ -34,10 +30,6 @@ try:
 except ImportError:
     pass
 
-MAX_RETRIES = 3
-RETRY_DELAY = 2
-REQUEST_TIMEOUT = 30
-
 HEADERS = {
     "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
 }
@@ -208,128 +200,196 @@ def extract_html_events(soup, source_url):
 
 def fetch_api_events(url, location_filter=""):
     """Fetch events from a JSON API (e.g. Luma, custom APIs)."""
-    for attempt in range(MAX_RETRIES):
+    try:
+        resp = http_client.get(url, headers=HEADERS)
+        resp.raise_for_status()
+        return parse_api_events(resp.json(), url)
+    except Exception as e:
+        print(f"WARNING: Failed to fetch API {url}: {e}", file=sys.stderr)
+        return []
+
+
+def parse_api_events(data, url):
+    """Convert a decoded JSON API payload into event dicts."""
+    raw = data if isinstance(data, list) else data.get("events", data.get("data", []))
+    events = []
+    for item in raw:
+        title = item.get("name", item.get("title", ""))
+        if not title:
+            continue
+        events.append({
+            "title": title,
+            "date": item.get("start_at", item.get("date", ""))[:10],
+            "location": item.get("geo_address_info", {}).get("city", item.get("location", "TBD")),
+            "url": item.get("url", ""),
+            "source": url,
+            "type": "event",
+        })
+    return events
+
+
+def fetch_playwright_events(url, location_filter="", pool=None):
+    """Fetch events from JS-rendered pages using Playwright (extracts JSON-LD).
+
+    `pool` is the run's shared BrowserPool; without one a single-use browser
+    is started for this call.
+    """
+    if not _PLAYWRIGHT_AVAILABLE:
+        print(f"WARNING: playwright not installed, skipping {url}. Run: pip install playwright && playwright install chromium", file=sys.stderr)
+        return []
+    try:
+        if pool is not None:
+            jsonld_texts = pool.jsonld_texts(url)
+        else:
+            with BrowserPool(max_pages=1) as own_pool:
+                jsonld_texts = own_pool.jsonld_texts(url)
+        return parse_jsonld_texts(jsonld_texts, url)
+    except Exception as e:
+        print(f"WARNING: Playwright fetch failed for {url}: {e}", file=sys.stderr)
+        return []
+
+
+def parse_jsonld_texts(jsonld_texts, url):
+    """Convert raw JSON-LD script texts from a rendered page into event dicts."""
+    events = []
+    for text in jsonld_texts:
         try:
-            resp = requests.get(url, headers=HEADERS, timeout=REQUEST_TIMEOUT)
-            resp.raise_for_status()
-            data = resp.json()
-
-            raw = data if isinstance(data, list) else data.get("events", data.get("data", []))
-            events = []
-            for item in raw:
-                title = item.get("name", item.get("title", ""))
+            data = json.loads(text)
+        except (json.JSONDecodeError, TypeError):
+            continue
+        # ItemList wrapping Event items (e.g. Luma community pages)
+        if isinstance(data, dict) and data.get("@type") == "ItemList":
+            for list_item in data.get("itemListElement", []):
+                item = list_item.get("item", list_item)
+                if not isinstance(item, dict):
+                    continue
+                if "Event" not in str(item.get("@type", "")):
+                    continue
+                title = item.get("name", "")
                 if not title:
                     continue
+                start = item.get("startDate", "")
+                loc = item.get("location", {})
+                if isinstance(loc, dict):
+                    addr = loc.get("address", {})
+                    location = (
+                        addr.get("addressLocality", "") if isinstance(addr, dict)
+                        else str(addr)
+                    ) or loc.get("name", "")
+                else:
+                    location = str(loc) if loc else ""
                 events.append({
                     "title": title,
-                    "date": item.get("start_at", item.get("date", ""))[:10],
-                    "location": item.get("geo_address_info", {}).get("city", item.get("location", "TBD")),
-                    "url": item.get("url", ""),
+                    "date": start[:10] if start else "",
+                    "location": location or "TBD",
+                    "url": item.get("url", url),
                     "source": url,
+                    "description": item.get("description", "") or "",
                     "type": "event",
                 })
-            return events
-        except Exception as e:
-            if attempt < MAX_RETRIES - 1:
-                time.sleep(RETRY_DELAY * (attempt + 1))
-            else:
-                print(f"WARNING: Failed to fetch API {url}: {e}", file=sys.stderr)
-                return []
+        # Direct Event or list of Events
+        else:
+            soup = BeautifulSoup(f'<script type="application/ld+json">{text}</script>', "html.parser")
+            events.extend(extract_jsonld_events(soup, url))
+    return events
 
 
-def fetch_playwright_events(url, location_filter=""):
-    """Fetch events from JS-rendered pages using Playwright (extracts JSON-LD)."""
-    if not _PLAYWRIGHT_AVAILABLE:
-        print(f"WARNING: playwright not installed, skipping {url}. Run: pip install playwright && playwright install chromium", file=sys.stderr)
-        return []
+def fetch_event_source(url, location_filter=""):
+    """Fetch events from a single source URL (HTML + JSON-LD)."""
     try:
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
-            page = browser.new_page()
-            page.goto(url, wait_until="networkidle", timeout=30000)
-            jsonld_texts = page.eval_on_selector_all(
-                'script[type="application/ld+json"]',
-                "els => els.map(e => e.textContent)"
-            )
-            browser.close()
+        resp = http_client.get(url, headers=HEADERS)
+        resp.raise_for_status()
+        return parse_event_page(resp.text, url)
+    except Exception as e:
+        print(f"WARNING: Failed to fetch {url}: {e}", file=sys.stderr)
+        return []
 
-        events = []
-        for text in jsonld_texts:
-            try:
-                data = json.loads(text)
-            except (json.JSONDecodeError, TypeError):
-                continue
-            # ItemList wrapping Event items (e.g. Luma community pages)
-            if isinstance(data, dict) and data.get("@type") == "ItemList":
-                for list_item in data.get("itemListElement", []):
-                    item = list_item.get("item", list_item)
-                    if not isinstance(item, dict):
-                        continue
-                    if "Event" not in str(item.get("@type", "")):
-                        continue
-                    title = item.get("name", "")
-                    if not title:
-                        continue
-                    start = item.get("startDate", "")
-                    loc = item.get("location", {})
-                    if isinstance(loc, dict):
-                        addr = loc.get("address", {})
-                        location = (
-                            addr.get("addressLocality", "") if isinstance(addr, dict)
-                            else str(addr)
-                        ) or loc.get("name", "")
-                    else:
-                        location = str(loc) if loc else ""
-                    events.append({
-                        "title": title,
-                        "date": start[:10] if start else "",
-                        "location": location or "TBD",
-                        "url": item.get("url", url),
-                        "source": url,
-                        "description": item.get("description", "") or "",
-                        "type": "event",
-                    })
-            # Direct Event or list of Events
-            else:
-                from bs4 import BeautifulSoup as _BS
-                soup = _BS(f'<script type="application/ld+json">{text}</script>', "html.parser")
-                events.extend(extract_jsonld_events(soup, url))
 
+def parse_event_page(html, url):
+    """Extract events from a downloaded page: JSON-LD first, then HTML selectors."""
+    soup = BeautifulSoup(html, "html.parser")
+
+    # Try JSON-LD first (works even on JS-rendered pages)
+    events = extract_jsonld_events(soup, url)
+    if events:
         return events
-    except Exception as e:
-        print(f"WARNING: Playwright fetch failed for {url}: {e}", file=sys.stderr)
+
+    # Fall back to HTML scraping
+    return extract_html_events(soup, url)
+
+
+def fetch_source(source, pool=None):
+    """Fetch one configured event source, dispatching on its `type`."""
+    url = source.get("url", "")
+    location_filter = source.get("location_filter", "")
+    source_type = source.get("type", "html")
+    if not url:
         return []
+    print(f"Fetching events ({source_type}): {url}")
+    if source_type == "api":
+        return fetch_api_events(url, location_filter)
+    elif source_type == "playwright":
+        return fetch_playwright_events(url, location_filter, pool)
+    else:
+        return fetch_event_source(url, location_filter)
+
+
+def filter_by_location(events, location_filter):
+    """Keep events whose location mentions the source's location filter."""
+    location_filter = (location_filter or "").strip().lower()
+    if not location_filter:
+        return events
+    before = len(events)
+    # Build set of filter terms (e.g. "zurich" also matches "zürich")
+    filter_terms = {location_filter}
+    zurich_variants = {"zurich", "zürich", "zuerich"}
+    if location_filter in zurich_variants:
+        filter_terms = zurich_variants
+    events = [
+        e for e in events
+        if any(t in e.get("location", "").lower() for t in filter_terms)
+    ]
+    print(f"  Location filter '{location_filter}': {before} → {len(events)} events")
+    return events
 
 
-def fetch_event_source(url, location_filter=""):
-    """Fetch events from a single source URL (HTML + JSON-LD)."""
-    for attempt in range(MAX_RETRIES):
-        try:
-            resp = requests.get(url, headers=HEADERS, timeout=REQUEST_TIMEOUT)
-            resp.raise_for_status()
+def fetch_all(event_sources):
+    """Fetch every configured event source concurrently, sorted by date."""
+    from concurrent.futures import ThreadPoolExecutor, as_completed
 
-            soup = BeautifulSoup(resp.text, "html.parser")
+    # One Chromium for every playwright source in this run.
+    browser = None
+    if _PLAYWRIGHT_AVAILABLE and any(s.get("type") == "playwright" for s in event_sources):
+        browser = BrowserPool()
 
-            # Try JSON-LD first (works even on JS-rendered pages)
-            events = extract_jsonld_events(soup, url)
-            if events:
-                return events
+    all_events = []
+    try:
+        with ThreadPoolExecutor(max_workers=6) as pool:
+            futures = {pool.submit(fetch_source, s, browser): s for s in event_sources}
+            for fut in as_completed(futures):
+                source = futures[fut]
+                try:
+                    events = filter_by_location(fut.result(), source.get("location_filter", ""))
+                    all_events.extend(events)
+                except Exception as e:
+                    print(f"WARNING: event fetch error: {e}", file=sys.stderr)
+    finally:
+        if browser is not None:
+            browser.close()
 
-            # Fall back to HTML scraping
-            return extract_html_events(soup, url)
-        except Exception as e:
-            if attempt < MAX_RETRIES - 1:
-                time.sleep(RETRY_DELAY * (attempt + 1))
-            else:
-                print(f"WARNING: Failed to fetch {url}: {e}", file=sys.stderr)
-                return []
+    # Sort by date
+    all_events.sort(key=lambda x: x.get("date", ""))
+    return all_events
 
 
 def main():
     parser = argparse.ArgumentParser(description="Fetch events from configured sources")
     parser.add_argument("--config", required=True, help="Path to sources.yaml")
-    parser.add_argument("--output", required=True, help="Output JSON file path")
+    parser.add_argument("--output", help="Output JSON file path")
+    content_store.add_cli_args(parser)
     args = parser.parse_args()
+    if not args.output and not args.store:
+        parser.error("one of --output or --store is required")
 
     with open(args.config, "r", encoding="utf-8") as f:
         sources = yaml.safe_load(f) or {}
@@ -337,58 +397,14 @@ def main():
     event_sources = sources.get("event_sources") or []
     if not event_sources:
         print("No event sources configured in sources.yaml")
-        with open(args.output, "w", encoding="utf-8") as f:
-            json.dump([], f)
+        content_store.write_results("events", [], args.output, args.store, args.date)
         return
 
-    from concurrent.futures import ThreadPoolExecutor, as_completed
-
-    def _fetch_one(source):
-        url = source.get("url", "")
-        location_filter = source.get("location_filter", "")
-        source_type = source.get("type", "html")
-        if not url:
-            return []
-        print(f"Fetching events ({source_type}): {url}")
-        if source_type == "api":
-            return fetch_api_events(url, location_filter)
-        elif source_type == "playwright":
-            return fetch_playwright_events(url, location_filter)
-        else:
-            return fetch_event_source(url, location_filter)
-
-    all_events = []
-    with ThreadPoolExecutor(max_workers=6) as pool:
-        futures = {pool.submit(_fetch_one, s): s for s in event_sources}
-        for fut in as_completed(futures):
-            source = futures[fut]
-            location_filter = source.get("location_filter", "").strip().lower()
-            try:
-                events = fut.result()
-                if location_filter:
-                    before = len(events)
-                    # Build set of filter terms (e.g. "zurich" also matches "zürich")
-                    filter_terms = {location_filter}
-                    zurich_variants = {"zurich", "zürich", "zuerich"}
-                    if location_filter in zurich_variants:
-                        filter_terms = zurich_variants
-                    events = [
-                        e for e in events
-                        if any(t in e.get("location", "").lower() for t in filter_terms)
-                    ]
-                    print(f"  Location filter '{location_filter}': {before} → {len(events)} events")
-                all_events.extend(events)
-            except Exception as e:
-                print(f"WARNING: event fetch error: {e}", file=sys.stderr)
-
-    # Sort by date
-    all_events.sort(key=lambda x: x.get("date", ""))
+    all_events = fetch_all(event_sources)
 
-    os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
-    with open(args.output, "w", encoding="utf-8") as f:
-        json.dump(all_events, f, indent=2)
+    content_store.write_results("events", all_events, args.output, args.store, args.date)
 
-    print(f"Fetched {len(all_events)} events from {len(event_sources)} sources → {args.output}")
+    print(f"Fetched {len(all_events)} events from {len(event_sources)} sources → {args.output or args.store}")
 
 
 if __name__ == "__main__":
@@ -2,18 +2,14 @@
 """Fetch job listings from configured job boards."""
 
 import argparse
-import json
-import os
 import re
 import sys
-import time
 from urllib.parse import urljoin
 
 try:
-    import requests
-    from bs4 import BeautifulSoup
+    import http_client
 except ImportError:
-    print("ERROR: Missing dependencies. Run: pip install requests beautifulsoup4")
+    print("ERROR: Missing dependencies. Run: pip install requests")
     sys.exit(1)
 
 try:
@@ -29,9 +25,11 @@ try:
 except ImportError:
     pass
 
-MAX_RETRIES = 3
-RETRY_DELAY = 2
-REQUEST_TIMEOUT = 30
+import content_store
+import job_dedup
+import link_checker
+import stream_parse
+from term_matcher import TermMatcher
 
 HEADERS = {
     "User-Agent": (
@@ -40,6 +38,9 @@ HEADERS = {
     )
 }
 
+# Only the best matches are link-checked; the rest of the list is kept as is.
+VALIDATE_TOP = 25
+
 # Pure software-engineering titles to de-prioritize — the user targets
 # management / commercial / strategy / AI lanes, not deep SWE. Matched
 # whole-word against the title only, so phrases like "software engineer"
@@ -70,16 +71,31 @@ ZURICH_AREA_TERMS = [
 ]
 
 
-def _word_match(term, text):
-    """True if term appears as a whole word in text (case-insensitive).
+SWE_TITLE_MATCHER = TermMatcher(SWE_TITLE_TERMS)
+ZURICH_AREA_MATCHER = TermMatcher(ZURICH_AREA_TERMS)
+
+_profile_matchers = {}  # id(interests) -> (interests, matchers)
+
+
+def _matchers_for(interests):
+    """Term matchers for a profile, compiled once per interests dict.
 
-    Word-boundary matching avoids false positives like 'ai' inside
+    Whole-word matching avoids false positives like 'ai' inside
     'available'/'training' or a 'Google Cloud' mention tagging the employer.
     """
-    term = str(term).strip().lower()
-    if not term:
-        return False
-    return re.search(r"\b" + re.escape(term) + r"\b", text) is not None
+    cached = _profile_matchers.get(id(interests))
+    if cached is not None and cached[0] is interests:
+        return cached[1]
+    job_search = interests.get("job_search", {})
+    professional = interests.get("professional", []) or []
+    matchers = {
+        "role": TermMatcher(job_search.get("target_roles", [])),
+        "topic": TermMatcher(str(t.get("topic", "")) for t in professional),
+        "location": TermMatcher(job_search.get("target_locations", [])),
+        "company": TermMatcher(job_search.get("preferred_companies", [])),
+    }
+    _profile_matchers[id(interests)] = (interests, matchers)
+    return matchers
 
 
 def compute_match_score(job_title, job_text, interests, company=""):
@@ -97,11 +113,7 @@ def compute_match_score(job_title, job_text, interests, company=""):
     (not the free-text description), so a job that merely lists 'AWS' or 'Google
     Cloud' as a required skill is not tagged as being *at* that employer.
     """
-    job_search = interests.get("job_search", {})
-    target_roles = job_search.get("target_roles", [])
-    target_locations = job_search.get("target_locations", [])
-    preferred_companies = job_search.get("preferred_companies", [])
-    professional = interests.get("professional", []) or []
+    matchers = _matchers_for(interests)
 
     combined = f"{job_title} {job_text}".lower()
     employer_text = f"{job_title} {company}".lower()
@@ -109,39 +121,32 @@ def compute_match_score(job_title, job_text, interests, company=""):
     score = 0.0
     match_reasons = []
 
-    for role in target_roles:
-        if _word_match(role, combined):
-            score += 0.4
-            match_reasons.append(f"role: {role}")
-            break
+    role = matchers["role"].first(combined)
+    if role is not None:
+        score += 0.4
+        match_reasons.append(f"role: {role}")
 
-    for t in professional:
-        topic = str(t.get("topic", ""))
-        if _word_match(topic, combined):
-            score += 0.3
-            match_reasons.append(f"topic: {topic.lower()}")
-            break
+    topic = matchers["topic"].first(combined)
+    if topic is not None:
+        score += 0.3
+        match_reasons.append(f"topic: {topic.lower()}")
 
-    for loc in target_locations:
-        if _word_match(loc, combined):
-            score += 0.2
-            match_reasons.append(f"location: {loc}")
-            break
+    loc = matchers["location"].first(combined)
+    if loc is not None:
+        score += 0.2
+        match_reasons.append(f"location: {loc}")
 
     # Preferred employer (Google / Microsoft / Hitachi / other AI+energy tech).
     # Matched against the title + employer field only, so a description that just
     # lists 'AWS'/'Google Cloud' as a skill doesn't get tagged as that employer.
-    matched_company = None
-    for pref in preferred_companies:
-        if _word_match(pref, employer_text):
-            score += PREFERRED_COMPANY_WEIGHT
-            match_reasons.append(f"company: {pref}")
-            matched_company = pref
-            break
+    matched_company = matchers["company"].first(employer_text)
+    if matched_company is not None:
+        score += PREFERRED_COMPANY_WEIGHT
+        match_reasons.append(f"company: {matched_company}")
 
     # Strong bonus for a preferred employer in the Zürich area — the user's
     # priority lane — so e.g. "Google Zürich" outranks "Google remote".
-    if matched_company and any(_word_match(t, combined) for t in ZURICH_AREA_TERMS):
+    if matched_company is not None and ZURICH_AREA_MATCHER.search(combined):
         score += ZURICH_COMBO_BONUS
         match_reasons.append("priority: preferred company in Zürich area")
 
@@ -149,7 +154,7 @@ def compute_match_score(job_title, job_text, interests, company=""):
     # of jobs that already matched some signal — it never adds a match_reason,
     # so it cannot make an otherwise-irrelevant job pass the relevance filter.
     title_norm = job_title.lower().replace("-", " ")
-    if any(_word_match(t, title_norm) for t in SWE_TITLE_TERMS):
+    if SWE_TITLE_MATCHER.search(title_norm):
         score = max(0.0, score - SWE_PENALTY)
 
     return round(score, 4), match_reasons
@@ -161,216 +166,218 @@ def is_link_live(url):
     Returns True only for URLs that resolve with an HTTP status < 400.
     Expired postings on most boards return 404/410, so this filters stale links.
     """
-    if not url or not url.startswith("http"):
-        return False
-    try:
-        resp = requests.head(url, headers=HEADERS, timeout=10, allow_redirects=True)
-        # Some servers reject HEAD (405) or mishandle it — fall back to GET.
-        if resp.status_code >= 400:
-            resp = requests.get(
-                url, headers=HEADERS, timeout=15, allow_redirects=True, stream=True
-            )
-        return resp.status_code < 400
-    except Exception:
-        return False
+    return link_checker.is_link_live(url, HEADERS)
 
 
 # ---------------------------------------------------------------------------
 # Site-specific scrapers
 # ---------------------------------------------------------------------------
 
-def fetch_datacareer(url, interests):
+def fetch_datacareer(url, interests, max_items=None):
     """Scrape datacareer.ch job listings."""
-    for attempt in range(MAX_RETRIES):
-        try:
-            resp = requests.get(url, headers=HEADERS, timeout=REQUEST_TIMEOUT)
+    try:
+        with http_client.get(url, headers=HEADERS, stream=True) as resp:
             resp.raise_for_status()
-            soup = BeautifulSoup(resp.text, "html.parser")
-
-            jobs = []
-            for art in soup.select("article.listing-item"):
-                title_el = art.select_one(".listing-item__title a.link")
-                if not title_el:
-                    continue
-                title = title_el.get_text(strip=True)
-                link = title_el.get("href", "")
-                if link and not link.startswith("http"):
-                    link = urljoin(url, link)
-
-                company_el = art.select_one(".listing-item__info--item-company")
-                company = company_el.get_text(strip=True) if company_el else ""
-
-                location_el = art.select_one(".listing-item__info--item-location")
-                location = location_el.get_text(strip=True) if location_el else ""
-
-                text = f"{title} {company} {location}"
-                score, reasons = compute_match_score(title, text, interests, company=company)
-
-                jobs.append({
-                    "title": title,
-                    "company": company,
-                    "location": location,
-                    "url": link,
-                    "source": "datacareer.ch",
-                    "description": "",
-                    "match_score": round(score, 2),
-                    "match_reasons": reasons,
-                })
-            return jobs
-        except Exception as e:
-            if attempt < MAX_RETRIES - 1:
-                time.sleep(RETRY_DELAY * (attempt + 1))
-            else:
-                print(f"WARNING: Failed to fetch datacareer {url}: {e}", file=sys.stderr)
-                return []
-
-
-def fetch_linkedin(url, interests):
+            return parse_datacareer(stream_parse.iter_response_text(resp), url, interests,
+                                    max_items)
+    except Exception as e:
+        print(f"WARNING: Failed to fetch datacareer {url}: {e}", file=sys.stderr)
+        return []
+
+
+def parse_datacareer(html, url, interests, max_items=None):
+    """Parse a datacareer.ch listings page (a str or an iterable of text chunks)."""
+    jobs = []
+    for art in stream_parse.iter_html_elements(html, "article.listing-item"):
+        title_el = art.select_one(".listing-item__title a.link")
+        if not title_el:
+            continue
+        title = title_el.get_text(strip=True)
+        link = title_el.get("href", "")
+        if link and not link.startswith("http"):
+            link = urljoin(url, link)
+
+        company_el = art.select_one(".listing-item__info--item-company")
+        company = company_el.get_text(strip=True) if company_el else ""
+
+        location_el = art.select_one(".listing-item__info--item-location")
+        location = location_el.get_text(strip=True) if location_el else ""
+
+        text = f"{title} {company} {location}"
+        score, reasons = compute_match_score(title, text, interests, company=company)
+
+        jobs.append({
+            "title": title,
+            "company": company,
+            "location": location,
+            "url": link,
+            "source": "datacareer.ch",
+            "description": "",
+            "match_score": round(score, 2),
+            "match_reasons": reasons,
+        })
+        if max_items and len(jobs) >= max_items:
+            break
+    return jobs
+
+
+def fetch_linkedin(url, interests, max_items=None):
     """Scrape LinkedIn guest jobs API HTML fragments."""
-    for attempt in range(MAX_RETRIES):
-        try:
-            resp = requests.get(url, headers=HEADERS, timeout=REQUEST_TIMEOUT)
+    try:
+        with http_client.get(url, headers=HEADERS, stream=True) as resp:
             resp.raise_for_status()
-            soup = BeautifulSoup(resp.text, "html.parser")
-
-            jobs = []
-            for card in soup.select("li"):
-                title_el = card.select_one(".base-search-card__title")
-                if not title_el:
-                    continue
-                title = title_el.get_text(strip=True)
-
-                link_el = card.select_one("a.base-card__full-link, a.base-search-card__full-link")
-                link = link_el.get("href", "").split("?")[0] if link_el else ""
-
-                company_el = card.select_one(".base-search-card__subtitle a, .base-search-card__subtitle")
-                company = company_el.get_text(strip=True) if company_el else ""
-
-                location_el = card.select_one(".job-search-card__location")
-                location = location_el.get_text(strip=True) if location_el else ""
-
-                text = f"{title} {company} {location}"
-                score, reasons = compute_match_score(title, text, interests, company=company)
-
-                jobs.append({
-                    "title": title,
-                    "company": company,
-                    "location": location,
-                    "url": link,
-                    "source": "LinkedIn",
-                    "description": "",
-                    "match_score": round(score, 2),
-                    "match_reasons": reasons,
-                })
-            return jobs
-        except Exception as e:
-            if attempt < MAX_RETRIES - 1:
-                time.sleep(RETRY_DELAY * (attempt + 1))
-            else:
-                print(f"WARNING: Failed to fetch LinkedIn {url}: {e}", file=sys.stderr)
-                return []
-
-
-def fetch_rss_jobs(url, filter_keywords, interests):
+            return parse_linkedin(stream_parse.iter_response_text(resp), url, interests,
+                                  max_items)
+    except Exception as e:
+        print(f"WARNING: Failed to fetch LinkedIn {url}: {e}", file=sys.stderr)
+        return []
+
+
+def parse_linkedin(html, url, interests, max_items=None):
+    """Parse a LinkedIn guest jobs API HTML fragment (a str or text chunks)."""
+    jobs = []
+    for card in stream_parse.iter_html_elements(html, "li"):
+        title_el = card.select_one(".base-search-card__title")
+        if not title_el:
+            continue
+        title = title_el.get_text(strip=True)
+
+        link_el = card.select_one("a.base-card__full-link, a.base-search-card__full-link")
+        link = link_el.get("href", "").split("?")[0] if link_el else ""
+
+        company_el = card.select_one(".base-search-card__subtitle a, .base-search-card__subtitle")
+        company = company_el.get_text(strip=True) if company_el else ""
+
+        location_el = card.select_one(".job-search-card__location")
+        location = location_el.get_text(strip=True) if location_el else ""
+
+        text = f"{title} {company} {location}"
+        score, reasons = compute_match_score(title, text, interests, company=company)
+
+        jobs.append({
+            "title": title,
+            "company": company,
+            "location": location,
+            "url": link,
+            "source": "LinkedIn",
+            "description": "",
+            "match_score": round(score, 2),
+            "match_reasons": reasons,
+        })
+        if max_items and len(jobs) >= max_items:
+            break
+    return jobs
+
+
+def fetch_rss_jobs(url, filter_keywords, interests, max_items=None):
     """Fetch jobs from an RSS feed, filtering by keywords."""
-    for attempt in range(MAX_RETRIES):
-        try:
-            resp = requests.get(url, headers=HEADERS, timeout=REQUEST_TIMEOUT)
+    try:
+        with http_client.get(url, headers=HEADERS, stream=True) as resp:
             resp.raise_for_status()
-            soup = BeautifulSoup(resp.text, "xml")
-
-            jobs = []
-            for item in soup.find_all("item"):
-                title = item.find("title").get_text(strip=True) if item.find("title") else ""
-                link = item.find("link").get_text(strip=True) if item.find("link") else ""
-                desc = item.find("description").get_text(strip=True) if item.find("description") else ""
-                desc = re.sub(r"<[^>]+>", "", desc)
-
-                if not title:
-                    continue
-
-                # Filter by keywords if provided
-                if filter_keywords:
-                    combined_lower = f"{title} {desc}".lower()
-                    if not any(kw.lower() in combined_lower for kw in filter_keywords):
-                        continue
-
-                text = f"{title} {desc}"
-                score, reasons = compute_match_score(title, text, interests)
-
-                jobs.append({
-                    "title": title,
-                    "company": "",
-                    "location": "",
-                    "url": link,
-                    "source": "SwissDevJobs",
-                    "description": desc,
-                    "match_score": round(score, 2),
-                    "match_reasons": reasons,
-                })
-            return jobs
-        except Exception as e:
-            if attempt < MAX_RETRIES - 1:
-                time.sleep(RETRY_DELAY * (attempt + 1))
-            else:
-                print(f"WARNING: Failed to fetch RSS {url}: {e}", file=sys.stderr)
-                return []
-
-
-def fetch_board_generic(url, search_terms, interests):
+            return parse_rss_jobs(stream_parse.iter_response_bytes(resp), url,
+                                  filter_keywords, interests, max_items)
+    except Exception as e:
+        print(f"WARNING: Failed to fetch RSS {url}: {e}", file=sys.stderr)
+        return []
+
+
+def parse_rss_jobs(xml, url, filter_keywords, interests, max_items=None):
+    """Parse a jobs RSS document, keeping items that mention a filter keyword.
+
+    `xml` is the document as str/bytes or an iterable of byte chunks.
+    """
+    jobs = []
+    for item in stream_parse.iter_xml_elements(xml, "item"):
+        title = stream_parse.child_text(item, "title")
+        link = stream_parse.child_text(item, "link")
+        desc = stream_parse.child_text(item, "description")
+        desc = re.sub(r"<[^>]+>", "", desc)
+
+        if not title:
+            continue
+
+        # Filter by keywords if provided
+        if filter_keywords:
+            combined_lower = f"{title} {desc}".lower()
+            if not any(kw.lower() in combined_lower for kw in filter_keywords):
+                continue
+
+        text = f"{title} {desc}"
+        score, reasons = compute_match_score(title, text, interests)
+
+        jobs.append({
+            "title": title,
+            "company": "",
+            "location": "",
+            "url": link,
+            "source": "SwissDevJobs",
+            "description": desc,
+            "match_score": round(score, 2),
+            "match_reasons": reasons,
+        })
+        if max_items and len(jobs) >= max_items:
+            break
+    return jobs
+
+
+def fetch_board_generic(url, search_terms, interests, max_items=None):
     """Fallback: fetch job listings via generic HTML scraping."""
-    for attempt in range(MAX_RETRIES):
-        try:
-            resp = requests.get(url, headers=HEADERS, timeout=REQUEST_TIMEOUT)
+    try:
+        with http_client.get(url, headers=HEADERS, stream=True) as resp:
             resp.raise_for_status()
-            soup = BeautifulSoup(resp.text, "html.parser")
-
-            jobs = []
-            for selector in [
-                ".listing-item", ".job-listing", ".job-card", ".posting",
-                "li.result", "article", "[data-job]",
-            ]:
-                elements = soup.select(selector)
-                if elements:
-                    for el in elements[:20]:
-                        title_el = el.find(["h2", "h3", "a", "h4"])
-                        title = title_el.get_text(strip=True) if title_el else ""
-                        link = ""
-                        if title_el and title_el.name == "a":
-                            link = title_el.get("href", "")
-                        elif title_el:
-                            a = title_el.find("a")
-                            if a:
-                                link = a.get("href", "")
-
-                        if not title:
-                            continue
-
-                        if link and not link.startswith("http"):
-                            link = urljoin(url, link)
-
-                        text = el.get_text(" ", strip=True)
-                        score, reasons = compute_match_score(title, text, interests)
-
-                        jobs.append({
-                            "title": title,
-                            "company": "",
-                            "location": "",
-                            "url": link,
-                            "source": url,
-                            "description": "",
-                            "match_score": round(score, 2),
-                            "match_reasons": reasons,
-                        })
-                    break
-
-            return jobs
-        except Exception as e:
-            if attempt < MAX_RETRIES - 1:
-                time.sleep(RETRY_DELAY * (attempt + 1))
-            else:
-                print(f"WARNING: Failed to fetch {url}: {e}", file=sys.stderr)
-                return []
+            return parse_board_generic(stream_parse.iter_response_text(resp), url,
+                                       search_terms, interests, max_items)
+    except Exception as e:
+        print(f"WARNING: Failed to fetch {url}: {e}", file=sys.stderr)
+        return []
+
+
+# Listing containers tried in priority order; the first that matches wins.
+GENERIC_SELECTORS = [
+    ".listing-item", ".job-listing", ".job-card", ".posting",
+    "li.result", "article", "[data-job]",
+]
+GENERIC_MAX_ELEMENTS = 20
+
+
+def parse_board_generic(html, url, search_terms, interests, max_items=None):
+    """Extract job listings from an arbitrary board page via common selectors."""
+    jobs = []
+    elements = stream_parse.select_first_matching(html, GENERIC_SELECTORS, GENERIC_MAX_ELEMENTS)
+    for el in elements:
+        title_el = el.find(["h2", "h3", "a", "h4"])
+        title = title_el.get_text(strip=True) if title_el else ""
+        link = ""
+        if title_el and title_el.name == "a":
+            link = title_el.get("href", "")
+        elif title_el:
+            a = title_el.find("a")
+            if a:
+                link = a.get("href", "")
+
+        if not title:
+            continue
+
+        if link and not link.startswith("http"):
+            link = urljoin(url, link)
+
+        text = el.get_text(" ", strip=True)
+        score, reasons = compute_match_score(title, text, interests)
+
+        jobs.append({
+            "title": title,
+            "company": "",
+            "location": "",
+            "url": link,
+            "source": url,
+            "description": "",
+            "match_score": round(score, 2),
+            "match_reasons": reasons,
+        })
+        if max_items and len(jobs) >= max_items:
+            break
+
+    return jobs
 
 
 # ---------------------------------------------------------------------------
@@ -382,81 +389,98 @@ SITE_SCRAPERS = {
     "linkedin": fetch_linkedin,
 }
 
+SITE_PARSERS = {
+    "datacareer": parse_datacareer,
+    "linkedin": parse_linkedin,
+}
 
-def fetch_jobs_for_board(board, interests):
-    """Route a board config to the right scraper."""
-    url = board.get("url", "")
-    board_type = board.get("type", "html")
-    search_terms = board.get("search_terms", [])
-    filter_keywords = board.get("filter_keywords", [])
-    site = board.get("site", "")
 
+def board_site(board):
+    """Site key for a board config (explicit `site`, else detected from the URL)."""
+    site = board.get("site", "")
+    url = board.get("url", "")
     # Auto-detect site from URL
     if not site:
         if "datacareer.ch" in url:
             site = "datacareer"
         elif "linkedin.com" in url:
             site = "linkedin"
+    return site
+
+
+def fetch_jobs_for_board(board, interests):
+    """Route a board config to the right scraper."""
+    url = board.get("url", "")
+    board_type = board.get("type", "html")
+    search_terms = board.get("search_terms", [])
+    filter_keywords = board.get("filter_keywords", [])
+    max_items = board.get("max_items")
+    site = board_site(board)
 
     if board_type == "rss":
-        return fetch_rss_jobs(url, filter_keywords, interests)
+        return fetch_rss_jobs(url, filter_keywords, interests, max_items)
     elif site in SITE_SCRAPERS:
-        return SITE_SCRAPERS[site](url, interests)
+        return SITE_SCRAPERS[site](url, interests, max_items)
     else:
-        return fetch_board_generic(url, search_terms, interests)
-
+        return fetch_board_generic(url, search_terms, interests, max_items)
 
-def main():
-    parser = argparse.ArgumentParser(description="Fetch job listings from configured boards")
-    parser.add_argument("--config", required=True, help="Path to sources.yaml")
-    parser.add_argument("--interests", required=True, help="Path to interests.yaml")
-    parser.add_argument("--output", required=True, help="Output JSON file path")
-    args = parser.parse_args()
 
-    with open(args.config, "r", encoding="utf-8") as f:
-        sources = yaml.safe_load(f) or {}
-    with open(args.interests, "r", encoding="utf-8") as f:
-        interests = yaml.safe_load(f) or {}
+def parse_jobs_for_board(board, text, interests):
+    """Parse an already-downloaded board response with the scraper's parser.
 
-    job_boards = sources.get("job_boards") or []
-    if not job_boards:
-        print("No job boards configured in sources.yaml")
-        with open(args.output, "w", encoding="utf-8") as f:
-            json.dump([], f)
-        return
+    Mirrors fetch_jobs_for_board's routing for callers that do their own I/O
+    (e.g. the asyncio engine in async_fetch.py).
+    """
+    url = board.get("url", "")
+    max_items = board.get("max_items")
+    site = board_site(board)
+    if board.get("type", "html") == "rss":
+        return parse_rss_jobs(text, url, board.get("filter_keywords", []), interests, max_items)
+    elif site in SITE_PARSERS:
+        return SITE_PARSERS[site](text, url, interests, max_items)
+    else:
+        return parse_board_generic(text, url, board.get("search_terms", []), interests,
+                                   max_items)
 
-    from concurrent.futures import ThreadPoolExecutor, as_completed
 
-    def _fetch_one(board):
-        url = board.get("url", "")
-        location_filter = board.get("location_filter", "")
-        if not url:
-            return []
-        board_type = board.get("type", "html")
-        print(f"Fetching jobs ({board_type}): {url}")
-        jobs = fetch_jobs_for_board(board, interests)
-        print(f"  Found {len(jobs)} listings")
-        if location_filter and jobs:
-            filter_lower = location_filter.lower()
-            before = len(jobs)
-            jobs = [
-                j for j in jobs
-                if filter_lower in j.get("location", "").lower()
-                or filter_lower in j.get("title", "").lower()
-                or filter_lower in j.get("company", "").lower()
-            ]
-            print(f"  Location filter '{location_filter}': {before} -> {len(jobs)} jobs")
-        return jobs
+def fetch_board(board, interests):
+    """Fetch one configured board and apply its optional location filter."""
+    url = board.get("url", "")
+    if not url:
+        return []
+    board_type = board.get("type", "html")
+    print(f"Fetching jobs ({board_type}): {url}")
+    jobs = fetch_jobs_for_board(board, interests)
+    print(f"  Found {len(jobs)} listings")
+    return filter_by_location(jobs, board.get("location_filter", ""))
 
-    all_jobs = []
-    with ThreadPoolExecutor(max_workers=6) as pool:
-        futures = {pool.submit(_fetch_one, b): b for b in job_boards}
-        for fut in as_completed(futures):
-            try:
-                all_jobs.extend(fut.result())
-            except Exception as e:
-                print(f"WARNING: board fetch error: {e}", file=sys.stderr)
 
+def filter_by_location(jobs, location_filter):
+    """Keep jobs whose location, title or company mentions the board's filter."""
+    if not location_filter or not jobs:
+        return jobs
+    filter_lower = location_filter.lower()
+    before = len(jobs)
+    jobs = [
+        j for j in jobs
+        if filter_lower in j.get("location", "").lower()
+        or filter_lower in j.get("title", "").lower()
+        or filter_lower in j.get("company", "").lower()
+    ]
+    print(f"  Location filter '{location_filter}': {before} -> {len(jobs)} jobs")
+    return jobs
+
+
+def finalize_jobs(all_jobs, validate_top=VALIDATE_TOP, link_cache_path=link_checker.LINK_CACHE_PATH,
+                  signatures_path=job_dedup.SIGNATURES_PATH):
+    """Deduplicate, relevance-filter, rank and link-check the merged board results.
+
+    Near-duplicates (the same posting on several boards) are collapsed and
+    reposts flagged using the signature history in `signatures_path` (None
+    skips the history). Links of the `validate_top` best matches are checked
+    (None checks every job); verdicts are cached in `link_cache_path` (None
+    disables).
+    """
     # Deduplicate by title (keep highest score)
     seen = {}
     for job in all_jobs:
@@ -470,26 +494,78 @@ def main():
     all_jobs = [j for j in all_jobs if j.get("match_reasons")]
     print(f"Relevance filter: {before} -> {len(all_jobs)} jobs")
 
+    # Collapse near-duplicates across boards (keeps the best match_score)
+    all_jobs = job_dedup.dedupe_jobs(all_jobs, signatures_path)
+
     # Sort by match score (highest first)
     all_jobs.sort(key=lambda x: x.get("match_score", 0), reverse=True)
 
-    # Validate links for the top candidates so the report only shows postings
-    # that are still reachable (a proxy for "still accepting applications").
-    VALIDATE_TOP = 25
-    head = all_jobs[:VALIDATE_TOP]
-    tail = all_jobs[VALIDATE_TOP:]
-    with ThreadPoolExecutor(max_workers=8) as pool:
-        live_flags = list(pool.map(lambda j: is_link_live(j.get("url", "")), head))
-    live_jobs = [j for j, live in zip(head, live_flags) if live]
+    # Validate links so the report only shows postings that are still
+    # reachable (a proxy for "still accepting applications").
+    head = all_jobs if validate_top is None else all_jobs[:validate_top]
+    tail = all_jobs[len(head):]
+    live_jobs = link_checker.filter_live(head, headers=HEADERS, cache_path=link_cache_path)
     dropped = len(head) - len(live_jobs)
     print(f"Link validation: checked {len(head)}, dropped {dropped} dead/missing links")
-    all_jobs = live_jobs + tail
+    return live_jobs + tail
+
+
+def fetch_all(job_boards, interests, validate_top=VALIDATE_TOP,
+              link_cache_path=link_checker.LINK_CACHE_PATH,
+              signatures_path=job_dedup.SIGNATURES_PATH):
+    """Fetch every configured board concurrently and return the ranked job list."""
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    all_jobs = []
+    with ThreadPoolExecutor(max_workers=6) as pool:
+        futures = {pool.submit(fetch_board, b, interests): b for b in job_boards}
+        for fut in as_completed(futures):
+            try:
+                all_jobs.extend(fut.result())
+            except Exception as e:
+                print(f"WARNING: board fetch error: {e}", file=sys.stderr)
+
+    return finalize_jobs(all_jobs, validate_top, link_cache_path, signatures_path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fetch job listings from configured boards")
+    parser.add_argument("--config", required=True, help="Path to sources.yaml")
+    parser.add_argument("--interests", required=True, help="Path to interests.yaml")
+    parser.add_argument("--output", help="Output JSON file path")
+    parser.add_argument("--validate-top", type=int, default=VALIDATE_TOP,
+                        help=f"Link-check the N best matches (default: {VALIDATE_TOP}; 0 = all)")
+    parser.add_argument("--link-cache", default=link_checker.LINK_CACHE_PATH,
+                        help="Link-liveness verdict cache file")
+    parser.add_argument("--no-link-cache", action="store_true",
+                        help="Re-check every link instead of using cached verdicts")
+    parser.add_argument("--signatures", default=job_dedup.SIGNATURES_PATH,
+                        help="Job signature history used to recognise reposts")
+    parser.add_argument("--no-signatures", action="store_true",
+                        help="Deduplicate within this run only (no repost history)")
+    content_store.add_cli_args(parser)
+    args = parser.parse_args()
+    if not args.output and not args.store:
+        parser.error("one of --output or --store is required")
+
+    with open(args.config, "r", encoding="utf-8") as f:
+        sources = yaml.safe_load(f) or {}
+    with open(args.interests, "r", encoding="utf-8") as f:
+        interests = yaml.safe_load(f) or {}
+
+    job_boards = sources.get("job_boards") or []
+    if not job_boards:
+        print("No job boards configured in sources.yaml")
+        content_store.write_results("jobs", [], args.output, args.store, args.date)
+        return
+
+    all_jobs = fetch_all(job_boards, interests, validate_top=args.validate_top or None,
+                         link_cache_path=None if args.no_link_cache else args.link_cache,
+                         signatures_path=None if args.no_signatures else args.signatures)
 
-    os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
-    with open(args.output, "w", encoding="utf-8") as f:
-        json.dump(all_jobs, f, indent=2)
+    content_store.write_results("jobs", all_jobs, args.output, args.store, args.date)
 
-    print(f"Fetched {len(all_jobs)} relevant jobs from {len(job_boards)} boards → {args.output}")
+    print(f"Fetched {len(all_jobs)} relevant jobs from {len(job_boards)} boards → {args.output or args.store}")
 
 
 if __name__ == "__main__":
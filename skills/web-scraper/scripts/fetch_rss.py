@@ -6,7 +6,8 @@ import json
 import os
 import re
 import sys
-import time
+import threading
+from datetime import datetime, timedelta, timezone
 from urllib.parse import urljoin
 
 try:
@@ -28,6 +29,11 @@ except ImportError:
     requests = None
     BeautifulSoup = None
 
+try:
+    import http_client
+except ImportError:
+    http_client = None
+
 # Use OS certificate store (fixes corporate proxy SSL errors on Windows)
 try:
     import truststore
@@ -35,10 +41,19 @@ try:
 except ImportError:
     pass
 
-MAX_RETRIES = 3
-RETRY_DELAY = 2
+import content_store
+
 MAX_SUMMARY_LENGTH = 200
 
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.abspath(os.path.join(SCRIPT_DIR, "..", "..", ".."))
+
+# Conditional-GET cache: per feed URL, the validators (ETag / Last-Modified)
+# and parsed articles from the last full download. A 304 reply reuses the
+# cached articles without re-downloading or re-parsing the feed.
+FEED_CACHE_PATH = os.path.join(PROJECT_ROOT, "memory", "feed-cache.json")
+FEED_CACHE_RETENTION_DAYS = 30  # drop entries for feeds not checked in this long
+
 HEADERS = {
     "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
     "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
@@ -46,170 +61,317 @@ HEADERS = {
 }
 
 
-def fetch_feed(url, category="general"):
-    """Fetch a single RSS feed with retries."""
-    for attempt in range(MAX_RETRIES):
-        try:
-            feed = feedparser.parse(url)
-            if feed.bozo and not feed.entries:
-                raise Exception(f"Feed parse error: {feed.bozo_exception}")
-            articles = []
-            for entry in feed.entries:
-                summary = entry.get("summary", entry.get("description", ""))
-                # Strip HTML tags from summary
-                if summary:
-                    summary = re.sub(r"<[^>]+>", "", summary)
-                    summary = summary[:MAX_SUMMARY_LENGTH].strip()
+class FeedCache:
+    """On-disk map of feed URL -> {etag, last_modified, articles, checked_at}.
 
-                articles.append({
-                    "title": entry.get("title", "Untitled"),
-                    "url": entry.get("link", ""),
-                    "source": feed.feed.get("title", url),
-                    "category": category,
-                    "published": entry.get("published", ""),
-                    "summary": summary,
-                })
-            return articles
-        except Exception as e:
-            if attempt < MAX_RETRIES - 1:
-                time.sleep(RETRY_DELAY * (attempt + 1))
-            else:
-                print(f"WARNING: Failed to fetch {url}: {e}", file=sys.stderr)
-                return []
+    Loaded once per run, shared by the fetch threads and written back once
+    with save(). A missing or corrupt file simply starts an empty cache.
+    """
+
+    def __init__(self, path=FEED_CACHE_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self._entries = {}
+        if os.path.exists(path):
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                if isinstance(data, dict):
+                    self._entries = data
+            except (json.JSONDecodeError, OSError):
+                pass
+
+    def get(self, url):
+        with self._lock:
+            return self._entries.get(url)
+
+    def put(self, url, entry):
+        with self._lock:
+            self._entries[url] = entry
+
+    def discard(self, url):
+        with self._lock:
+            self._entries.pop(url, None)
+
+    def touch(self, url):
+        with self._lock:
+            if url in self._entries:
+                self._entries[url]["checked_at"] = datetime.now(timezone.utc).isoformat()
+
+    def save(self):
+        """Persist the cache atomically, dropping long-unchecked feeds."""
+        cutoff = (datetime.now(timezone.utc)
+                  - timedelta(days=FEED_CACHE_RETENTION_DAYS)).isoformat()
+        with self._lock:
+            entries = {u: e for u, e in self._entries.items()
+                       if e.get("checked_at", "") >= cutoff}
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp = self.path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(entries, f)
+        os.replace(tmp, self.path)
+
+
+def conditional_headers(cached):
+    """If-None-Match / If-Modified-Since headers for a cached feed entry."""
+    headers = {}
+    if cached:
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+    return headers
+
+
+def parse_feed(content, url, category="general", response_headers=None):
+    """Parse RSS/Atom bytes (or a URL, when no HTTP client is available) into articles."""
+    feed = feedparser.parse(content, response_headers=response_headers)
+    if feed.bozo and not feed.entries:
+        raise Exception(f"Feed parse error: {feed.bozo_exception}")
+    articles = []
+    for entry in feed.entries:
+        summary = entry.get("summary", entry.get("description", ""))
+        # Strip HTML tags from summary
+        if summary:
+            summary = re.sub(r"<[^>]+>", "", summary)
+            summary = summary[:MAX_SUMMARY_LENGTH].strip()
+
+        articles.append({
+            "title": entry.get("title", "Untitled"),
+            "url": entry.get("link", ""),
+            "source": feed.feed.get("title", url),
+            "category": category,
+            "published": entry.get("published", ""),
+            "summary": summary,
+        })
+    return articles
+
+
+def cached_articles(cached, category):
+    """Articles from a cache entry, re-tagged with the feed's current category."""
+    return [dict(a, category=category) for a in cached.get("articles", [])]
+
+
+def update_cache(cache, url, response_headers, articles):
+    """Store a fresh download's validators and articles (or forget the feed if it has none)."""
+    etag = response_headers.get("ETag")
+    last_modified = response_headers.get("Last-Modified")
+    if etag or last_modified:
+        cache.put(url, {
+            "etag": etag,
+            "last_modified": last_modified,
+            "checked_at": datetime.now(timezone.utc).isoformat(),
+            "articles": articles,
+        })
+    else:
+        cache.discard(url)
+
+
+def fetch_feed(url, category="general", cache=None):
+    """Fetch a single RSS feed (retries/backoff come from http_client).
+
+    With a FeedCache, the request is conditional: a 304 Not Modified reply
+    returns the cached articles as-is, and a fresh 200 reply that carries
+    an ETag or Last-Modified validator is stored for the next run.
+    """
+    cached = cache.get(url) if cache is not None else None
+    try:
+        if http_client is None:
+            return parse_feed(url, url, category)
+        resp = http_client.get(url, headers={**HEADERS, **conditional_headers(cached)})
+        if resp.status_code == 304 and cached:
+            cache.touch(url)
+            return cached_articles(cached, category)
+        resp.raise_for_status()
+        articles = parse_feed(resp.content, url, category, response_headers=dict(resp.headers))
+        if cache is not None:
+            update_cache(cache, url, resp.headers, articles)
+        return articles
+    except Exception as e:
+        print(f"WARNING: Failed to fetch {url}: {e}", file=sys.stderr)
+        return []
 
 
 def fetch_html_articles(url, category="general"):
-    """Scrape news/article links from an HTML page with retries."""
-    if requests is None or BeautifulSoup is None:
+    """Scrape news/article links from an HTML page."""
+    if http_client is None or BeautifulSoup is None:
         print("WARNING: requests/beautifulsoup4 not installed, skipping HTML source", file=sys.stderr)
         return []
 
-    for attempt in range(MAX_RETRIES):
+    try:
         try:
-            try:
-                resp = requests.get(url, headers=HEADERS, timeout=30)
-            except requests.exceptions.SSLError:
-                # Retry without SSL verification (corporate proxies, etc.)
-                resp = requests.get(url, headers=HEADERS, timeout=30, verify=False)
-            resp.raise_for_status()
-            soup = BeautifulSoup(resp.text, "html.parser")
-
-            # Derive a human-friendly source name from the domain
-            from urllib.parse import urlparse
-            domain = urlparse(url).netloc.replace("www.", "")
-            source_name = domain.split(".")[0].title()
-
-            articles = []
-            seen_urls = set()
-
-            # Strategy 1: JSON-LD structured data (NewsArticle, Article, etc.)
-            for script in soup.find_all("script", {"type": "application/ld+json"}):
-                try:
-                    data = json.loads(script.string)
-                except (json.JSONDecodeError, TypeError):
-                    continue
-                items = data if isinstance(data, list) else [data]
-                if isinstance(data, dict) and "@graph" in data:
-                    items = data["@graph"]
-                for item in items:
-                    if not isinstance(item, dict):
-                        continue
-                    itype = str(item.get("@type", ""))
-                    if "Article" not in itype and "News" not in itype:
-                        continue
-                    title = item.get("headline", item.get("name", ""))
-                    link = item.get("url", "")
-                    if title and link and link not in seen_urls:
-                        seen_urls.add(link)
-                        summary = item.get("description", "")
-                        if summary:
-                            summary = re.sub(r"<[^>]+>", "", summary)[:MAX_SUMMARY_LENGTH].strip()
-                        articles.append({
-                            "title": title,
-                            "url": link,
-                            "source": source_name,
-                            "category": category,
-                            "published": item.get("datePublished", ""),
-                            "summary": summary,
-                        })
-
-            if articles:
-                return articles
-
-            # Strategy 2: <article> elements or common card patterns
-            containers = soup.select("article, .story, .card, .teaser, .news-item, .post, .entry")
-            for el in containers:
-                a_tag = el.find("a", href=True)
-                if not a_tag:
-                    continue
-                href = a_tag["href"]
-                link = href if href.startswith("http") else urljoin(url, href)
-                if link in seen_urls:
-                    continue
-
-                title_el = el.find(["h1", "h2", "h3", "h4"])
-                title = title_el.get_text(strip=True) if title_el else a_tag.get_text(strip=True)
-                if not title or len(title) < 5:
-                    continue
+            resp = http_client.get(url, headers=HEADERS)
+        except requests.exceptions.SSLError:
+            # Retry without SSL verification (corporate proxies, etc.)
+            resp = http_client.get(url, headers=HEADERS, verify=False)
+        resp.raise_for_status()
+        return parse_html_articles(resp.text, url, category)
+    except Exception as e:
+        print(f"WARNING: Failed to fetch HTML {url}: {e}", file=sys.stderr)
+        return []
 
-                seen_urls.add(link)
-                summary = ""
-                p = el.find("p")
-                if p:
-                    summary = re.sub(r"<[^>]+>", "", p.get_text(strip=True))[:MAX_SUMMARY_LENGTH]
 
-                date_el = el.find("time")
-                published = date_el.get("datetime", date_el.get_text(strip=True)) if date_el else ""
+def parse_html_articles(html, url, category="general"):
+    """Extract news/article links from a downloaded HTML page."""
+    soup = BeautifulSoup(html, "html.parser")
+
+    # Derive a human-friendly source name from the domain
+    from urllib.parse import urlparse
+    domain = urlparse(url).netloc.replace("www.", "")
+    source_name = domain.split(".")[0].title()
 
+    articles = []
+    seen_urls = set()
+
+    # Strategy 1: JSON-LD structured data (NewsArticle, Article, etc.)
+    for script in soup.find_all("script", {"type": "application/ld+json"}):
+        try:
+            data = json.loads(script.string)
+        except (json.JSONDecodeError, TypeError):
+            continue
+        items = data if isinstance(data, list) else [data]
+        if isinstance(data, dict) and "@graph" in data:
+            items = data["@graph"]
+        for item in items:
+            if not isinstance(item, dict):
+                continue
+            itype = str(item.get("@type", ""))
+            if "Article" not in itype and "News" not in itype:
+                continue
+            title = item.get("headline", item.get("name", ""))
+            link = item.get("url", "")
+            if title and link and link not in seen_urls:
+                seen_urls.add(link)
+                summary = item.get("description", "")
+                if summary:
+                    summary = re.sub(r"<[^>]+>", "", summary)[:MAX_SUMMARY_LENGTH].strip()
                 articles.append({
                     "title": title,
                     "url": link,
                     "source": source_name,
                     "category": category,
-                    "published": published,
+                    "published": item.get("datePublished", ""),
                     "summary": summary,
                 })
 
-            if articles:
-                return articles
-
-            # Strategy 3: fallback — collect prominent <a> links with long text
-            for a_tag in soup.find_all("a", href=True):
-                text = a_tag.get_text(strip=True)
-                href = a_tag["href"]
-                if len(text) < 15 or not href:
-                    continue
-                link = href if href.startswith("http") else urljoin(url, href)
-                if link in seen_urls or link == url:
-                    continue
-                # Skip navigation/footer links
-                if any(skip in text.lower() for skip in ["sign in", "subscribe", "log in", "cookie", "privacy"]):
-                    continue
-                seen_urls.add(link)
-                articles.append({
-                    "title": text[:120],
-                    "url": link,
-                    "source": source_name,
-                    "category": category,
-                    "published": "",
-                    "summary": "",
-                })
+    if articles:
+        return articles
+
+    # Strategy 2: <article> elements or common card patterns
+    containers = soup.select("article, .story, .card, .teaser, .news-item, .post, .entry")
+    for el in containers:
+        a_tag = el.find("a", href=True)
+        if not a_tag:
+            continue
+        href = a_tag["href"]
+        link = href if href.startswith("http") else urljoin(url, href)
+        if link in seen_urls:
+            continue
+
+        title_el = el.find(["h1", "h2", "h3", "h4"])
+        title = title_el.get_text(strip=True) if title_el else a_tag.get_text(strip=True)
+        if not title or len(title) < 5:
+            continue
+
+        seen_urls.add(link)
+        summary = ""
+        p = el.find("p")
+        if p:
+            summary = re.sub(r"<[^>]+>", "", p.get_text(strip=True))[:MAX_SUMMARY_LENGTH]
+
+        date_el = el.find("time")
+        published = date_el.get("datetime", date_el.get_text(strip=True)) if date_el else ""
+
+        articles.append({
+            "title": title,
+            "url": link,
+            "source": source_name,
+            "category": category,
+            "published": published,
+            "summary": summary,
+        })
+
+    if articles:
+        return articles
+
+    # Strategy 3: fallback — collect prominent <a> links with long text
+    for a_tag in soup.find_all("a", href=True):
+        text = a_tag.get_text(strip=True)
+        href = a_tag["href"]
+        if len(text) < 15 or not href:
+            continue
+        link = href if href.startswith("http") else urljoin(url, href)
+        if link in seen_urls or link == url:
+            continue
+        # Skip navigation/footer links
+        if any(skip in text.lower() for skip in ["sign in", "subscribe", "log in", "cookie", "privacy"]):
+            continue
+        seen_urls.add(link)
+        articles.append({
+            "title": text[:120],
+            "url": link,
+            "source": source_name,
+            "category": category,
+            "published": "",
+            "summary": "",
+        })
+
+    return articles
+
+
+def fetch_source(feed_config, max_per_feed=10, cache=None):
+    """Fetch one configured feed (RSS or HTML) and cap it at max_per_feed."""
+    url = feed_config.get("url", "")
+    category = feed_config.get("category", "general")
+    feed_type = feed_config.get("type", "rss")
+    if not url:
+        return []
+    print(f"Fetching ({feed_type}): {url} ({category})")
+    if feed_type == "html":
+        return fetch_html_articles(url, category)[:max_per_feed]
+    return fetch_feed(url, category, cache)[:max_per_feed]
 
-            return articles
-        except Exception as e:
-            if attempt < MAX_RETRIES - 1:
-                time.sleep(RETRY_DELAY * (attempt + 1))
-            else:
-                print(f"WARNING: Failed to fetch HTML {url}: {e}", file=sys.stderr)
-                return []
+
+def fetch_all(rss_feeds, max_per_feed=10, cache_path=FEED_CACHE_PATH):
+    """Fetch every configured feed concurrently, newest articles first.
+
+    `cache_path` is the conditional-GET feed cache; pass None to disable it.
+    """
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    cache = FeedCache(cache_path) if cache_path else None
+    all_articles = []
+    with ThreadPoolExecutor(max_workers=6) as pool:
+        futures = {pool.submit(fetch_source, fc, max_per_feed, cache): fc for fc in rss_feeds}
+        for fut in as_completed(futures):
+            try:
+                all_articles.extend(fut.result())
+            except Exception as e:
+                print(f"WARNING: feed fetch error: {e}", file=sys.stderr)
+
+    if cache is not None:
+        try:
+            cache.save()
+        except OSError as e:
+            print(f"WARNING: could not write feed cache {cache_path}: {e}", file=sys.stderr)
+
+    # Sort by published date (newest first)
+    all_articles.sort(key=lambda x: x.get("published", ""), reverse=True)
+    return all_articles
 
 
 def main():
     parser = argparse.ArgumentParser(description="Fetch RSS feeds from configured sources")
     parser.add_argument("--config", required=True, help="Path to sources.yaml")
-    parser.add_argument("--output", required=True, help="Output JSON file path")
+    parser.add_argument("--output", help="Output JSON file path")
     parser.add_argument("--max-per-feed", type=int, default=10, help="Max articles per feed")
+    parser.add_argument("--cache", default=FEED_CACHE_PATH,
+                        help="Conditional-GET feed cache file (ETag / Last-Modified)")
+    parser.add_argument("--no-cache", action="store_true", help="Always download feeds in full")
+    content_store.add_cli_args(parser)
     args = parser.parse_args()
+    if not args.output and not args.store:
+        parser.error("one of --output or --store is required")
 
     # Load sources config
     with open(args.config, "r", encoding="utf-8") as f:
@@ -218,41 +380,15 @@ def main():
     rss_feeds = sources.get("rss_feeds") or []
     if not rss_feeds:
         print("No RSS feeds configured in sources.yaml")
-        with open(args.output, "w", encoding="utf-8") as f:
-            json.dump([], f)
+        content_store.write_results("articles", [], args.output, args.store, args.date)
         return
 
-    from concurrent.futures import ThreadPoolExecutor, as_completed
-
-    def _fetch_one(feed_config):
-        url = feed_config.get("url", "")
-        category = feed_config.get("category", "general")
-        feed_type = feed_config.get("type", "rss")
-        if not url:
-            return []
-        print(f"Fetching ({feed_type}): {url} ({category})")
-        if feed_type == "html":
-            return fetch_html_articles(url, category)[:args.max_per_feed]
-        return fetch_feed(url, category)[:args.max_per_feed]
-
-    all_articles = []
-    with ThreadPoolExecutor(max_workers=6) as pool:
-        futures = {pool.submit(_fetch_one, fc): fc for fc in rss_feeds}
-        for fut in as_completed(futures):
-            try:
-                all_articles.extend(fut.result())
-            except Exception as e:
-                print(f"WARNING: feed fetch error: {e}", file=sys.stderr)
-
-    # Sort by published date (newest first)
-    all_articles.sort(key=lambda x: x.get("published", ""), reverse=True)
+    all_articles = fetch_all(rss_feeds, args.max_per_feed,
+                             cache_path=None if args.no_cache else args.cache)
 
-    # Write output
-    os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
-    with open(args.output, "w", encoding="utf-8") as f:
-        json.dump(all_articles, f, indent=2)
+    content_store.write_results("articles", all_articles, args.output, args.store, args.date)
 
-    print(f"Fetched {len(all_articles)} articles from {len(rss_feeds)} feeds → {args.output}")
+    print(f"Fetched {len(all_articles)} articles from {len(rss_feeds)} feeds → {args.output or args.store}")
 
 
 if __name__ == "__main__":
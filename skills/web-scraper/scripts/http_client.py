@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""Shared pooled HTTP client for the web-scraper fetchers.
+
+Every fetcher routes its requests through one process-wide `requests.Session`,
+so TCP/TLS connections are kept alive and reused across sources on the same
+host (and across fetchers when run_daily.py runs them in one process). The
+session carries a single retry/backoff policy for connection errors and
+transient 429/5xx responses, replacing the per-fetcher MAX_RETRIES loops.
+
+Link-liveness checks use a second pooled session (`get_check_session`) that
+retries a failed connection once, immediately, and never waits on 429/5xx or
+Retry-After: the link checker treats those as "unknown, re-check next run".
+"""
+
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+MAX_RETRIES = 3
+BACKOFF_FACTOR = 1  # sleeps ~1s, 2s, 4s between attempts (Retry-After wins)
+BACKOFF_MAX = 30    # longest single wait, including a server's Retry-After
+REQUEST_TIMEOUT = 30
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+CHECK_RETRIES = 1  # liveness checks: one immediate retry on connection errors
+
+# Connection pools: one pool per host, at most POOL_PER_HOST sockets each.
+# pool_block makes the per-host cap a hard limit instead of opening
+# throwaway connections once the pool is exhausted.
+POOL_HOSTS = 32
+POOL_PER_HOST = 8
+
+try:
+    import brotli  # noqa: F401 — urllib3 decodes "br" only when this is installed
+    ACCEPT_ENCODING = "gzip, deflate, br"
+except ImportError:
+    try:
+        import brotlicffi  # noqa: F401
+        ACCEPT_ENCODING = "gzip, deflate, br"
+    except ImportError:
+        ACCEPT_ENCODING = "gzip, deflate"
+
+_session = None
+_check_session = None
+_session_lock = threading.Lock()
+
+
+class CappedRetry(Retry):
+    """Retry that honours Retry-After, but never waits longer than BACKOFF_MAX."""
+
+    def get_retry_after(self, response):
+        retry_after = super().get_retry_after(response)
+        return None if retry_after is None else min(retry_after, BACKOFF_MAX)
+
+
+def _fetch_retry():
+    return CappedRetry(
+        total=MAX_RETRIES,
+        connect=MAX_RETRIES,
+        read=MAX_RETRIES,
+        status=MAX_RETRIES,
+        backoff_factor=BACKOFF_FACTOR,
+        status_forcelist=RETRY_STATUSES,
+        allowed_methods=frozenset({"GET", "HEAD"}),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+
+
+def _check_retry():
+    return Retry(
+        total=CHECK_RETRIES,
+        status=0,
+        backoff_factor=0,
+        status_forcelist=(),
+        allowed_methods=frozenset({"GET", "HEAD"}),
+        respect_retry_after_header=False,
+        raise_on_status=False,
+    )
+
+
+def _build_session(retry):
+    adapter = HTTPAdapter(
+        pool_connections=POOL_HOSTS,
+        pool_maxsize=POOL_PER_HOST,
+        pool_block=True,
+        max_retries=retry,
+    )
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({
+        "Accept-Encoding": ACCEPT_ENCODING,
+        "Connection": "keep-alive",
+    })
+    return session
+
+
+def get_session():
+    """Return the process-wide pooled session, creating it on first use."""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = _build_session(_fetch_retry())
+    return _session
+
+
+def get_check_session():
+    """Return the pooled session for link-liveness checks (no backoff, no 429/5xx retries)."""
+    global _check_session
+    if _check_session is None:
+        with _session_lock:
+            if _check_session is None:
+                _check_session = _build_session(_check_retry())
+    return _check_session
+
+
+def get(url, headers=None, timeout=REQUEST_TIMEOUT, **kwargs):
+    """GET through the shared session (retries and pooling included)."""
+    return get_session().get(url, headers=headers, timeout=timeout, **kwargs)
+
+
+def head(url, headers=None, timeout=REQUEST_TIMEOUT, **kwargs):
+    """HEAD through the shared session (retries and pooling included)."""
+    return get_session().head(url, headers=headers, timeout=timeout, **kwargs)
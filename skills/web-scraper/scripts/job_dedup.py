@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""Near-duplicate detection for job listings (SimHash + LSH banding).
+
+The same role often shows up on several boards with slightly different
+titles ("Sr." vs "Senior", "(m/w/d)", a company suffix). Each job gets a
+64-bit SimHash over its normalized title, company and location; jobs whose
+signatures differ in at most MAX_HAMMING bits are the same posting. Candidate
+pairs come from LSH banding (BANDS x 16-bit bands — with MAX_HAMMING < BANDS
+any two such signatures share at least one band exactly), so clustering stays
+near-linear in the number of jobs. Bands interleave the signature's bits, so
+every band carries title bits: jobs without a company or location (RSS and
+generic boards) would otherwise all share one all-zero band.
+
+Signatures are also kept in memory/job-signatures.json across days, so a
+posting seen before is annotated with its original `first_seen` date and
+`repost: true`.
+"""
+
+import hashlib
+import json
+import os
+import re
+import sys
+import unicodedata
+from datetime import date, timedelta
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.abspath(os.path.join(SCRIPT_DIR, "..", "..", ".."))
+
+SIGNATURES_PATH = os.path.join(PROJECT_ROOT, "memory", "job-signatures.json")
+SIGNATURE_RETENTION_DAYS = 90
+
+BITS = 64  # TITLE_BITS + COMPANY_BITS + LOCATION_BITS
+BANDS = 4
+BAND_BITS = BITS // BANDS
+MAX_HAMMING = 3  # must stay below BANDS for the banding guarantee
+
+# The signature concatenates a SimHash per field, so a one-word company name
+# is not drowned out by a long title: the same title at two employers differs
+# in about half of the company bits and never collapses.
+TITLE_BITS = 40     # title words (weight 2) and word bigrams (weight 1)
+COMPANY_BITS = 16
+LOCATION_BITS = 8
+
+TITLE_ABBREVIATIONS = {
+    "sr": "senior", "snr": "senior", "jr": "junior", "jnr": "junior",
+    "mgr": "manager", "eng": "engineer", "engr": "engineer",
+    "dev": "developer", "mgmt": "management", "assoc": "associate",
+    "dir": "director", "vp": "vice president", "ml": "machine learning",
+}
+# Gender / workload boilerplate that boards append to titles.
+TITLE_NOISE_RE = re.compile(
+    r"\(?\b(?:m|w|f|d|x|h)\s*/\s*(?:m|w|f|d|x|h)(?:\s*/\s*(?:m|w|f|d|x|h))?\b\)?"
+    r"|\b\d{2,3}\s*(?:-|–)?\s*(?:\d{2,3})?\s*%"
+    r"|\ball genders\b"
+)
+COMPANY_SUFFIXES = {
+    "ag", "gmbh", "sa", "sarl", "ltd", "limited", "inc", "llc", "corp",
+    "corporation", "co", "plc", "bv", "nv", "se", "kg", "holding", "holdings",
+}
+LOCATION_NOISE = {"switzerland", "schweiz", "suisse", "ch", "canton", "kanton"}
+
+
+def _fold(text):
+    """Lowercase and strip accents ("Zürich" -> "zurich")."""
+    text = unicodedata.normalize("NFKD", str(text or "").lower())
+    return "".join(c for c in text if not unicodedata.combining(c))
+
+
+def _tokens(text):
+    return re.findall(r"[a-z0-9+#]+", text)
+
+
+def normalize_title(title):
+    text = TITLE_NOISE_RE.sub(" ", _fold(title))
+    words = []
+    for tok in _tokens(text):
+        words.extend(TITLE_ABBREVIATIONS.get(tok, tok).split())
+    return words
+
+
+def normalize_company(company):
+    return [t for t in _tokens(_fold(company)) if t not in COMPANY_SUFFIXES]
+
+
+def normalize_location(location):
+    return [t for t in _tokens(_fold(location)) if t not in LOCATION_NOISE]
+
+
+def _hash64(feature):
+    return int.from_bytes(hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+def _simhash(features, bits):
+    """`bits`-wide SimHash of {feature: weight}; 0 when there are no features."""
+    acc = [0] * bits
+    for feature, weight in features.items():
+        h = _hash64(feature)
+        for bit in range(bits):
+            acc[bit] += weight if (h >> bit) & 1 else -weight
+    sig = 0
+    for bit in range(bits):
+        if acc[bit] > 0:
+            sig |= 1 << bit
+    return sig
+
+
+def simhash(job):
+    """64-bit signature: title, company and location SimHashes side by side."""
+    title = normalize_title(job.get("title", ""))
+    title_feats = dict.fromkeys(title, 2)
+    for a, b in zip(title, title[1:]):
+        title_feats[f"{a} {b}"] = 1
+    company = dict.fromkeys(normalize_company(job.get("company", "")), 1)
+    location = dict.fromkeys(normalize_location(job.get("location", "")), 1)
+    return (_simhash(title_feats, TITLE_BITS)
+            | _simhash(company, COMPANY_BITS) << TITLE_BITS
+            | _simhash(location, LOCATION_BITS) << (TITLE_BITS + COMPANY_BITS))
+
+
+def _bands(sig):
+    """(band number, band value) pairs; band i holds bits i, i + BANDS, i + 2*BANDS, ..."""
+    bands = []
+    for i in range(BANDS):
+        value = 0
+        for k in range(BAND_BITS):
+            value |= ((sig >> (i + k * BANDS)) & 1) << k
+        bands.append((i, value))
+    return bands
+
+
+def hamming(a, b):
+    return bin(a ^ b).count("1")
+
+
+class _BandIndex:
+    """LSH buckets: (band number, band value) -> ids sharing that band."""
+
+    def __init__(self):
+        self._buckets = {}
+
+    def add(self, key, sig):
+        for band in _bands(sig):
+            self._buckets.setdefault(band, []).append(key)
+
+    def candidates(self, sig):
+        seen = set()
+        for band in _bands(sig):
+            for key in self._buckets.get(band, ()):
+                if key not in seen:
+                    seen.add(key)
+                    yield key
+
+
+def cluster_jobs(jobs):
+    """Collapse near-duplicate jobs, keeping the highest match_score per cluster.
+
+    Returns (kept_jobs, signatures) where signatures[i] belongs to kept_jobs[i].
+    Input order is preserved for the kept jobs.
+    """
+    sigs = [simhash(j) for j in jobs]
+    parent = list(range(len(jobs)))
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    index = _BandIndex()
+    for i, sig in enumerate(sigs):
+        for j in index.candidates(sig):
+            if hamming(sig, sigs[j]) <= MAX_HAMMING:
+                ri, rj = find(i), find(j)
+                if ri != rj:
+                    parent[ri] = rj
+        index.add(i, sig)
+
+    best = {}
+    for i, job in enumerate(jobs):
+        root = find(i)
+        if root not in best or job.get("match_score", 0) > jobs[best[root]].get("match_score", 0):
+            best[root] = i
+    keep = sorted(best.values())
+    return [jobs[i] for i in keep], [sigs[i] for i in keep]
+
+
+class SignatureStore:
+    """Signatures of jobs seen on earlier days: hex signature -> {first_seen, last_seen, title}."""
+
+    def __init__(self, path=SIGNATURES_PATH):
+        self.path = path
+        self._entries = {}
+        if os.path.exists(path):
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                if isinstance(data, dict):
+                    self._entries = data
+            except (json.JSONDecodeError, OSError):
+                pass
+        self._index = _BandIndex()
+        for key in self._entries:
+            self._index.add(key, int(key, 16))
+
+    def match(self, sig):
+        """Stored key of the nearest signature within MAX_HAMMING bits, or None."""
+        best, best_dist = None, MAX_HAMMING + 1
+        for key in self._index.candidates(sig):
+            dist = hamming(sig, int(key, 16))
+            if dist < best_dist:
+                best, best_dist = key, dist
+        return best
+
+    def observe(self, job, sig, today):
+        """Annotate `job` with first_seen/repost and record today's sighting."""
+        key = self.match(sig)
+        if key is None:
+            key = f"{sig:016x}"
+            self._entries[key] = {"first_seen": today, "last_seen": today,
+                                  "title": job.get("title", "")}
+            self._index.add(key, sig)
+        entry = self._entries[key]
+        entry["last_seen"] = today
+        job["first_seen"] = entry["first_seen"]
+        job["repost"] = entry["first_seen"] < today
+
+    def save(self, today):
+        """Persist atomically, dropping signatures not seen within the retention window."""
+        cutoff = (date.fromisoformat(today) - timedelta(days=SIGNATURE_RETENTION_DAYS)).isoformat()
+        entries = {k: e for k, e in self._entries.items() if e.get("last_seen", "") >= cutoff}
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp = self.path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(entries, f, sort_keys=True)
+        os.replace(tmp, self.path)
+
+
+def dedupe_jobs(jobs, signatures_path=SIGNATURES_PATH, today=None):
+    """Drop near-duplicate jobs and mark reposts; `signatures_path=None` skips history."""
+    kept, sigs = cluster_jobs(jobs)
+    print(f"Near-duplicate filter: {len(jobs)} -> {len(kept)} jobs")
+    if signatures_path:
+        today = today or date.today().isoformat()
+        store = SignatureStore(signatures_path)
+        for job, sig in zip(kept, sigs):
+            store.observe(job, sig, today)
+        try:
+            store.save(today)
+        except OSError as e:
+            print(f"WARNING: could not write job signatures {signatures_path}: {e}", file=sys.stderr)
+    return kept
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""Link-liveness checks with a persistent verdict cache.
+
+Job postings are re-listed day after day, so verdicts are cached on disk per
+URL with a TTL: a live link is trusted for LIVE_TTL_DAYS, a dead one for
+DEAD_TTL_DAYS. Only definitive answers are cached — timeouts, connection
+errors and 429/5xx replies are re-checked on the next run.
+
+Uncached URLs are checked concurrently, with at most PER_HOST_LIMIT requests
+in flight per host and hosts served round-robin, so one large board (e.g.
+LinkedIn) cannot monopolise the workers.
+"""
+
+import json
+import os
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from urllib.parse import urlsplit
+
+import http_client
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.abspath(os.path.join(SCRIPT_DIR, "..", "..", ".."))
+
+LINK_CACHE_PATH = os.path.join(PROJECT_ROOT, "memory", "link-cache.json")
+LIVE_TTL_DAYS = 3   # postings close; re-check live links every few days
+DEAD_TTL_DAYS = 7   # 404/410 postings rarely come back
+
+MAX_WORKERS = 24
+PER_HOST_LIMIT = 4  # stays under http_client.POOL_PER_HOST
+
+HEAD_TIMEOUT = 10
+GET_TIMEOUT = 15
+
+# Statuses that say nothing about the posting itself; never cached.
+TRANSIENT_STATUSES = {408, 425, 429, 500, 502, 503, 504}
+
+
+class LinkCache:
+    """On-disk map of URL -> {live, status, checked_at}.
+
+    Loaded once per run, shared by the checker threads and written back once
+    with save(). A missing or corrupt file simply starts an empty cache.
+    """
+
+    def __init__(self, path=LINK_CACHE_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self._entries = {}
+        if os.path.exists(path):
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                if isinstance(data, dict):
+                    self._entries = data
+            except (json.JSONDecodeError, OSError):
+                pass
+
+    @staticmethod
+    def _fresh(entry, now):
+        ttl = LIVE_TTL_DAYS if entry.get("live") else DEAD_TTL_DAYS
+        try:
+            checked = datetime.fromisoformat(entry["checked_at"])
+        except (KeyError, TypeError, ValueError):
+            return False
+        return now - checked < timedelta(days=ttl)
+
+    def get(self, url, now=None):
+        """Cached verdict (True/False) for `url`, or None if missing or expired."""
+        now = now or datetime.now(timezone.utc)
+        with self._lock:
+            entry = self._entries.get(url)
+        if entry is None or not self._fresh(entry, now):
+            return None
+        return bool(entry.get("live"))
+
+    def put(self, url, live, status):
+        with self._lock:
+            self._entries[url] = {
+                "live": live,
+                "status": status,
+                "checked_at": datetime.now(timezone.utc).isoformat(),
+            }
+
+    def save(self):
+        """Persist the cache atomically, dropping expired verdicts."""
+        now = datetime.now(timezone.utc)
+        with self._lock:
+            entries = {u: e for u, e in self._entries.items() if self._fresh(e, now)}
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp = self.path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(entries, f)
+        os.replace(tmp, self.path)
+
+
+def check_url(url, headers=None):
+    """HTTP status for `url` (HEAD, falling back to a streamed GET); None on error.
+
+    Uses the check session: a rate-limited or failing host costs one quick
+    attempt here, not the fetchers' retry-with-backoff.
+    """
+    session = http_client.get_check_session()
+    try:
+        with session.head(url, headers=headers, timeout=HEAD_TIMEOUT,
+                              allow_redirects=True) as resp:
+            status = resp.status_code
+        # Some servers reject HEAD (405) or mishandle it — fall back to GET.
+        # Streamed and closed unread, so the pooled connection is released
+        # without downloading the body.
+        if status >= 400:
+            with session.get(url, headers=headers, timeout=GET_TIMEOUT,
+                                 allow_redirects=True, stream=True) as resp:
+                status = resp.status_code
+        return status
+    except Exception:
+        return None
+
+
+def is_link_live(url, headers=None):
+    """True only for http(s) URLs that resolve with an HTTP status < 400."""
+    if not url or not url.startswith("http"):
+        return False
+    status = check_url(url, headers)
+    return status is not None and status < 400
+
+
+def _host_lanes(urls, per_host):
+    """Split URLs into per-host lanes, ordered round-robin across hosts."""
+    by_host = {}
+    for url in urls:
+        by_host.setdefault(urlsplit(url).netloc.lower(), []).append(url)
+    lanes = []
+    for k in range(per_host):
+        for host_urls in by_host.values():
+            n = min(per_host, len(host_urls))
+            if k < n:
+                lanes.append(host_urls[k::n])
+    return lanes
+
+
+def check_links(urls, headers=None, cache=None, max_workers=MAX_WORKERS,
+                per_host=PER_HOST_LIMIT):
+    """Return {url: live} for every URL, using and updating `cache`.
+
+    Each host gets at most `per_host` lanes, each lane checking its URLs one
+    after another, so no host ever has more than `per_host` requests in flight.
+    """
+    verdicts = {}
+    pending = []
+    hits = 0
+    for url in dict.fromkeys(urls):
+        if not url or not url.startswith("http"):
+            verdicts[url] = False
+            continue
+        cached = cache.get(url) if cache is not None else None
+        if cached is None:
+            pending.append(url)
+        else:
+            verdicts[url] = cached
+            hits += 1
+
+    def run_lane(lane):
+        for url in lane:
+            status = check_url(url, headers)
+            live = status is not None and status < 400
+            verdicts[url] = live
+            if cache is not None and status is not None and status not in TRANSIENT_STATUSES:
+                cache.put(url, live, status)
+
+    if pending:
+        lanes = _host_lanes(pending, per_host)
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(lanes)))) as pool:
+            list(pool.map(run_lane, lanes))
+    print(f"  Link cache: {hits} cached, {len(pending)} checked")
+    return verdicts
+
+
+def filter_live(items, url_key="url", headers=None, cache_path=LINK_CACHE_PATH, **kwargs):
+    """Keep items whose `url_key` link is live; `cache_path=None` disables the cache."""
+    cache = LinkCache(cache_path) if cache_path else None
+    verdicts = check_links([it.get(url_key, "") for it in items], headers, cache, **kwargs)
+    if cache is not None:
+        try:
+            cache.save()
+        except OSError as e:
+            print(f"WARNING: could not write link cache {cache_path}: {e}", file=sys.stderr)
+    return [it for it in items if verdicts.get(it.get(url_key, ""), False)]
@@ -0,0 +1,436 @@
+#!/usr/bin/env python3
+"""Incremental (chunk-fed) parsing of large job-board and RSS responses.
+
+Instead of building a full BeautifulSoup tree for the whole page, these
+helpers feed the response to a pull parser chunk by chunk and yield each
+listing as soon as it is complete, so callers can stop reading once they have
+enough items. Only the listing elements themselves are kept in memory.
+
+- iter_xml_elements(): RSS/Atom items via an XML pull parser (lxml when
+  available, in recover mode; the stdlib parser otherwise).
+- iter_html_elements() / select_first_matching(): listing elements from HTML
+  via html.parser, returned as small `Node` trees that support the subset of
+  the BeautifulSoup API the scrapers use (select, select_one, find, get,
+  get_text). Optional end tags are implied as in an HTML parser (an unclosed
+  <li>, <p>, <td>, ... ends at the next sibling), so boards that omit them
+  still yield one element per listing.
+
+`source` may be a str/bytes document or an iterable of chunks, e.g.
+iter_response_text(resp) for a streamed `requests` response.
+"""
+
+import codecs
+import re
+import sys
+from collections import deque
+from html.parser import HTMLParser
+
+import xml.etree.ElementTree as _stdlib_etree
+
+try:
+    from lxml import etree as _lxml_etree
+    _XML_ERRORS = (_stdlib_etree.ParseError, _lxml_etree.XMLSyntaxError)
+except ImportError:
+    _lxml_etree = None
+    _XML_ERRORS = (_stdlib_etree.ParseError,)
+
+CHUNK_SIZE = 64 * 1024
+
+VOID_ELEMENTS = {
+    "area", "base", "br", "col", "embed", "hr", "img", "input", "link",
+    "meta", "param", "source", "track", "wbr",
+}
+NON_TEXT_ELEMENTS = {"script", "style", "template"}  # skipped by get_text()
+
+# Optional end tags (the HTML spec's implied end tags): a start tag closes the
+# nearest open element in `closes`, unless one of `stops` is open inside it.
+IMPLIED_END_TAGS = {
+    "li": ({"li"}, {"ul", "ol", "menu"}),
+    "dt": ({"dt", "dd"}, {"dl"}),
+    "dd": ({"dt", "dd"}, {"dl"}),
+    "tr": ({"tr"}, {"table", "thead", "tbody", "tfoot"}),
+    "td": ({"td", "th"}, {"tr", "table"}),
+    "th": ({"td", "th"}, {"tr", "table"}),
+    "thead": ({"thead", "tbody", "tfoot"}, {"table"}),
+    "tbody": ({"thead", "tbody", "tfoot"}, {"table"}),
+    "tfoot": ({"thead", "tbody", "tfoot"}, {"table"}),
+    "option": ({"option"}, {"select", "datalist", "optgroup"}),
+    "optgroup": ({"optgroup", "option"}, {"select"}),
+}
+# Start tags that close an open <p> (unless a scope boundary is open inside it).
+CLOSES_P = {
+    "address", "article", "aside", "blockquote", "center", "details", "dialog",
+    "dir", "div", "dl", "dd", "dt", "fieldset", "figcaption", "figure", "footer",
+    "form", "h1", "h2", "h3", "h4", "h5", "h6", "header", "hgroup", "hr", "li",
+    "main", "menu", "nav", "ol", "p", "pre", "section", "summary", "table", "ul",
+}
+P_SCOPE_STOPS = {"button", "table", "td", "th", "caption", "template", "object",
+                 "applet", "marquee", "html"}
+
+
+def iter_response_text(resp, chunk_size=CHUNK_SIZE):
+    """Yield a streamed response body as text, decoded with the response charset."""
+    try:
+        decoder = codecs.getincrementaldecoder(resp.encoding or "utf-8")(errors="replace")
+    except LookupError:
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    for chunk in resp.iter_content(chunk_size):
+        text = decoder.decode(chunk)
+        if text:
+            yield text
+    tail = decoder.decode(b"", final=True)
+    if tail:
+        yield tail
+
+
+def iter_response_bytes(resp, chunk_size=CHUNK_SIZE):
+    """Yield a streamed response body as raw bytes (XML declares its own encoding)."""
+    for chunk in resp.iter_content(chunk_size):
+        if chunk:
+            yield chunk
+
+
+def _chunks(source):
+    if isinstance(source, (str, bytes)):
+        return (source,)
+    return source
+
+
+# ---------------------------------------------------------------------------
+# XML
+# ---------------------------------------------------------------------------
+
+def local_name(tag):
+    """Element tag without its `{namespace}` prefix."""
+    return tag.rsplit("}", 1)[-1] if isinstance(tag, str) else ""
+
+
+def element_text(elem):
+    """All text inside an element (including CDATA), stripped."""
+    return "".join(elem.itertext()).strip()
+
+
+def child_text(elem, name):
+    """Stripped text of the first descendant named `name` (any namespace), or ""."""
+    for child in elem.iter():
+        if child is not elem and local_name(child.tag) == name:
+            return element_text(child)
+    return ""
+
+
+def iter_xml_elements(source, name="item"):
+    """Yield each `<name>` element of an XML document as soon as it is closed.
+
+    Yielded elements are cleared once the caller moves on, so read what you
+    need before advancing the iterator.
+    """
+    if _lxml_etree is not None:
+        parser = _lxml_etree.XMLPullParser(events=("end",), recover=True,
+                                           resolve_entities=False)
+    else:
+        parser = _stdlib_etree.XMLPullParser(events=("end",))
+
+    def ready():
+        for _, elem in parser.read_events():
+            if local_name(elem.tag) != name:
+                continue
+            yield elem
+            elem.clear()
+            if _lxml_etree is not None:
+                # Drop already-processed siblings so memory stays flat.
+                while elem.getprevious() is not None:
+                    del elem.getparent()[0]
+
+    try:
+        for chunk in _chunks(source):
+            if isinstance(chunk, str):
+                chunk = chunk.encode("utf-8")
+            parser.feed(chunk)
+            yield from ready()
+        parser.close()
+        yield from ready()
+    except _XML_ERRORS as e:
+        # Malformed or truncated document: keep the items already yielded.
+        print(f"WARNING: XML parse stopped early: {e}", file=sys.stderr)
+
+
+# ---------------------------------------------------------------------------
+# HTML
+# ---------------------------------------------------------------------------
+
+_COMPOUND_RE = re.compile(
+    r"(?P<tag>[a-zA-Z][\w-]*|\*)?"
+    r"(?P<rest>(?:\.[\w-]+|#[\w-]+|\[[^\]]+\])*)$"
+)
+_PART_RE = re.compile(r"\.([\w-]+)|#([\w-]+)|\[\s*([\w-]+)\s*(?:=\s*[\"']?([^\"'\]]*)[\"']?\s*)?\]")
+
+
+def _parse_compound(text):
+    """Parse `tag.cls#id[attr=value]` into (tag, classes, id, attrs)."""
+    m = _COMPOUND_RE.match(text)
+    if not m or not text:
+        raise ValueError(f"unsupported selector: {text!r}")
+    tag = m.group("tag")
+    classes, elem_id, attrs = set(), None, []
+    for cls, id_, attr, value in _PART_RE.findall(m.group("rest")):
+        if cls:
+            classes.add(cls)
+        elif id_:
+            elem_id = id_
+        else:
+            attrs.append((attr.lower(), value if value != "" else None))
+    return (None if tag in (None, "*") else tag.lower(), classes, elem_id, attrs)
+
+
+def _parse_selector(selector):
+    """Parse a comma group of descendant selectors into lists of compounds."""
+    groups = []
+    for part in selector.split(","):
+        if any(c in part for c in ">+~:"):
+            raise ValueError(f"unsupported selector: {selector!r}")
+        compounds = [_parse_compound(c) for c in part.split()]
+        if not compounds:
+            raise ValueError(f"empty selector: {selector!r}")
+        groups.append(compounds)
+    return groups
+
+
+def _compound_matches(node, compound):
+    tag, classes, elem_id, attrs = compound
+    if tag is not None and node.name != tag:
+        return False
+    if classes and not classes.issubset(node.attrs.get("class", "").split()):
+        return False
+    if elem_id is not None and node.attrs.get("id") != elem_id:
+        return False
+    for attr, value in attrs:
+        if attr not in node.attrs:
+            return False
+        if value is not None and node.attrs[attr] != value:
+            return False
+    return True
+
+
+def _chain_matches(node, compounds):
+    if not _compound_matches(node, compounds[-1]):
+        return False
+    ancestor = node.parent
+    for compound in reversed(compounds[:-1]):
+        while ancestor is not None and not _compound_matches(ancestor, compound):
+            ancestor = ancestor.parent
+        if ancestor is None:
+            return False
+        ancestor = ancestor.parent
+    return True
+
+
+class Node:
+    """A parsed HTML element with a small BeautifulSoup-compatible API."""
+
+    __slots__ = ("name", "attrs", "children", "parent")
+
+    def __init__(self, name, attrs, parent=None):
+        self.name = name
+        self.attrs = attrs
+        self.children = []
+        self.parent = parent
+
+    def get(self, key, default=None):
+        return self.attrs.get(key, default)
+
+    def descendants(self):
+        """Descendant elements in document order."""
+        stack = [c for c in reversed(self.children) if isinstance(c, Node)]
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend(c for c in reversed(node.children) if isinstance(c, Node))
+
+    def find(self, name):
+        """First descendant whose tag is `name` (or in the list `name`)."""
+        names = {name} if isinstance(name, str) else set(name)
+        for node in self.descendants():
+            if node.name in names:
+                return node
+        return None
+
+    def select(self, selector):
+        groups = _parse_selector(selector)
+        return [n for n in self.descendants()
+                if any(_chain_matches(n, g) for g in groups)]
+
+    def select_one(self, selector):
+        groups = _parse_selector(selector)
+        for node in self.descendants():
+            if any(_chain_matches(node, g) for g in groups):
+                return node
+        return None
+
+    def _strings(self):
+        stack = list(reversed(self.children))
+        while stack:
+            child = stack.pop()
+            if isinstance(child, str):
+                yield child
+            elif child.name not in NON_TEXT_ELEMENTS:
+                stack.extend(reversed(child.children))
+
+    def get_text(self, separator="", strip=False):
+        strings = self._strings()
+        if strip:
+            strings = (s.strip() for s in strings)
+            strings = (s for s in strings if s)
+        return separator.join(strings)
+
+
+class _Scanner(HTMLParser):
+    """Builds Node trees only for elements matching one of `selectors`.
+
+    Each selector must be a single compound (`li`, `article.listing-item`,
+    `[data-job]`). Completed matches are queued in document (start-tag)
+    order; at most `limit` matches are kept per selector.
+    """
+
+    def __init__(self, selectors, limit=None):
+        super().__init__(convert_charrefs=True)
+        self._compounds = []
+        for sel in selectors:
+            groups = _parse_selector(sel)
+            if len(groups) != 1 or len(groups[0]) != 1:
+                raise ValueError(f"record selector must be a single compound: {sel!r}")
+            self._compounds.append(groups[0][0])
+        self._limit = limit
+        self._counts = [0] * len(selectors)
+        self._stack = []         # open elements: Node while capturing, else tag name
+        self._records = deque()  # [node, selector indices, closed] in start order
+        self._open_records = {}  # id(node) -> its record, until the node closes
+
+    def _open_node(self):
+        return self._stack[-1] if self._stack and isinstance(self._stack[-1], Node) else None
+
+    def _entry_name(self, pos):
+        entry = self._stack[pos]
+        return entry.name if isinstance(entry, Node) else entry
+
+    def _close_from(self, pos):
+        """Close the open element at stack position `pos` and everything inside it."""
+        for closed in self._stack[pos:]:
+            if isinstance(closed, Node):
+                self._close(closed)
+        del self._stack[pos:]
+
+    def _imply_end(self, closes, stops):
+        for pos in range(len(self._stack) - 1, -1, -1):
+            name = self._entry_name(pos)
+            if name in closes:
+                self._close_from(pos)
+                return
+            if name in stops:
+                return
+
+    def handle_starttag(self, tag, attrs):
+        if tag in CLOSES_P:
+            self._imply_end({"p"}, P_SCOPE_STOPS)
+        if tag in IMPLIED_END_TAGS:
+            self._imply_end(*IMPLIED_END_TAGS[tag])
+        parent = self._open_node()
+        attr_map = {k: (v if v is not None else "") for k, v in attrs}
+        probe = Node(tag, attr_map, parent)
+        hits = [i for i, c in enumerate(self._compounds)
+                if (self._limit is None or self._counts[i] < self._limit)
+                and _compound_matches(probe, c)]
+        node = None
+        if hits or parent is not None:
+            node = probe
+            if parent is not None:
+                parent.children.append(node)
+            if hits:
+                for i in hits:
+                    self._counts[i] += 1
+                record = [node, hits, False]
+                self._records.append(record)
+                self._open_records[id(node)] = record
+        if tag in VOID_ELEMENTS:
+            if node is not None and hits:
+                self._close(node)
+            return
+        self._stack.append(node if node is not None else tag)
+
+    def handle_endtag(self, tag):
+        for pos in range(len(self._stack) - 1, -1, -1):
+            if self._entry_name(pos) == tag:
+                self._close_from(pos)
+                return
+        # Stray end tag with no matching open element: ignored.
+
+    def handle_data(self, data):
+        node = self._open_node()
+        if node is None:
+            return
+        # Text split across feed() chunks arrives in pieces; keep it as one
+        # string so get_text(strip=True) strips it like a single text node.
+        if node.children and isinstance(node.children[-1], str):
+            node.children[-1] += data
+        else:
+            node.children.append(data)
+
+    def _close(self, node):
+        record = self._open_records.pop(id(node), None)
+        if record is not None:
+            record[2] = True
+
+    def finish(self):
+        """Close everything still open at end of input."""
+        self.close()
+        for record in self._records:
+            record[2] = True
+        self._open_records.clear()
+        self._stack.clear()
+
+    def drain(self):
+        """Yield (selector index, node) for completed matches, in document order."""
+        while self._records and self._records[0][2]:
+            node, hits, _ = self._records.popleft()
+            for i in hits:
+                yield i, node
+
+
+def _text_chunks(source):
+    for chunk in _chunks(source):
+        yield chunk.decode("utf-8", errors="replace") if isinstance(chunk, bytes) else chunk
+
+
+def iter_html_elements(source, selector):
+    """Yield each element matching the compound `selector`, as soon as it closes."""
+    scanner = _Scanner([selector])
+    for chunk in _text_chunks(source):
+        scanner.feed(chunk)
+        for _, node in scanner.drain():
+            yield node
+    scanner.finish()
+    for _, node in scanner.drain():
+        yield node
+
+
+def select_first_matching(source, selectors, limit):
+    """Elements for the first selector (in priority order) that matches anything.
+
+    Equivalent to trying `soup.select(sel)[:limit]` for each selector in turn,
+    in one pass. Reading stops early once the top-priority selector already
+    has `limit` matches, since no later match can change the result.
+    """
+    scanner = _Scanner(selectors, limit=limit)
+    found = [[] for _ in selectors]
+    for chunk in _text_chunks(source):
+        scanner.feed(chunk)
+        for i, node in scanner.drain():
+            found[i].append(node)
+        if len(found[0]) >= limit:
+            return found[0][:limit]
+    scanner.finish()
+    for i, node in scanner.drain():
+        found[i].append(node)
+    for nodes in found:
+        if nodes:
+            return nodes[:limit]
+    return []
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""Precompiled whole-word term matching for relevance scoring.
+
+`TermMatcher` compiles a term list once into a single regex (a character trie
+of all terms inside a zero-width lookahead), so finding every matching term is
+one pass over the text instead of one `re.search` per term. Matching follows
+the old per-term `_word_match` rule exactly: a term matches when
+`\\b<term>\\b` would match the (already lowercased) text.
+"""
+
+import re
+
+
+def normalize_term(term):
+    """Normalize a configured term the way matching expects (stripped, lowercase)."""
+    return str(term).strip().lower()
+
+
+def _trie_pattern(node):
+    """Regex for a trie node; longer continuations are tried before stopping."""
+    branches = [re.escape(ch) + _trie_pattern(child)
+                for ch, child in sorted(node.items()) if ch]
+    if not branches:
+        return ""
+    body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+    return f"(?:{body})?" if "" in node else body
+
+
+class TermMatcher:
+    """Match a fixed list of (optionally weighted) terms in one scan.
+
+    `terms` keeps its configured order and may contain duplicates; each entry
+    counts on its own in `count()` and `score()`, as the per-term loops did.
+    Empty terms never match. Texts passed in must already be lowercased.
+    """
+
+    def __init__(self, terms, weights=None):
+        terms = list(terms)
+        weights = [1] * len(terms) if weights is None else list(weights)
+        self.entries = [(term, normalize_term(term), weight)
+                        for term, weight in zip(terms, weights)]
+        distinct = sorted({norm for _, norm, _ in self.entries if norm})
+        self.terms = distinct  # column order for term_ids() / term_weights()
+        self._term_ids = {norm: i for i, norm in enumerate(distinct)}
+
+        trie = {}
+        for norm in distinct:
+            node = trie
+            for ch in norm:
+                node = node.setdefault(ch, {})
+            node[""] = True
+        self._pattern = (re.compile(r"(?=\b(" + _trie_pattern(trie) + r")\b)")
+                         if distinct else None)
+
+        # At a given position the trie regex reports only the longest matching
+        # term; any shorter term matching there is a prefix of it, so keep a
+        # precompiled check for each such prefix term.
+        tails = {norm: re.compile(re.escape(norm) + r"\b") for norm in distinct}
+        self._prefixes = {
+            norm: [(short, tails[short]) for short in distinct
+                   if short != norm and norm.startswith(short)]
+            for norm in distinct
+        }
+
+    def findall(self, text):
+        """Set of normalized terms that occur as whole words in `text`."""
+        found = set()
+        if self._pattern is None:
+            return found
+        for m in self._pattern.finditer(text):
+            term = m.group(1)
+            found.add(term)
+            pos = m.start()
+            for short, tail in self._prefixes[term]:
+                if short not in found and tail.match(text, pos):
+                    found.add(short)
+        return found
+
+    def term_ids(self, text):
+        """Column indices (into `self.terms`) of the distinct terms found in `text`."""
+        return [self._term_ids[norm] for norm in self.findall(text)]
+
+    def term_weights(self):
+        """Per-column weight: the summed weight of every entry with that term."""
+        weights = [0] * len(self.terms)
+        for _, norm, weight in self.entries:
+            if norm:
+                weights[self._term_ids[norm]] += weight
+        return weights
+
+    def search(self, text):
+        """True if any term occurs in `text` (stops at the first hit)."""
+        return self._pattern is not None and self._pattern.search(text) is not None
+
+    def first(self, text):
+        """First configured term (original spelling) found in `text`, or None."""
+        found = self.findall(text)
+        for term, norm, _ in self.entries:
+            if norm in found:
+                return term
+        return None
+
+    def count(self, text):
+        """Number of term entries found in `text`."""
+        found = self.findall(text)
+        return sum(1 for _, norm, _ in self.entries if norm in found)
+
+    def matches(self, text):
+        """(term, weight) for every entry found in `text`, in configured order."""
+        found = self.findall(text)
+        return [(term, weight) for term, norm, weight in self.entries if norm in found]
+
+    def score(self, text):
+        """Sum of the weights of every entry found in `text`."""
+        found = self.findall(text)
+        return sum(weight for _, norm, weight in self.entries if norm in found)
@@ -0,0 +1,78 @@
+"""Tests for the SQLite content store (run with: python -m pytest skills/web-scraper/tests)."""
+
+import json
+import os
+import sqlite3
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "scripts"))
+
+import content_store  # noqa: E402
+
+
+def test_events_sharing_a_page_url_are_kept_apart(tmp_path):
+    page = "https://example.org/events"
+    events = [
+        {"title": "Energy Summit", "date": "2026-05-01", "url": page, "source": page},
+        {"title": "AI Meetup", "date": "2026-05-03", "url": page, "source": page},
+    ]
+    path = str(tmp_path / "content.db")
+
+    assert content_store.save_items("events", events, path, "2026-04-20") == 2
+    loaded = content_store.load_content(path, "2026-04-20")["events"]
+    assert [e["title"] for e in loaded] == ["Energy Summit", "AI Meetup"]
+
+
+def test_articles_with_the_same_url_are_deduplicated(tmp_path):
+    url = "https://example.org/story"
+    articles = [{"title": "Story", "url": url}, {"title": "Story (updated)", "url": url}]
+    path = str(tmp_path / "content.db")
+
+    assert content_store.save_items("articles", articles, path, "2026-04-20") == 1
+
+
+def test_past_day_keeps_the_payload_it_was_saved_with(tmp_path):
+    path = str(tmp_path / "content.db")
+    url = "https://example.org/job/1"
+    content_store.save_items("jobs", [{"title": "Data Scientist", "url": url}], path, "2026-04-20")
+    content_store.save_items("jobs", [{"title": "Senior Data Scientist", "url": url}],
+                             path, "2026-04-21")
+
+    assert content_store.load_content(path, "2026-04-20")["jobs"] == [
+        {"title": "Data Scientist", "url": url, "first_seen": "2026-04-20"}]
+    assert content_store.load_content(path, "2026-04-21")["jobs"][0]["title"] == \
+        "Senior Data Scientist"
+
+
+def test_event_key_is_stored_apart_from_the_url(tmp_path):
+    path = str(tmp_path / "content.db")
+    page = "https://example.org/events"
+    content_store.save_items(
+        "events", [{"title": "AI Meetup", "date": "2026-05-03", "url": page}], path, "2026-04-20")
+
+    with content_store.ContentStore(path) as store:
+        row = store.conn.execute("SELECT item_key, url FROM events").fetchone()
+    assert row == (f"{page}|ai meetup|2026-05-03", page)
+
+
+def test_old_database_is_migrated(tmp_path):
+    path = str(tmp_path / "content.db")
+    key = "https://example.org/events|ai meetup|2026-05-03"
+    data = json.dumps({"title": "AI Meetup", "url": "https://example.org/events"})
+    conn = sqlite3.connect(path)
+    conn.executescript(
+        "CREATE TABLE events (url_hash TEXT PRIMARY KEY, url TEXT NOT NULL, data TEXT NOT NULL,"
+        " first_seen TEXT NOT NULL, last_seen TEXT NOT NULL);"
+        "CREATE TABLE snapshots (kind TEXT NOT NULL, day TEXT NOT NULL, rank INTEGER NOT NULL,"
+        " url_hash TEXT NOT NULL, PRIMARY KEY (kind, day, rank));")
+    conn.execute("INSERT INTO events VALUES (?, ?, ?, '2026-04-20', '2026-04-20')",
+                 (content_store.url_hash(key), key, data))
+    conn.execute("INSERT INTO snapshots VALUES ('events', '2026-04-20', 0, ?)",
+                 (content_store.url_hash(key),))
+    conn.commit()
+    conn.close()
+
+    with content_store.ContentStore(path) as store:
+        assert [e["title"] for e in store.load("events", "2026-04-20")] == ["AI Meetup"]
+        row = store.conn.execute("SELECT item_key, url FROM events").fetchone()
+    assert row == (key, "https://example.org/events")
@@ -0,0 +1,68 @@
+"""Tests for the retry policy of the pooled HTTP clients."""
+
+import os
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import pytest
+from urllib3.response import HTTPResponse
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "scripts"))
+
+import http_client  # noqa: E402
+
+
+def test_retry_after_is_capped():
+    retry = http_client._fetch_retry()
+    response = HTTPResponse(status=429, headers={"Retry-After": "3600"})
+    assert retry.get_retry_after(response) == http_client.BACKOFF_MAX
+    # urllib3 builds each next attempt's Retry with type(self)(...).
+    assert isinstance(retry.increment("GET", "/", response=response), http_client.CappedRetry)
+
+
+def test_short_retry_after_is_kept():
+    response = HTTPResponse(status=503, headers={"Retry-After": "2"})
+    assert http_client._fetch_retry().get_retry_after(response) == 2
+
+
+def test_session_sleeps_at_most_backoff_max(monkeypatch):
+    hits = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            hits.append(self.path)
+            if len(hits) == 1:
+                self.send_response(429)
+                self.send_header("Retry-After", "86400")
+            else:
+                self.send_response(200)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    server = HTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    sleeps = []
+    monkeypatch.setattr("urllib3.util.retry.time.sleep", sleeps.append)
+    try:
+        session = http_client._build_session(http_client._fetch_retry())
+        resp = session.get(f"http://127.0.0.1:{server.server_port}/", timeout=5)
+    finally:
+        server.shutdown()
+    assert resp.status_code == 200
+    assert sleeps == [http_client.BACKOFF_MAX]
+
+
+def test_async_retry_delay_is_capped():
+    pytest.importorskip("bs4")
+    pytest.importorskip("feedparser")
+    import async_fetch
+
+    class Resp:
+        headers = {"Retry-After": "86400"}
+
+    assert async_fetch._retry_delay(Resp(), 0) == http_client.BACKOFF_MAX
+    assert async_fetch._retry_delay(None, 10) == http_client.BACKOFF_MAX
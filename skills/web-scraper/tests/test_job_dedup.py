@@ -0,0 +1,59 @@
+"""Tests for near-duplicate job detection."""
+
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "scripts"))
+
+import job_dedup  # noqa: E402
+
+SENIORITY = ["", "Junior", "Senior", "Lead", "Principal", "Head of"]
+DOMAIN = ["Data", "AI", "Energy", "Grid", "Cloud", "Product", "Security", "Platform"]
+ROLE = ["Engineer", "Scientist", "Manager", "Analyst", "Architect", "Consultant"]
+
+
+def company_less_jobs(n, seed=0):
+    rng = random.Random(seed)
+    return [{
+        "title": f"{rng.choice(SENIORITY)} {rng.choice(DOMAIN)} {rng.choice(ROLE)} {i}".strip(),
+        "company": "", "location": "", "match_score": rng.random(),
+    } for i in range(n)]
+
+
+def test_company_less_jobs_spread_across_buckets():
+    index = job_dedup._BandIndex()
+    for i, job in enumerate(company_less_jobs(1000)):
+        index.add(i, job_dedup.simhash(job))
+    assert max(len(keys) for keys in index._buckets.values()) <= 50
+
+
+def test_company_less_jobs_compare_near_linearly():
+    index = job_dedup._BandIndex()
+    for i, job in enumerate(company_less_jobs(1000)):
+        index.add(i, job_dedup.simhash(job))
+    pairs = sum(len(keys) * (len(keys) - 1) // 2 for keys in index._buckets.values())
+    assert pairs < 20 * 1000  # all-pairs would be ~500k
+
+
+def test_reworded_duplicate_still_collapses():
+    jobs = [
+        {"title": "Sr. Data Scientist (m/w/d)", "company": "Swisscom AG",
+         "location": "Zürich, Switzerland", "match_score": 0.4},
+        {"title": "Senior Data Scientist", "company": "Swisscom",
+         "location": "Zurich", "match_score": 0.7},
+        {"title": "Senior Data Scientist", "company": "UBS",
+         "location": "Zurich", "match_score": 0.5},
+    ]
+    kept, _ = job_dedup.cluster_jobs(jobs)
+    assert [(j["company"], j["match_score"]) for j in kept] == [("Swisscom", 0.7), ("UBS", 0.5)]
+
+
+def test_band_guarantee_holds_for_interleaved_bands():
+    rng = random.Random(1)
+    for _ in range(200):
+        sig = rng.getrandbits(job_dedup.BITS)
+        flipped = sig
+        for bit in rng.sample(range(job_dedup.BITS), job_dedup.MAX_HAMMING):
+            flipped ^= 1 << bit
+        assert set(job_dedup._bands(sig)) & set(job_dedup._bands(flipped))
@@ -0,0 +1,259 @@
+"""Streaming parsers vs. the BeautifulSoup parsers they replaced, on saved pages.
+
+The reference functions below are the fetch_jobs.py parsers as they were
+before stream_parse.py, verbatim apart from the parser name being a
+parameter. Well-formed pages must give identical jobs with the streaming
+parsers, whether the page arrives whole or in small chunks. Pages that leave
+optional end tags out (<li>, <p>, <td> without their closing tag) are
+compared against BeautifulSoup on lxml's HTML parser, which implies those end
+tags the way browsers do; the old html.parser tree nested every unclosed
+listing inside the previous one.
+"""
+
+import os
+import re
+import sys
+from urllib.parse import urljoin
+
+import pytest
+
+bs4 = pytest.importorskip("bs4")
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "scripts"))
+
+import fetch_jobs  # noqa: E402
+from fetch_jobs import compute_match_score  # noqa: E402
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures")
+
+INTERESTS = {
+    "professional": [{"topic": "AI"}, {"topic": "energy"}, {"topic": "machine learning"}],
+    "job_search": {
+        "target_roles": ["product manager", "data scientist", "ai strategy", "program manager"],
+        "target_locations": ["Zürich", "Zurich", "Baden"],
+        "preferred_companies": ["Google", "Hitachi"],
+    },
+}
+
+
+def fixture(name):
+    with open(os.path.join(FIXTURES, name), encoding="utf-8") as f:
+        return f.read()
+
+
+def chunked(text, size=7):
+    return (text[i:i + size] for i in range(0, len(text), size))
+
+
+# ---------------------------------------------------------------------------
+# Reference: the BeautifulSoup parsers before streaming
+# ---------------------------------------------------------------------------
+
+def bs4_parse_datacareer(html, url, interests, parser="html.parser"):
+    soup = bs4.BeautifulSoup(html, parser)
+    jobs = []
+    for art in soup.select("article.listing-item"):
+        title_el = art.select_one(".listing-item__title a.link")
+        if not title_el:
+            continue
+        title = title_el.get_text(strip=True)
+        link = title_el.get("href", "")
+        if link and not link.startswith("http"):
+            link = urljoin(url, link)
+        company_el = art.select_one(".listing-item__info--item-company")
+        company = company_el.get_text(strip=True) if company_el else ""
+        location_el = art.select_one(".listing-item__info--item-location")
+        location = location_el.get_text(strip=True) if location_el else ""
+        text = f"{title} {company} {location}"
+        score, reasons = compute_match_score(title, text, interests, company=company)
+        jobs.append({
+            "title": title, "company": company, "location": location, "url": link,
+            "source": "datacareer.ch", "description": "",
+            "match_score": round(score, 2), "match_reasons": reasons,
+        })
+    return jobs
+
+
+def bs4_parse_linkedin(html, url, interests, parser="html.parser"):
+    soup = bs4.BeautifulSoup(html, parser)
+    jobs = []
+    for card in soup.select("li"):
+        title_el = card.select_one(".base-search-card__title")
+        if not title_el:
+            continue
+        title = title_el.get_text(strip=True)
+        link_el = card.select_one("a.base-card__full-link, a.base-search-card__full-link")
+        link = link_el.get("href", "").split("?")[0] if link_el else ""
+        company_el = card.select_one(".base-search-card__subtitle a, .base-search-card__subtitle")
+        company = company_el.get_text(strip=True) if company_el else ""
+        location_el = card.select_one(".job-search-card__location")
+        location = location_el.get_text(strip=True) if location_el else ""
+        text = f"{title} {company} {location}"
+        score, reasons = compute_match_score(title, text, interests, company=company)
+        jobs.append({
+            "title": title, "company": company, "location": location, "url": link,
+            "source": "LinkedIn", "description": "",
+            "match_score": round(score, 2), "match_reasons": reasons,
+        })
+    return jobs
+
+
+def bs4_parse_rss_jobs(xml, url, filter_keywords, interests):
+    soup = bs4.BeautifulSoup(xml, "xml")
+    jobs = []
+    for item in soup.find_all("item"):
+        title = item.find("title").get_text(strip=True) if item.find("title") else ""
+        link = item.find("link").get_text(strip=True) if item.find("link") else ""
+        desc = item.find("description").get_text(strip=True) if item.find("description") else ""
+        desc = re.sub(r"<[^>]+>", "", desc)
+        if not title:
+            continue
+        if filter_keywords:
+            combined_lower = f"{title} {desc}".lower()
+            if not any(kw.lower() in combined_lower for kw in filter_keywords):
+                continue
+        text = f"{title} {desc}"
+        score, reasons = compute_match_score(title, text, interests)
+        jobs.append({
+            "title": title, "company": "", "location": "", "url": link,
+            "source": "SwissDevJobs", "description": desc,
+            "match_score": round(score, 2), "match_reasons": reasons,
+        })
+    return jobs
+
+
+def bs4_parse_board_generic(html, url, search_terms, interests, parser="html.parser"):
+    soup = bs4.BeautifulSoup(html, parser)
+    jobs = []
+    for selector in [
+        ".listing-item", ".job-listing", ".job-card", ".posting",
+        "li.result", "article", "[data-job]",
+    ]:
+        elements = soup.select(selector)
+        if elements:
+            for el in elements[:20]:
+                title_el = el.find(["h2", "h3", "a", "h4"])
+                title = title_el.get_text(strip=True) if title_el else ""
+                link = ""
+                if title_el and title_el.name == "a":
+                    link = title_el.get("href", "")
+                elif title_el:
+                    a = title_el.find("a")
+                    if a:
+                        link = a.get("href", "")
+                if not title:
+                    continue
+                if link and not link.startswith("http"):
+                    link = urljoin(url, link)
+                text = el.get_text(" ", strip=True)
+                score, reasons = compute_match_score(title, text, interests)
+                jobs.append({
+                    "title": title, "company": "", "location": "", "url": link,
+                    "source": url, "description": "",
+                    "match_score": round(score, 2), "match_reasons": reasons,
+                })
+            break
+    return jobs
+
+
+# ---------------------------------------------------------------------------
+# Parity
+# ---------------------------------------------------------------------------
+
+DATACAREER_URL = "https://www.datacareer.ch/jobs/?q=ai"
+LINKEDIN_URL = "https://www.linkedin.com/jobs-guest/jobs/api/seeMoreJobPostings/search"
+BOARD_URL = "https://careers.example.com/jobs/"
+RSS_URL = "https://swissdevjobs.ch/rss"
+
+
+@pytest.mark.parametrize("feed", [str, chunked], ids=["whole", "chunked"])
+def test_datacareer_matches_bs4(feed):
+    html = fixture("datacareer.html")
+    expected = bs4_parse_datacareer(html, DATACAREER_URL, INTERESTS)
+    assert len(expected) == 4
+    assert fetch_jobs.parse_datacareer(feed(html), DATACAREER_URL, INTERESTS) == expected
+
+
+@pytest.mark.parametrize("feed", [str, chunked], ids=["whole", "chunked"])
+def test_linkedin_matches_bs4(feed):
+    html = fixture("linkedin.html")
+    expected = bs4_parse_linkedin(html, LINKEDIN_URL, INTERESTS)
+    assert len(expected) == 3
+    assert fetch_jobs.parse_linkedin(feed(html), LINKEDIN_URL, INTERESTS) == expected
+
+
+@pytest.mark.parametrize("feed", [str, chunked], ids=["whole", "chunked"])
+@pytest.mark.parametrize("keywords", [[], ["AI", "machine learning"]], ids=["all", "filtered"])
+def test_rss_jobs_match_bs4(feed, keywords):
+    pytest.importorskip("lxml")  # the reference parses with BeautifulSoup's "xml" (lxml) builder
+    xml = fixture("jobs_rss.xml")
+    expected = bs4_parse_rss_jobs(xml, RSS_URL, keywords, INTERESTS)
+    assert expected
+    source = feed(xml) if feed is str else (c.encode("utf-8") for c in chunked(xml))
+    assert fetch_jobs.parse_rss_jobs(source, RSS_URL, keywords, INTERESTS) == expected
+
+
+@pytest.mark.parametrize("name", ["generic_board.html", "generic_fallback.html"])
+@pytest.mark.parametrize("feed", [str, chunked], ids=["whole", "chunked"])
+def test_generic_board_matches_bs4(name, feed):
+    html = fixture(name)
+    expected = bs4_parse_board_generic(html, BOARD_URL, [], INTERESTS)
+    assert expected
+    assert fetch_jobs.parse_board_generic(feed(html), BOARD_URL, [], INTERESTS) == expected
+
+
+def test_max_items_stops_early():
+    html = fixture("datacareer.html")
+    expected = bs4_parse_datacareer(html, DATACAREER_URL, INTERESTS)[:2]
+    assert fetch_jobs.parse_datacareer(chunked(html), DATACAREER_URL, INTERESTS, 2) == expected
+
+
+# ---------------------------------------------------------------------------
+# Optional end tags
+# ---------------------------------------------------------------------------
+
+def test_unclosed_list_items_are_separate_listings():
+    pytest.importorskip("lxml")
+    html = fixture("linkedin_unclosed.html")
+    expected = bs4_parse_linkedin(html, LINKEDIN_URL, INTERESTS, parser="lxml")
+    assert [j["title"] for j in expected] == [
+        "AI Strategy Lead", "Product Owner Energy Trading", "Data Engineer"]
+    assert [j["company"] for j in expected] == ["Google", "Alpiq", "UBS"]
+    assert fetch_jobs.parse_linkedin(chunked(html), LINKEDIN_URL, INTERESTS) == expected
+
+
+@pytest.mark.parametrize("name", ["generic_unclosed_list.html", "generic_unclosed_table.html"])
+def test_unclosed_generic_listings_match_lxml(name):
+    pytest.importorskip("lxml")
+    html = fixture(name)
+    expected = bs4_parse_board_generic(html, BOARD_URL, [], INTERESTS, parser="lxml")
+    assert len(expected) > 1
+    assert fetch_jobs.parse_board_generic(chunked(html), BOARD_URL, [], INTERESTS) == expected
+
+
+# ---------------------------------------------------------------------------
+# Event pages (fetch_events.py still parses with BeautifulSoup; pinned here)
+# ---------------------------------------------------------------------------
+
+EVENTS_URL = "https://events.example.com/zurich"
+
+
+def test_event_page_prefers_jsonld():
+    import fetch_events
+
+    events = fetch_events.parse_event_page(fixture("events_jsonld.html"), EVENTS_URL)
+    assert [(e["title"], e["date"], e["location"], e["url"]) for e in events] == [
+        ("Energy AI Summit", "2026-05-12", "Kongresshaus Zürich",
+         "https://events.example.com/energy-ai-summit"),
+        ("Grid Tech Meetup", "2026-05-20", "Winterthur", EVENTS_URL),
+    ]
+
+
+def test_event_page_falls_back_to_html_cards():
+    import fetch_events
+
+    events = fetch_events.parse_event_page(fixture("events_html.html"), EVENTS_URL)
+    assert [(e["title"], e["date"], e["location"], e["url"]) for e in events] == [
+        ("AI Night Zürich", "2026-06-02", "Impact Hub", "https://events.example.com/e/ai-night"),
+        ("Energy Transition Forum", "2026-06-15", "Basel", "https://forum.example.org/register"),
+    ]
@@ -18,7 +18,7 @@ import sys
 import zipfile
 from pathlib import Path
 
-import defusedxml.minidom
+import lxml.etree
 
 from helpers.merge_runs import merge_runs as do_merge_runs
 from helpers.simplify_redlines import simplify_redlines as do_simplify_redlines
@@ -30,6 +30,10 @@ SMART_QUOTE_REPLACEMENTS = {
     "\u2019": "&#x2019;",  
 }
 
+# Entities are never expanded (or fetched): parts are rewritten as they are.
+_PARSER = lxml.etree.XMLParser(resolve_entities=False, no_network=True)
+_INDENT = "  "
+
 
 def unpack(
     input_file: str,
@@ -81,13 +85,38 @@ def unpack(
 
 def _pretty_print_xml(xml_file: Path) -> None:
     try:
-        content = xml_file.read_text(encoding="utf-8")
-        dom = defusedxml.minidom.parseString(content)
-        xml_file.write_bytes(dom.toprettyxml(indent="  ", encoding="utf-8"))
+        tree = lxml.etree.parse(str(xml_file), _PARSER)
+        root = tree.getroot()
+        _indent(root, "")
+
+        # Same layout as minidom's toprettyxml(indent="  "): every node on
+        # its own line, except that an element whose only child is one text
+        # node keeps it inline (so <w:t> text is never touched).
+        nodes = [*reversed(list(root.itersiblings(preceding=True))), root]
+        nodes += root.itersiblings()
+        with open(xml_file, "wb") as f:
+            f.write(b'<?xml version="1.0" encoding="utf-8"?>\n')
+            for node in nodes:
+                f.write(lxml.etree.tostring(node, encoding="utf-8", with_tail=False))
+                f.write(b"\n")
     except Exception:
         pass  
 
 
+def _indent(elem, indent: str) -> None:
+    children = list(elem)
+    if not children:
+        return
+    inner = indent + _INDENT
+    elem.text = "\n" + (f"{inner}{elem.text}\n" if elem.text else "") + inner
+    last = len(children) - 1
+    for i, child in enumerate(children):
+        if isinstance(child.tag, str):
+            _indent(child, inner)
+        tail = f"{inner}{child.tail}\n" if child.tail else ""
+        child.tail = "\n" + tail + (inner if i < last else indent)
+
+
 def _escape_smart_quotes(xml_file: Path) -> None:
     try:
         content = xml_file.read_text(encoding="utf-8")